@@ -0,0 +1,329 @@
+"""
+엔드포인트 부하 벤치마크 (로컬 가짜 OpenAI 서버 사용, 네트워크 호출 없음)
+
+가짜 OpenAI 서버(benchmarks/fake_openai.py)와 이 서버(uvicorn 워커 1개)를 띄운 뒤
+엔드포인트별로 동시 요청 수를 늘려가며 일정 시간 동안 요청을 보내고
+처리량, 응답 시간 p50/p95/p99, 서버 이벤트 루프 지연(/metrics의 event_loop_lag_seconds)을 출력합니다.
+
+--compare를 주면 저장된 기준값(--baseline)과 같은 (엔드포인트, 동시 요청 수)끼리 비교해
+처리량이 줄었거나 p95가 늘어난 정도가 --tolerance를 넘거나 기준값에 없는 측정이 있으면 종료 코드 1로 끝납니다.
+기준값 파일이 없으면 측정하기 전에 종료 코드 2로 끝납니다.
+기준값은 장비마다 다르므로 저장소에 넣지 않고 --save-baseline으로 각 장비에서 저장합니다.
+
+사용법:
+    python benchmarks/bench_endpoints.py
+    python benchmarks/bench_endpoints.py --concurrency 1,16,64 --duration 10 --latency 0.5
+    python benchmarks/bench_endpoints.py --endpoints chat_message,recommend --error-rate 0.05 --rate-limit-rate 0.02
+    python benchmarks/bench_endpoints.py --save-baseline
+    python benchmarks/bench_endpoints.py --compare
+"""
+import argparse
+import asyncio
+import json
+import os
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+from collections import Counter
+from typing import Any, Dict, List, Optional, Tuple
+
+import httpx
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DEFAULT_BASELINE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data", "endpoints_baseline.json")
+
+# 이름 -> (메서드, 경로, JSON 본문)
+ENDPOINTS: Dict[str, Tuple[str, str, Optional[Dict[str, Any]]]] = {
+    "chat_message": ("POST", "/api/chat/message", {"message": "오늘 업로드할 동영상 제목을 추천해줘", "max_tokens": 200}),
+    "chat_conversation": ("POST", "/api/chat/conversation", {
+        "messages": [
+            {"role": "user", "content": "게임 채널을 운영하고 있어요."},
+            {"role": "assistant", "content": "어떤 게임을 주로 다루시나요?"},
+            {"role": "user", "content": "주로 RPG요. 언제 올리면 좋을까요?"}
+        ],
+        "max_tokens": 200
+    }),
+    "recommend": ("GET", "/api/upload-time/recommend?content_type=gaming", None),
+    "weekly_recommend": ("GET", "/api/upload-time/weekly-recommend?content_type=gaming", None),
+    "upload_stats": ("GET", "/api/upload-time/stats", None),
+    "chat_stats": ("GET", "/api/chat/stats", None),
+    "server_stats": ("GET", "/api/stats", None),
+}
+
+
+def free_port() -> int:
+    """사용하지 않는 로컬 포트"""
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def percentile(sorted_values: List[float], q: float) -> float:
+    """정렬된 값의 q 백분위수 (nearest-rank)"""
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, max(0, int(round(q * len(sorted_values) + 0.5)) - 1))
+    return sorted_values[index]
+
+
+def parse_loop_lag(text: str) -> Dict[str, float]:
+    """/metrics 응답에서 이벤트 루프 지연 히스토그램 (구간 상한 -> 누적 개수, sum, count)"""
+    values: Dict[str, float] = {}
+    for line in text.splitlines():
+        if not line.startswith("event_loop_lag_seconds"):
+            continue
+        name, _, value = line.rpartition(" ")
+        if "_bucket" in name:
+            values[name.split('le="', 1)[1].rstrip('"}')] = float(value)
+        elif name.endswith("_sum"):
+            values["sum"] = float(value)
+        elif name.endswith("_count"):
+            values["count"] = float(value)
+    return values
+
+
+def loop_lag_summary(before: Dict[str, float], after: Dict[str, float]) -> Dict[str, Optional[float]]:
+    """두 시점 사이 이벤트 루프 지연 (평균, p99는 히스토그램 구간 상한)"""
+    count = after.get("count", 0) - before.get("count", 0)
+    if count <= 0:
+        return {"mean": None, "p99": None}
+    p99 = None
+    buckets = sorted((float(bound), cumulative) for bound, cumulative in after.items() if bound not in ("sum", "count"))
+    for bound, cumulative in buckets:
+        if cumulative - before.get(_format_bound(bound), 0) >= 0.99 * count:
+            p99 = bound
+            break
+    return {"mean": (after.get("sum", 0) - before.get("sum", 0)) / count, "p99": p99}
+
+
+def _format_bound(bound: float) -> str:
+    """/metrics의 le 레이블 형식"""
+    if bound == float("inf"):
+        return "+Inf"
+    return str(int(bound)) if bound.is_integer() else repr(bound)
+
+
+async def run_step(client: httpx.AsyncClient, endpoint: str, concurrency: int, duration: float) -> Dict[str, Any]:
+    """동시 요청 concurrency개로 duration초 동안 요청을 보내고 결과 집계"""
+    method, path, body = ENDPOINTS[endpoint]
+    latencies: List[float] = []
+    statuses: Counter = Counter()
+    deadline = time.perf_counter() + duration
+
+    async def worker():
+        while time.perf_counter() < deadline:
+            started = time.perf_counter()
+            try:
+                response = await client.request(method, path, json=body)
+                statuses[response.status_code] += 1
+            except httpx.HTTPError as error:
+                statuses[type(error).__name__] += 1
+                continue
+            latencies.append(time.perf_counter() - started)
+
+    lag_before = parse_loop_lag((await client.get("/metrics")).text)
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - started
+    lag = loop_lag_summary(lag_before, parse_loop_lag((await client.get("/metrics")).text))
+
+    latencies.sort()
+    succeeded = sum(count for status, count in statuses.items() if isinstance(status, int) and status < 400)
+    return {
+        "endpoint": endpoint,
+        "concurrency": concurrency,
+        "requests": sum(statuses.values()),
+        "errors": sum(statuses.values()) - succeeded,
+        "statuses": {str(status): count for status, count in statuses.items()},
+        "throughput": succeeded / elapsed,
+        "p50": percentile(latencies, 0.50),
+        "p95": percentile(latencies, 0.95),
+        "p99": percentile(latencies, 0.99),
+        "loopLagMean": lag["mean"],
+        "loopLagP99": lag["p99"]
+    }
+
+
+def _ms(value: Optional[float]) -> str:
+    return "-" if value is None else f"{value * 1000:.1f}"
+
+
+def print_result(result: Dict[str, Any]) -> None:
+    """결과 한 줄 출력"""
+    print(
+        f"{result['endpoint']:<18} {result['concurrency']:>5} {result['throughput']:>9.1f} "
+        f"{_ms(result['p50']):>9} {_ms(result['p95']):>9} {_ms(result['p99']):>9} "
+        f"{_ms(result['loopLagMean']):>9} {_ms(result['loopLagP99']):>9} {result['errors']:>7}"
+    )
+
+
+def compare(results: List[Dict[str, Any]], baseline: Dict[str, Any], tolerance: float) -> List[str]:
+    """기준값 대비 성능 저하 목록 (기준값에 없는 측정도 비교하지 못했으므로 포함)"""
+    previous = {f"{item['endpoint']}@{item['concurrency']}": item for item in baseline.get("results", [])}
+    regressions = []
+    for result in results:
+        key = f"{result['endpoint']}@{result['concurrency']}"
+        base = previous.get(key)
+        if base is None:
+            regressions.append(f"{key}: 기준값에 없는 측정입니다 (--save-baseline으로 다시 저장하세요)")
+            continue
+        if base["throughput"] > 0 and result["throughput"] < base["throughput"] * (1 - tolerance):
+            regressions.append(f"{key}: 처리량 {base['throughput']:.1f} -> {result['throughput']:.1f} req/s")
+        if base["p95"] > 0 and result["p95"] > base["p95"] * (1 + tolerance):
+            regressions.append(f"{key}: p95 {_ms(base['p95'])} -> {_ms(result['p95'])} ms")
+    return regressions
+
+
+def start_process(args: List[str], env: Dict[str, str]) -> subprocess.Popen:
+    """출력을 버리는 하위 프로세스 시작"""
+    return subprocess.Popen(args, cwd=ROOT, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+
+
+async def wait_ready(url: str, process: subprocess.Popen, timeout: float = 30.0) -> None:
+    """서버가 응답할 때까지 대기"""
+    deadline = time.monotonic() + timeout
+    async with httpx.AsyncClient() as client:
+        while time.monotonic() < deadline:
+            if process.poll() is not None:
+                raise RuntimeError(f"서버 프로세스가 종료되었습니다: {url}")
+            try:
+                await client.get(url)
+                return
+            except httpx.HTTPError:
+                await asyncio.sleep(0.1)
+    raise RuntimeError(f"서버가 {timeout}초 안에 시작되지 않았습니다: {url}")
+
+
+async def run(args: argparse.Namespace) -> List[Dict[str, Any]]:
+    """가짜 OpenAI 서버와 앱 서버를 띄우고 전체 스윕 실행"""
+    fake_port, app_port = free_port(), free_port()
+    cache_dir = tempfile.mkdtemp(prefix="bench-endpoints-")
+    env = {
+        **os.environ,
+        "OPENAI_API_KEY": "bench",
+        "OPENAI_BASE_URL": f"http://127.0.0.1:{fake_port}/v1",
+        "CACHE_DIR": cache_dir,
+        "CACHE_WARM_ENABLED": "False",
+        "ADMISSION_CONTROL_ENABLED": "True" if args.admission else "False",
+        "METRICS_LOOP_LAG_INTERVAL": "0.05",
+        "LOG_LEVEL": "WARNING",
+        "DEBUG": "False",
+    }
+    fake = start_process([
+        sys.executable, os.path.join(ROOT, "benchmarks", "fake_openai.py"),
+        "--port", str(fake_port),
+        "--latency", str(args.latency),
+        "--jitter", str(args.jitter),
+        "--token-interval", str(args.token_interval),
+        "--error-rate", str(args.error_rate),
+        "--rate-limit-rate", str(args.rate_limit_rate),
+        "--seed", "0"
+    ], env)
+    app = start_process([
+        sys.executable, "-m", "uvicorn", "main:app",
+        "--host", "127.0.0.1", "--port", str(app_port), "--log-level", "warning", "--no-access-log"
+    ], env)
+
+    results = []
+    try:
+        await wait_ready(f"http://127.0.0.1:{fake_port}/v1/models", fake)
+        await wait_ready(f"http://127.0.0.1:{app_port}/health", app)
+
+        limits = httpx.Limits(max_connections=max(args.concurrency) + 2, max_keepalive_connections=max(args.concurrency) + 2)
+        async with httpx.AsyncClient(base_url=f"http://127.0.0.1:{app_port}", timeout=120.0, limits=limits) as client:
+            print(f"가짜 OpenAI 지연 {args.latency}초 (±{args.jitter}), 토큰 간격 {args.token_interval}초, "
+                  f"500 {args.error_rate:.0%}, 429 {args.rate_limit_rate:.0%}, 단계별 {args.duration}초")
+            print(f"{'엔드포인트':<14} {'동시':>5} {'req/s':>9} {'p50(ms)':>9} {'p95(ms)':>9} {'p99(ms)':>9} "
+                  f"{'루프평균':>7} {'루프p99':>8} {'오류':>6}")
+            for endpoint in args.endpoints:
+                method, path, body = ENDPOINTS[endpoint]
+                # 첫 요청(캐시, 연결 풀, 모델 목록 준비)은 측정에서 제외
+                await client.request(method, path, json=body)
+                for concurrency in args.concurrency:
+                    result = await run_step(client, endpoint, concurrency, args.duration)
+                    print_result(result)
+                    results.append(result)
+    finally:
+        for process in (app, fake):
+            process.terminate()
+            try:
+                process.wait(timeout=10)
+            except subprocess.TimeoutExpired:
+                process.kill()
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="엔드포인트 부하 벤치마크")
+    parser.add_argument("--endpoints", default=",".join(ENDPOINTS), help=f"쉼표로 구분 ({', '.join(ENDPOINTS)})")
+    parser.add_argument("--concurrency", default="1,8,32", help="동시 요청 수 목록 (쉼표로 구분)")
+    parser.add_argument("--duration", type=float, default=5.0, help="단계별 측정 시간 (초)")
+    parser.add_argument("--latency", type=float, default=0.3, help="가짜 OpenAI 응답 지연 (초)")
+    parser.add_argument("--jitter", type=float, default=0.05, help="가짜 OpenAI 응답 지연 편차 (±초)")
+    parser.add_argument("--token-interval", type=float, default=0.01, help="가짜 OpenAI 스트리밍 토큰 간격 (초)")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="가짜 OpenAI 500 응답 비율")
+    parser.add_argument("--rate-limit-rate", type=float, default=0.0, help="가짜 OpenAI 429 응답 비율")
+    parser.add_argument("--no-admission", dest="admission", action="store_false", help="요청 수락 제어 끄기")
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE, help="기준값 JSON 파일")
+    parser.add_argument("--tolerance", type=float, default=0.15, help="허용할 성능 저하 비율")
+    parser.add_argument("--save-baseline", action="store_true", help="이번 결과를 기준값으로 저장")
+    parser.add_argument("--compare", action="store_true", help="저장된 기준값과 비교 (기준값 파일이 없으면 실패)")
+    parser.add_argument("--output", default=None, help="결과 JSON을 저장할 파일")
+    args = parser.parse_args()
+
+    args.endpoints = [name.strip() for name in args.endpoints.split(",") if name.strip()]
+    unknown = [name for name in args.endpoints if name not in ENDPOINTS]
+    if unknown:
+        parser.error(f"알 수 없는 엔드포인트: {', '.join(unknown)}")
+    args.concurrency = [int(value) for value in args.concurrency.split(",")]
+    if args.compare and args.save_baseline:
+        parser.error("--compare와 --save-baseline은 함께 쓸 수 없습니다")
+    # 몇 분짜리 측정을 마친 뒤가 아니라 시작하기 전에 실패
+    if args.compare and not os.path.exists(args.baseline):
+        parser.error(f"기준값 파일이 없습니다: {args.baseline} (같은 장비에서 --save-baseline으로 먼저 저장하세요)")
+
+    results = asyncio.run(run(args))
+    report = {
+        "createdAt": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "settings": {
+            "duration": args.duration,
+            "latency": args.latency,
+            "jitter": args.jitter,
+            "tokenInterval": args.token_interval,
+            "errorRate": args.error_rate,
+            "rateLimitRate": args.rate_limit_rate,
+            "admission": args.admission
+        },
+        "results": results
+    }
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as file:
+            json.dump(report, file, ensure_ascii=False, indent=2)
+
+    if args.save_baseline:
+        os.makedirs(os.path.dirname(args.baseline), exist_ok=True)
+        with open(args.baseline, "w", encoding="utf-8") as file:
+            json.dump(report, file, ensure_ascii=False, indent=2)
+        print(f"기준값 저장: {args.baseline}")
+        return
+
+    if not args.compare:
+        return
+
+    with open(args.baseline, encoding="utf-8") as file:
+        baseline = json.load(file)
+    if baseline.get("settings") != report["settings"]:
+        print("경고: 기준값과 측정 설정이 달라 비교 결과가 정확하지 않을 수 있습니다.")
+    regressions = compare(results, baseline, args.tolerance)
+    if regressions:
+        print(f"기준값({baseline.get('createdAt')}) 대비 성능 저하 (허용 {args.tolerance:.0%}):")
+        for regression in regressions:
+            print(f"- {regression}")
+        sys.exit(1)
+    print(f"기준값({baseline.get('createdAt')}) 대비 성능 저하 없음 (허용 {args.tolerance:.0%})")
+
+
+if __name__ == "__main__":
+    main()
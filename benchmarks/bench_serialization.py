@@ -0,0 +1,178 @@
+"""
+응답 직렬화 벤치마크 (네트워크 호출 없음)
+
+엔드포인트별 대표 응답을 만들어, 라우트가 응답 모델을 만들고 FastAPI가 검증·직렬화해
+본문 바이트를 만들기까지의 비용을 이전 방식과 현재 방식으로 비교합니다.
+    - 이전 방식: data가 Dict[str, Any]인 응답 모델, 표준 json(JSONResponse), datetime.now() 두 번
+    - 현재 방식: 필드를 정한 응답 모델(안쪽은 TypedDict), 기본 응답 클래스(orjson이 있으면 ORJSONResponse)
+본문 크기와 gzip/brotli 압축 후 크기도 함께 출력합니다.
+
+사용법:
+    python benchmarks/bench_serialization.py
+    python benchmarks/bench_serialization.py --repeat 5000 --endpoints weekly_recommend
+"""
+import argparse
+import asyncio
+import gzip
+import json
+import os
+import sys
+import time
+from datetime import datetime
+from typing import Any, Callable, Dict
+
+from fastapi.responses import JSONResponse
+from fastapi.routing import serialize_response
+from fastapi.utils import create_response_field
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from config import settings
+from middleware.compression import brotli
+from routers.chat import ChatResponse, ChatMessageResponse, ConversationResponse
+from routers.responses import DefaultJSONResponse
+from routers.upload_time import (
+    UploadTimeResponse, RecommendationResponse, WeeklyRecommendationResponse, upload_time_service
+)
+
+CHAT_REPLY = (
+    "이번 주에는 평일 저녁 8시~10시, 주말에는 오후 2시~4시에 업로드하는 것을 추천합니다. "
+    "퇴근 후 시청자가 가장 많이 몰리는 시간대이며, 주말에는 점심 이후 여유 시간에 시청이 늘어납니다. "
+    "업로드 직후 1시간 동안의 반응이 추천 노출에 큰 영향을 주므로 댓글에 빠르게 답해 주세요."
+)
+
+
+async def build_payloads() -> Dict[str, Dict[str, Any]]:
+    """엔드포인트별 응답 data (timestamp 제외, 라우트가 만드는 것과 같은 구조)"""
+    today = upload_time_service.today()
+    recommendation = upload_time_service.build_rule_based_recommendation(today, "general")
+    weekly = await upload_time_service.get_weekly_upload_recommendation(today, "general", mode="fast")
+    usage = {"prompt_tokens": 420, "completion_tokens": 96, "total_tokens": 516}
+    return {
+        "recommend": {
+            "date": today.isoformat(),
+            "dayName": today.strftime('%Y년 %m월 %d일 %A'),
+            "contentType": "general",
+            "recommendation": recommendation["text"],
+            "extractedTime": recommendation["extractedTime"],
+            "extractedTimeDetail": recommendation["extractedTimeDetail"],
+            "timeWindow": recommendation.get("timeWindow"),
+            "source": recommendation["source"]
+        },
+        "weekly_recommend": {
+            "weekStart": today.isoformat(),
+            "weekStartName": today.strftime('%Y년 %m월 %d일 %A'),
+            "contentType": "general",
+            "weeklyRecommendation": weekly
+        },
+        "chat_message": {
+            "message": CHAT_REPLY,
+            "model": settings.DEFAULT_MODEL,
+            "usage": usage,
+            "cache": {"semantic": "disabled", "exact": "bypass"}
+        },
+        "chat_conversation": {
+            "message": CHAT_REPLY,
+            "model": settings.DEFAULT_MODEL,
+            "usage": usage,
+            "compaction": {
+                "compacted": True, "originalTokens": 7200, "sentTokens": 2400, "tokensSaved": 4800, "summaryTokens": 0,
+                "summarizedMessages": 18, "summaryCached": True
+            },
+            "cache": {"exact": "bypass"}
+        }
+    }
+
+
+# 엔드포인트별 (이전 응답 모델, 현재 응답 모델)
+MODELS = {
+    "recommend": (UploadTimeResponse, RecommendationResponse),
+    "weekly_recommend": (UploadTimeResponse, WeeklyRecommendationResponse),
+    "chat_message": (ChatResponse, ChatMessageResponse),
+    "chat_conversation": (ChatResponse, ConversationResponse),
+}
+
+
+def legacy_encoder(model) -> Callable[[Dict[str, Any]], Any]:
+    """이전 방식: 타입 없는 data, 표준 json, timestamp를 두 번 계산"""
+    field = create_response_field(name=f"legacy_{model.__name__}", type_=model)
+
+    async def encode(data: Dict[str, Any]) -> bytes:
+        response = model(
+            success=True,
+            data={**data, "timestamp": datetime.now().isoformat()},
+            timestamp=datetime.now().isoformat()
+        )
+        content = await serialize_response(field=field, response_content=response)
+        return JSONResponse(content).body
+
+    return encode
+
+
+def current_encoder(model) -> Callable[[Dict[str, Any]], Any]:
+    """현재 방식: 필드를 정한 응답 모델, 기본 응답 클래스"""
+    field = create_response_field(name=f"current_{model.__name__}", type_=model)
+
+    async def encode(data: Dict[str, Any]) -> bytes:
+        timestamp = datetime.now().isoformat()
+        response = model(success=True, data={**data, "timestamp": timestamp}, timestamp=timestamp)
+        content = await serialize_response(field=field, response_content=response)
+        return DefaultJSONResponse(content).body
+
+    return encode
+
+
+async def bench(encode, data: Dict[str, Any], repeat: int) -> float:
+    """repeat번 직렬화한 평균 시간 (µs)"""
+    await encode(data)
+    started = time.perf_counter()
+    for _ in range(repeat):
+        await encode(data)
+    return (time.perf_counter() - started) / repeat * 1_000_000
+
+
+def without_timestamps(body: bytes) -> Any:
+    """응답 비교용 (timestamp 제외)"""
+    parsed = json.loads(body)
+    parsed.pop("timestamp", None)
+    parsed["data"].pop("timestamp", None)
+    return parsed
+
+
+async def run(endpoints, repeat: int) -> None:
+    payloads = await build_payloads()
+    print(f"기본 응답 클래스: {DefaultJSONResponse.__name__}, brotli: {'사용' if brotli is not None else '없음'}")
+    print(f"{'엔드포인트':<20} {'이전 µs':>9} {'현재 µs':>9} {'향상':>6} {'본문 B':>8} {'gzip B':>8} {'br B':>8}  응답 일치")
+    for name in endpoints:
+        legacy_model, typed_model = MODELS[name]
+        legacy, current = legacy_encoder(legacy_model), current_encoder(typed_model)
+        data = payloads[name]
+
+        legacy_us = await bench(legacy, data, repeat)
+        current_us = await bench(current, data, repeat)
+
+        body = await current(data)
+        same = without_timestamps(await legacy(data)) == without_timestamps(body)
+        gzip_size = len(gzip.compress(body, compresslevel=settings.COMPRESSION_GZIP_LEVEL, mtime=0))
+        br_size = len(brotli.compress(body, quality=settings.COMPRESSION_BROTLI_QUALITY)) if brotli is not None else "-"
+        print(
+            f"{name:<20} {legacy_us:9.1f} {current_us:9.1f} {legacy_us / current_us:5.2f}배 "
+            f"{len(body):8d} {gzip_size:8d} {br_size:>8}  {'예' if same else '아니오'}"
+        )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="응답 직렬화 벤치마크")
+    parser.add_argument("--repeat", type=int, default=2000, help="엔드포인트별 반복 횟수")
+    parser.add_argument("--endpoints", default=",".join(MODELS), help=f"쉼표로 구분한 엔드포인트 ({', '.join(MODELS)})")
+    args = parser.parse_args()
+
+    endpoints = [name.strip() for name in args.endpoints.split(",") if name.strip()]
+    unknown = [name for name in endpoints if name not in MODELS]
+    if unknown:
+        parser.error(f"알 수 없는 엔드포인트: {', '.join(unknown)}")
+    asyncio.run(run(endpoints, args.repeat))
+
+
+if __name__ == "__main__":
+    main()
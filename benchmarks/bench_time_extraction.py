@@ -0,0 +1,107 @@
+"""
+시간 추출 벤치마크
+
+이전 방식(패턴 13개를 호출마다 순서대로 re.findall)과
+단일 정규식(services.time_extraction, 추천 문장 안쪽만 찾거나 첫 매치에서 멈춤)을 비교합니다.
+
+사용법:
+    python benchmarks/bench_time_extraction.py
+    python benchmarks/bench_time_extraction.py --corpus 응답_아카이브.txt --repeat 200
+"""
+import argparse
+import os
+import re
+import sys
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from services.time_extraction import extract_time
+
+DEFAULT_CORPUS = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data", "model_outputs.txt")
+
+
+def legacy_extract_time_from_text(text):
+    """이전 UploadTimeService.extract_time_from_text 구현 (비교용)"""
+    time_patterns = [
+        (r'(저녁|아침|낮|밤|새벽)\s*(\d{1,2})시~(\d{1,2})시', lambda m: f"{m[0]} {m[1]}시~{m[2]}시"),
+        (r'(저녁|아침|낮|밤|새벽)\s*(\d{1,2})-(\d{1,2})시', lambda m: f"{m[0]} {m[1]}-{m[2]}시"),
+        (r'(저녁|아침|낮|밤|새벽)\s*(\d{1,2})시', lambda m: f"{m[0]} {m[1]}시"),
+        (r'(저녁|아침|낮|밤|새벽)\s*(\d{1,2})시경', lambda m: f"{m[0]} {m[1]}시경"),
+        (r'(오전|오후)\s*(\d{1,2})시', lambda m: f"{m[0]} {m[1]}시"),
+        (r'(오전|오후)\s*(\d{1,2})-(\d{1,2})시', lambda m: f"{m[0]} {m[1]}-{m[2]}시"),
+        (r'(오전|오후)\s*(\d{1,2})시경', lambda m: f"{m[0]} {m[1]}시경"),
+        (r'(오전|오후)\s*(\d{1,2})시~(\d{1,2})시', lambda m: f"{m[0]} {m[1]}시~{m[2]}시"),
+        (r'(\d{1,2}):(\d{2})', lambda m: f"{m[0]}:{m[1]}"),
+        (r'(\d{1,2})시', lambda m: f"{m[0]}시"),
+        (r'(\d{1,2})-(\d{1,2})시', lambda m: f"{m[0]}-{m[1]}시"),
+        (r'(\d{1,2})시경', lambda m: f"{m[0]}시경"),
+        (r'(\d{1,2})시~(\d{1,2})시', lambda m: f"{m[0]}시~{m[1]}시")
+    ]
+    for pattern, formatter in time_patterns:
+        matches = re.findall(pattern, text)
+        if matches:
+            match = matches[0]
+            return formatter(match if isinstance(match, tuple) else [match])
+    return None
+
+
+def measure(fn, texts, repeat):
+    """repeat번 반복 실행한 텍스트당 평균 시간 (µs)"""
+    started = time.perf_counter()
+    for _ in range(repeat):
+        fn(texts)
+    return (time.perf_counter() - started) / (repeat * len(texts)) * 1_000_000
+
+
+def bench(candidates, texts, repeat, rounds):
+    """
+    방식들을 번갈아 rounds번 측정해 방식별 가장 빠른 값을 출력 (다른 프로세스의 영향을 줄임)
+
+    Returns:
+        방식별 텍스트당 시간 (µs)
+    """
+    best = {label: float("inf") for label, _ in candidates}
+    for label, fn in candidates:
+        fn(texts)
+    for _ in range(rounds):
+        for label, fn in candidates:
+            best[label] = min(best[label], measure(fn, texts, repeat))
+    for label, _ in candidates:
+        print(f"{label:<28} {best[label]:8.2f} µs/텍스트  ({repeat * len(texts)}건 x {rounds}회 중 최솟값)")
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description="시간 추출 벤치마크")
+    parser.add_argument("--corpus", default=DEFAULT_CORPUS, help="한 줄에 응답 하나씩 담긴 텍스트 파일")
+    parser.add_argument("--repeat", type=int, default=500, help="회차별 코퍼스 반복 횟수")
+    parser.add_argument("--rounds", type=int, default=5, help="측정 회차 (방식별 가장 빠른 회차를 사용)")
+    parser.add_argument("--show", action="store_true", help="텍스트별 추출 결과 비교 출력")
+    args = parser.parse_args()
+
+    with open(args.corpus, encoding="utf-8") as f:
+        texts = [line.strip() for line in f if line.strip()]
+
+    print(f"코퍼스: {args.corpus} ({len(texts)}개 응답)")
+    best = bench([
+        ("이전 방식 (패턴 13개 순차)", lambda ts: [legacy_extract_time_from_text(t) for t in ts]),
+        ("단일 정규식 (extract_time)", lambda ts: [extract_time(t) for t in ts]),
+    ], texts, args.repeat, args.rounds)
+    legacy, single = best.values()
+    print(f"속도 향상: {legacy / single:.2f}배")
+
+    changed = 0
+    for text in texts:
+        before = legacy_extract_time_from_text(text)
+        extraction = extract_time(text)
+        after = extraction.display if extraction else None
+        if before != after:
+            changed += 1
+            if args.show:
+                print(f"- {text}\n  이전: {before}\n  현재: {after}")
+    print(f"추출 결과가 달라진 응답: {changed}/{len(texts)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,234 @@
+"""
+로컬 가짜 OpenAI 서버 (벤치마크용, 네트워크와 할당량을 쓰지 않음)
+
+서버의 OPENAI_BASE_URL을 http://127.0.0.1:<port>/v1로 지정하면
+채팅 완료(스트리밍 포함), 모델 목록, 임베딩 요청에 실제 API와 같은 형식으로 응답합니다.
+응답 지연, 토큰 스트리밍 간격, 5xx/429 오류 비율을 조절할 수 있습니다.
+
+사용법:
+    python benchmarks/fake_openai.py --port 9100 --latency 0.3 --token-interval 0.01
+    python benchmarks/fake_openai.py --error-rate 0.05 --rate-limit-rate 0.02
+"""
+import argparse
+import asyncio
+import base64
+import hashlib
+import json
+import random
+import re
+import struct
+import time
+import uuid
+from typing import Any, Dict, List, Optional
+
+import uvicorn
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse, StreamingResponse
+
+# 모델 목록 (서버의 모델 검증을 통과하도록 자주 쓰는 모델 포함)
+MODELS = ["gpt-4o", "gpt-4o-mini", "gpt-4-turbo", "gpt-4", "gpt-3.5-turbo", "text-embedding-3-small", "dall-e-3"]
+
+DATE_PATTERN = re.compile(r"\d{4}-\d{2}-\d{2}")
+
+DEFAULT_REPLY = "이번 주에는 저녁 8시~10시에 업로드하는 것을 추천합니다. 시청자가 가장 많이 몰리는 시간대입니다."
+
+
+class FakeOpenAIConfig:
+    """가짜 서버 동작 설정"""
+
+    def __init__(
+        self,
+        latency: float = 0.3,
+        jitter: float = 0.1,
+        token_interval: float = 0.01,
+        error_rate: float = 0.0,
+        rate_limit_rate: float = 0.0,
+        seed: Optional[int] = None
+    ):
+        self.latency = latency
+        self.jitter = jitter
+        self.token_interval = token_interval
+        self.error_rate = error_rate
+        self.rate_limit_rate = rate_limit_rate
+        self.random = random.Random(seed)
+
+
+def _tokens(text: str) -> List[str]:
+    """스트리밍 청크 단위 (공백 기준 단어, 공백 포함)"""
+    return re.findall(r"\S+\s*", text) or [text]
+
+
+def _count_tokens(messages: List[Dict[str, Any]]) -> int:
+    """대략적인 프롬프트 토큰 수 (4글자당 1토큰)"""
+    return max(1, sum(len(str(message.get("content", ""))) for message in messages) // 4)
+
+
+def _structured_week(prompt: str) -> str:
+    """구조화된 주간 추천 프롬프트에 대한 JSON 응답"""
+    days = sorted(set(DATE_PATTERN.findall(prompt)))
+    return json.dumps({
+        "days": [
+            {"date": day, "recommendation": "저녁 8시~10시 업로드를 추천합니다.", "timeWindow": {"start": "20:00", "end": "22:00"}}
+            for day in days
+        ],
+        "weekly": {"recommendation": "평일은 저녁 8시, 주말은 오후 2시에 올리세요.", "timeWindow": {"start": "20:00", "end": "22:00"}}
+    }, ensure_ascii=False)
+
+
+def _embedding(text: str, dimensions: int) -> List[float]:
+    """입력마다 항상 같은 가짜 임베딩 (정규화된 벡터)"""
+    seed = hashlib.sha256(text.encode("utf-8")).digest()
+    rng = random.Random(struct.unpack("<Q", seed[:8])[0])
+    vector = [rng.uniform(-1, 1) for _ in range(dimensions)]
+    norm = sum(value * value for value in vector) ** 0.5 or 1.0
+    return [value / norm for value in vector]
+
+
+def create_app(config: FakeOpenAIConfig) -> FastAPI:
+    """가짜 OpenAI API 앱 생성"""
+    app = FastAPI(title="가짜 OpenAI 서버")
+    app.state.stats = {"requests": 0, "errors": 0, "rateLimited": 0}
+
+    async def inject_failure() -> Optional[JSONResponse]:
+        """설정한 비율로 429 또는 500 응답 (지연을 거친 뒤)"""
+        app.state.stats["requests"] += 1
+        await asyncio.sleep(max(0.0, config.latency + config.random.uniform(-config.jitter, config.jitter)))
+        roll = config.random.random()
+        if roll < config.rate_limit_rate:
+            app.state.stats["rateLimited"] += 1
+            return JSONResponse(
+                status_code=429,
+                content={"error": {"message": "Rate limit reached", "type": "requests", "code": "rate_limit_exceeded"}},
+                headers={"retry-after": "1"}
+            )
+        if roll < config.rate_limit_rate + config.error_rate:
+            app.state.stats["errors"] += 1
+            return JSONResponse(
+                status_code=500,
+                content={"error": {"message": "The server had an error", "type": "server_error", "code": None}}
+            )
+        return None
+
+    @app.get("/v1/models")
+    async def list_models():
+        return {
+            "object": "list",
+            "data": [{"id": model, "object": "model", "created": 1700000000, "owned_by": "system"} for model in MODELS]
+        }
+
+    @app.post("/v1/chat/completions")
+    async def chat_completions(request: Request):
+        body = await request.json()
+        failure = await inject_failure()
+        if failure is not None:
+            return failure
+
+        messages = body.get("messages", [])
+        model = body.get("model", "gpt-4o")
+        if (body.get("response_format") or {}).get("type") == "json_object":
+            reply = _structured_week(str(messages[-1].get("content", "")) if messages else "")
+        else:
+            reply = DEFAULT_REPLY
+        pieces = _tokens(reply)
+        prompt_tokens = _count_tokens(messages)
+        usage = {
+            "prompt_tokens": prompt_tokens,
+            "completion_tokens": len(pieces),
+            "total_tokens": prompt_tokens + len(pieces)
+        }
+        completion_id = f"chatcmpl-{uuid.uuid4().hex}"
+        created = int(time.time())
+
+        if not body.get("stream"):
+            return {
+                "id": completion_id,
+                "object": "chat.completion",
+                "created": created,
+                "model": model,
+                "choices": [{"index": 0, "message": {"role": "assistant", "content": reply}, "finish_reason": "stop"}],
+                "usage": usage
+            }
+
+        include_usage = (body.get("stream_options") or {}).get("include_usage", False)
+
+        def chunk(delta: Dict[str, Any], finish_reason: Optional[str] = None) -> str:
+            payload = {
+                "id": completion_id,
+                "object": "chat.completion.chunk",
+                "created": created,
+                "model": model,
+                "choices": [{"index": 0, "delta": delta, "finish_reason": finish_reason}]
+            }
+            return f"data: {json.dumps(payload, ensure_ascii=False)}\n\n"
+
+        async def stream():
+            yield chunk({"role": "assistant", "content": ""})
+            for piece in pieces:
+                await asyncio.sleep(config.token_interval)
+                yield chunk({"content": piece})
+            yield chunk({}, "stop")
+            if include_usage:
+                payload = {"id": completion_id, "object": "chat.completion.chunk", "created": created,
+                           "model": model, "choices": [], "usage": usage}
+                yield f"data: {json.dumps(payload)}\n\n"
+            yield "data: [DONE]\n\n"
+
+        return StreamingResponse(stream(), media_type="text/event-stream")
+
+    @app.post("/v1/embeddings")
+    async def embeddings(request: Request):
+        body = await request.json()
+        failure = await inject_failure()
+        if failure is not None:
+            return failure
+
+        inputs = body.get("input", [])
+        if isinstance(inputs, str):
+            inputs = [inputs]
+        dimensions = body.get("dimensions") or 1536
+        prompt_tokens = max(1, sum(len(text) for text in inputs) // 4)
+        vectors = [_embedding(text, dimensions) for text in inputs]
+        if body.get("encoding_format") == "base64":
+            vectors = [base64.b64encode(struct.pack(f"<{dimensions}f", *vector)).decode("ascii") for vector in vectors]
+        return {
+            "object": "list",
+            "data": [
+                {"object": "embedding", "index": index, "embedding": vector}
+                for index, vector in enumerate(vectors)
+            ],
+            "model": body.get("model", "text-embedding-3-small"),
+            "usage": {"prompt_tokens": prompt_tokens, "total_tokens": prompt_tokens}
+        }
+
+    @app.get("/stats")
+    async def get_stats():
+        return app.state.stats
+
+    return app
+
+
+def main():
+    parser = argparse.ArgumentParser(description="로컬 가짜 OpenAI 서버")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=9100)
+    parser.add_argument("--latency", type=float, default=0.3, help="응답 전 지연 (초)")
+    parser.add_argument("--jitter", type=float, default=0.1, help="지연에 더할 무작위 편차 (±초)")
+    parser.add_argument("--token-interval", type=float, default=0.01, help="스트리밍 토큰 간격 (초)")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="500 응답 비율 (0~1)")
+    parser.add_argument("--rate-limit-rate", type=float, default=0.0, help="429 응답 비율 (0~1)")
+    parser.add_argument("--seed", type=int, default=None, help="오류 주입 난수 시드")
+    args = parser.parse_args()
+
+    config = FakeOpenAIConfig(
+        latency=args.latency,
+        jitter=args.jitter,
+        token_interval=args.token_interval,
+        error_rate=args.error_rate,
+        rate_limit_rate=args.rate_limit_rate,
+        seed=args.seed
+    )
+    uvicorn.run(create_app(config), host=args.host, port=args.port, log_level="warning", access_log=False)
+
+
+if __name__ == "__main__":
+    main()
@@ -7,10 +7,151 @@ load_dotenv()
 class Settings:
     # OpenAI API 설정
     OPENAI_API_KEY: str = os.getenv("OPENAI_API_KEY", "your_openai_api_key_here")
+    # OpenAI 호환 API 주소 (비우면 공식 API, 벤치마크에서는 로컬 가짜 서버)
+    OPENAI_BASE_URL: str = os.getenv("OPENAI_BASE_URL", "")
     DEFAULT_MODEL: str = os.getenv("DEFAULT_MODEL", "gpt-4o")
     FALLBACK_MODEL: str = os.getenv("FALLBACK_MODEL", "gpt-4o-mini")
     MAX_TOKENS: int = int(os.getenv("MAX_TOKENS", "4000"))
     TEMPERATURE: float = float(os.getenv("TEMPERATURE", "0.7"))
+
+    # OpenAI 연결 풀 설정 (워커 프로세스당 하나의 풀을 공유)
+    OPENAI_TIMEOUT: float = float(os.getenv("OPENAI_TIMEOUT", "60"))
+    OPENAI_MAX_CONNECTIONS: int = int(os.getenv("OPENAI_MAX_CONNECTIONS", "100"))
+    OPENAI_MAX_KEEPALIVE_CONNECTIONS: int = int(os.getenv("OPENAI_MAX_KEEPALIVE_CONNECTIONS", "20"))
+    # 워커당 동시에 진행할 수 있는 OpenAI 호출 수
+    OPENAI_MAX_CONCURRENCY: int = int(os.getenv("OPENAI_MAX_CONCURRENCY", "64"))
+
+    # 계정 호출 한도 (같은 호스트의 워커들이 공유, 0이면 제한 없음)
+    OPENAI_RPM_LIMIT: int = int(os.getenv("OPENAI_RPM_LIMIT", "0"))
+    OPENAI_TPM_LIMIT: int = int(os.getenv("OPENAI_TPM_LIMIT", "0"))
+    # 한 번에 몰아서 쓸 수 있는 양 (이 시간 동안 채워지는 양, 초)
+    OPENAI_LIMIT_BURST_SECONDS: float = float(os.getenv("OPENAI_LIMIT_BURST_SECONDS", "10"))
+    # 한도가 찰 때까지 기다릴 최대 시간 (초, 넘으면 429)
+    OPENAI_LIMIT_MAX_WAIT: float = float(os.getenv("OPENAI_LIMIT_MAX_WAIT", "30"))
+
+    # 재시도 및 서킷 브레이커 설정 (429, 5xx, 연결 오류, 시간 초과만 재시도)
+    OPENAI_MAX_ATTEMPTS: int = int(os.getenv("OPENAI_MAX_ATTEMPTS", "3"))
+    OPENAI_RETRY_BASE_DELAY: float = float(os.getenv("OPENAI_RETRY_BASE_DELAY", "0.5"))
+    # 이보다 오래 기다려야 하면(Retry-After 포함) 재시도하지 않고 실패
+    OPENAI_RETRY_MAX_DELAY: float = float(os.getenv("OPENAI_RETRY_MAX_DELAY", "8"))
+    # 연속 업스트림 장애가 이 횟수에 닿으면 CIRCUIT_RECOVERY_TIMEOUT초 동안 호출 없이 바로 실패
+    CIRCUIT_FAILURE_THRESHOLD: int = int(os.getenv("CIRCUIT_FAILURE_THRESHOLD", "5"))
+    CIRCUIT_RECOVERY_TIMEOUT: float = float(os.getenv("CIRCUIT_RECOVERY_TIMEOUT", "30"))
+
+    # 모델 목록 캐시 설정 (TTL마다 백그라운드 갱신, 실패하면 RETRY_INTERVAL 뒤 재시도)
+    MODEL_CATALOG_TTL: int = int(os.getenv("MODEL_CATALOG_TTL", "86400"))
+    MODEL_CATALOG_RETRY_INTERVAL: int = int(os.getenv("MODEL_CATALOG_RETRY_INTERVAL", "300"))
+    # 요청 모델을 모델 목록으로 미리 검증 (목록을 받지 못했으면 검증하지 않음)
+    MODEL_VALIDATION_ENABLED: bool = os.getenv("MODEL_VALIDATION_ENABLED", "True").lower() == "true"
+
+    # 모델 라우팅 설정 (경로별 정책, 기본 모델이 지연되면 FALLBACK_MODEL로 hedging)
+    MODEL_ROUTING_ENABLED: bool = os.getenv("MODEL_ROUTING_ENABLED", "True").lower() == "true"
+    # 경로별 정책 JSON (예: {"chat": {"hedge": false}, "upload_time": {"fast": false}})
+    MODEL_ROUTE_POLICIES: str = os.getenv("MODEL_ROUTE_POLICIES", "")
+    # 이 백분위수 응답 시간을 넘기면 hedging
+    HEDGE_PERCENTILE: float = float(os.getenv("HEDGE_PERCENTILE", "95"))
+    HEDGE_MIN_DELAY: float = float(os.getenv("HEDGE_MIN_DELAY", "2"))
+    # 응답 기록이 HEDGE_MIN_SAMPLES개 미만일 때 쓰는 대기 시간 (초)
+    HEDGE_DEFAULT_DELAY: float = float(os.getenv("HEDGE_DEFAULT_DELAY", "15"))
+    HEDGE_MIN_SAMPLES: int = int(os.getenv("HEDGE_MIN_SAMPLES", "20"))
+    # 모델별로 백분위수를 계산할 최근 응답 수
+    LATENCY_WINDOW: int = int(os.getenv("LATENCY_WINDOW", "200"))
+
+    # 업로드 시간 추천 설정
+    # 추천 기준 날짜를 정하는 시간대
+    TIMEZONE: str = os.getenv("TIMEZONE", "Asia/Seoul")
+    # 주간 추천에서 동시에 진행할 일별 추천 요청 수
+    WEEKLY_RECOMMEND_CONCURRENCY: int = int(os.getenv("WEEKLY_RECOMMEND_CONCURRENCY", "7"))
+    # 주간 추천 생성 방식 (per_day: 일별 8회 호출, structured: JSON 1회 호출)
+    WEEKLY_RECOMMEND_MODE: str = os.getenv("WEEKLY_RECOMMEND_MODE", "per_day")
+    # LLM 호출이 실패하고 캐시도 없을 때 규칙 기반 추천으로 대체할지 여부
+    UPLOAD_TIME_RULE_FALLBACK: bool = os.getenv("UPLOAD_TIME_RULE_FALLBACK", "True").lower() == "true"
+    # 선거일, 임시공휴일 등 계산으로 알 수 없는 특별한 날 데이터 파일
+    HOLIDAY_DATA_PATH: str = os.getenv(
+        "HOLIDAY_DATA_PATH",
+        os.path.join(os.path.dirname(os.path.abspath(__file__)), "data", "special_days.json")
+    )
+
+    # 일괄 채팅 설정 (/api/chat/batch 요청 하나에 담을 수 있는 항목 수와 동시에 처리할 항목 수)
+    CHAT_BATCH_MAX_ITEMS: int = int(os.getenv("CHAT_BATCH_MAX_ITEMS", "100"))
+    CHAT_BATCH_CONCURRENCY: int = int(os.getenv("CHAT_BATCH_CONCURRENCY", "8"))
+    # /api/chat/batch/offline/results로 받을 결과 파일의 최대 크기 (바이트)
+    CHAT_BATCH_RESULTS_MAX_BYTES: int = int(os.getenv("CHAT_BATCH_RESULTS_MAX_BYTES", str(16 * 1024 * 1024)))
+
+    # 임베딩 설정 (/api/embeddings, 업스트림 요청당 최대 텍스트 수와 토큰 수, 동시에 보낼 요청 수)
+    EMBEDDING_MODEL: str = os.getenv("EMBEDDING_MODEL", "text-embedding-3-small")
+    EMBEDDING_MAX_TEXTS: int = int(os.getenv("EMBEDDING_MAX_TEXTS", "50000"))
+    EMBEDDING_BATCH_SIZE: int = int(os.getenv("EMBEDDING_BATCH_SIZE", "256"))
+    EMBEDDING_BATCH_MAX_TOKENS: int = int(os.getenv("EMBEDDING_BATCH_MAX_TOKENS", "100000"))
+    EMBEDDING_CONCURRENCY: int = int(os.getenv("EMBEDDING_CONCURRENCY", "4"))
+    # 캐시할 벡터 수 (1536차원 기준 항목당 약 6KB)
+    EMBEDDING_CACHE_MAX_ENTRIES: int = int(os.getenv("EMBEDDING_CACHE_MAX_ENTRIES", "100000"))
+
+    # 의미 기반 응답 캐시 설정 (/api/chat/message, 워커 메모리, 비슷한 질문에 저장된 답변 재사용)
+    SEMANTIC_CACHE_ENABLED: bool = os.getenv("SEMANTIC_CACHE_ENABLED", "False").lower() == "true"
+    # 이 코사인 유사도 이상이면 같은 질문으로 봄
+    SEMANTIC_CACHE_THRESHOLD: float = float(os.getenv("SEMANTIC_CACHE_THRESHOLD", "0.95"))
+    SEMANTIC_CACHE_MAX_ENTRIES: int = int(os.getenv("SEMANTIC_CACHE_MAX_ENTRIES", "10000"))
+    SEMANTIC_CACHE_EMBEDDING_MODEL: str = os.getenv("SEMANTIC_CACHE_EMBEDDING_MODEL", EMBEDDING_MODEL)
+    # 벡터 차원 수 (작을수록 메모리와 검색 비용이 줄어듦, 0이면 모델 기본값)
+    SEMANTIC_CACHE_DIMENSIONS: int = int(os.getenv("SEMANTIC_CACHE_DIMENSIONS", "512"))
+    # 시작할 때 불러오고 종료할 때 저장할 스냅숏 파일 (비우면 저장하지 않음)
+    SEMANTIC_CACHE_SNAPSHOT_PATH: str = os.getenv("SEMANTIC_CACHE_SNAPSHOT_PATH", "")
+
+    # 대화 히스토리 압축 설정 (예산을 넘는 이전 대화는 요약 하나로 바꿔 보냄)
+    HISTORY_COMPACTION_ENABLED: bool = os.getenv("HISTORY_COMPACTION_ENABLED", "True").lower() == "true"
+    HISTORY_TOKEN_BUDGET: int = int(os.getenv("HISTORY_TOKEN_BUDGET", "6000"))
+    HISTORY_SUMMARY_MODEL: str = os.getenv("HISTORY_SUMMARY_MODEL", FALLBACK_MODEL)
+    HISTORY_SUMMARY_MAX_TOKENS: int = int(os.getenv("HISTORY_SUMMARY_MAX_TOKENS", "500"))
+    HISTORY_SUMMARY_CACHE_TTL: int = int(os.getenv("HISTORY_SUMMARY_CACHE_TTL", "86400"))
+    HISTORY_SUMMARY_CACHE_MAX_ENTRIES: int = int(os.getenv("HISTORY_SUMMARY_CACHE_MAX_ENTRIES", "5000"))
+
+    # 캐시 설정 (같은 호스트의 워커들이 공유하는 로컬 디스크 저장소)
+    CACHE_DIR: str = os.getenv("CACHE_DIR", os.path.join(os.path.dirname(os.path.abspath(__file__)), ".cache"))
+    RECOMMENDATION_CACHE_ENABLED: bool = os.getenv("RECOMMENDATION_CACHE_ENABLED", "True").lower() == "true"
+    RECOMMENDATION_CACHE_TTL: int = int(os.getenv("RECOMMENDATION_CACHE_TTL", "21600"))
+    RECOMMENDATION_CACHE_STALE_TTL: int = int(os.getenv("RECOMMENDATION_CACHE_STALE_TTL", "86400"))
+    RECOMMENDATION_CACHE_MAX_ENTRIES: int = int(os.getenv("RECOMMENDATION_CACHE_MAX_ENTRIES", "2000"))
+    # 결정적 채팅 호출(temperature=0, 고정 템플릿) 응답 캐시 (압축한 크기 합 기준 LRU)
+    COMPLETION_CACHE_ENABLED: bool = os.getenv("COMPLETION_CACHE_ENABLED", "True").lower() == "true"
+    COMPLETION_CACHE_MAX_BYTES: int = int(os.getenv("COMPLETION_CACHE_MAX_BYTES", str(64 * 1024 * 1024)))
+    COMPLETION_CACHE_TTL: int = int(os.getenv("COMPLETION_CACHE_TTL", "604800"))
+
+    # 추천 캐시 예열 설정 (TIMEZONE 기준 매일 CACHE_WARM_TIME 이후 지터만큼 늦게 실행)
+    CACHE_WARM_ENABLED: bool = os.getenv("CACHE_WARM_ENABLED", "True").lower() == "true"
+    CACHE_WARM_TIME: str = os.getenv("CACHE_WARM_TIME", "00:01")
+    CACHE_WARM_JITTER_SECONDS: int = int(os.getenv("CACHE_WARM_JITTER_SECONDS", "120"))
+    
+    # 지표 설정 (워커마다 METRICS_FLUSH_INTERVAL초마다 METRICS_DIR에 내보내고 /metrics에서 합산)
+    METRICS_ENABLED: bool = os.getenv("METRICS_ENABLED", "True").lower() == "true"
+    METRICS_DIR: str = os.getenv("METRICS_DIR", os.path.join(CACHE_DIR, "metrics"))
+    METRICS_FLUSH_INTERVAL: float = float(os.getenv("METRICS_FLUSH_INTERVAL", "5"))
+    # 종료된 워커의 카운터를 합산에 남겨두는 시간 (초)
+    METRICS_DEAD_WORKER_TTL: int = int(os.getenv("METRICS_DEAD_WORKER_TTL", "3600"))
+    # 이벤트 루프 지연 측정 간격 (초, 0이면 측정하지 않음)
+    METRICS_LOOP_LAG_INTERVAL: float = float(os.getenv("METRICS_LOOP_LAG_INTERVAL", "0.5"))
+
+    # 요청 수락 제어 설정 (그룹별 동시 처리 한도를 넘는 요청은 대기 후 처리하거나 503으로 거절)
+    ADMISSION_CONTROL_ENABLED: bool = os.getenv("ADMISSION_CONTROL_ENABLED", "True").lower() == "true"
+    # 그룹별 한도 JSON (예: '{"chat": {"max_concurrency": 64, "max_queue": 128, "max_queue_wait": 10}}')
+    ADMISSION_LIMITS: str = os.getenv("ADMISSION_LIMITS", "")
+    
+    # 로그 설정 (큐에 넣고 백그라운드 스레드에서 stdout으로 출력)
+    LOG_LEVEL: str = os.getenv("LOG_LEVEL", "INFO")
+    LOG_FORMAT: str = os.getenv("LOG_FORMAT", "json")
+    # 요청 처리 완료처럼 자주 남는 로그를 남길 비율 (0~1, WARNING 이상은 항상 남김)
+    LOG_SAMPLE_RATE: float = float(os.getenv("LOG_SAMPLE_RATE", "0.1"))
+    # 로그에 남길 사용자 메시지 최대 글자 수 (0이면 길이만 남김)
+    LOG_MAX_BODY_CHARS: int = int(os.getenv("LOG_MAX_BODY_CHARS", "100"))
+    LOG_QUEUE_SIZE: int = int(os.getenv("LOG_QUEUE_SIZE", "10000"))
+
+    # 응답 압축 설정 (Accept-Encoding에 따라 brotli 또는 gzip, 스트리밍 응답은 압축하지 않음)
+    COMPRESSION_ENABLED: bool = os.getenv("COMPRESSION_ENABLED", "True").lower() == "true"
+    # 이 크기(바이트) 이상인 응답만 압축
+    COMPRESSION_MIN_SIZE: int = int(os.getenv("COMPRESSION_MIN_SIZE", "1024"))
+    COMPRESSION_GZIP_LEVEL: int = int(os.getenv("COMPRESSION_GZIP_LEVEL", "6"))
+    # brotli 품질 (0~11, 높을수록 작지만 느림, brotli 패키지가 있을 때만 사용)
+    COMPRESSION_BROTLI_QUALITY: int = int(os.getenv("COMPRESSION_BROTLI_QUALITY", "4"))
     
     # 서버 설정
     HOST: str = os.getenv("HOST", "0.0.0.0")
@@ -1,8 +1,10 @@
 from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import PlainTextResponse
 import uvicorn
+from contextlib import asynccontextmanager
 from datetime import datetime
+import logging
 import sys
 import os
 
@@ -10,7 +12,38 @@ import os
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
 from config import settings
-from routers import chat, upload_time
+from services.structured_logging import setup_logging
+
+# 다른 모듈이 로그를 남기기 전에 큐 기반 구조화 로깅 설정
+setup_logging(settings.LOG_LEVEL, settings.LOG_FORMAT, settings.LOG_SAMPLE_RATE, settings.LOG_QUEUE_SIZE)
+
+from routers import chat, embeddings, stats, upload_time
+from routers.responses import DefaultJSONResponse
+from services.openai_service import openai_service
+from services.metrics import metrics
+from services.semantic_cache import semantic_cache
+from middleware.admission import AdmissionMiddleware, admission_controller
+from middleware.compression import CompressionMiddleware
+from middleware.metrics import MetricsMiddleware
+from middleware.request_context import RequestContextMiddleware
+
+logger = logging.getLogger(__name__)
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """앱 수명주기: 워커별 공유 리소스 생성 및 정리"""
+    await openai_service.startup()
+    await metrics.start()
+    await openai_service.model_catalog.start()
+    semantic_cache.load()
+    if settings.CACHE_WARM_ENABLED:
+        await upload_time.cache_warmer.start()
+    yield
+    await upload_time.cache_warmer.stop()
+    await openai_service.model_catalog.stop()
+    semantic_cache.save()
+    await openai_service.shutdown()
+    await metrics.stop()
 
 # FastAPI 앱 생성
 app = FastAPI(
@@ -18,9 +51,27 @@ app = FastAPI(
     description="OpenAI ChatGPT API를 사용한 동영상 업로드 시간 추천 서비스",
     version="1.0.0",
     docs_url="/docs",
-    redoc_url="/redoc"
+    redoc_url="/redoc",
+    default_response_class=DefaultJSONResponse,
+    lifespan=lifespan
 )
 
+# 응답 압축 미들웨어 (라우트 응답을 직접 감싸도록 가장 안쪽에 등록)
+if settings.COMPRESSION_ENABLED:
+    app.add_middleware(
+        CompressionMiddleware,
+        minimum_size=settings.COMPRESSION_MIN_SIZE,
+        gzip_level=settings.COMPRESSION_GZIP_LEVEL,
+        brotli_quality=settings.COMPRESSION_BROTLI_QUALITY
+    )
+
+# 요청 수락 제어 미들웨어 (거절 응답에도 CORS 헤더가 붙도록 CORS보다 먼저 등록)
+admission_controller.register_cheap_check("upload_time", upload_time.is_cached_request)
+app.add_middleware(AdmissionMiddleware, controller=admission_controller)
+
+# 요청 지표 미들웨어 (수락 제어로 거절된 요청도 기록)
+app.add_middleware(MetricsMiddleware)
+
 # CORS 미들웨어 설정
 app.add_middleware(
     CORSMiddleware,
@@ -28,13 +79,22 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=[
+        "X-Request-ID", "X-Embedding-Model", "X-Embedding-Count", "X-Embedding-Dimensions",
+        "X-Embedding-Encoding", "X-Embedding-Cache-Hits", "X-Embedding-Prompt-Tokens"
+    ],
 )
 
+# 요청 상관관계 ID 미들웨어 (거절 응답과 다른 미들웨어 로그에도 요청 ID가 붙도록 가장 바깥에 등록)
+app.add_middleware(RequestContextMiddleware)
+
 # 라우터 등록
 app.include_router(chat.router, prefix="/api/chat", tags=["chat"])
 app.include_router(upload_time.router, prefix="/api/upload-time", tags=["upload-time"])
+app.include_router(embeddings.router, prefix="/api/embeddings", tags=["embeddings"])
+app.include_router(stats.router, prefix="/api/stats", tags=["stats"])
 
-@app.get("/", response_class=JSONResponse)
+@app.get("/")
 async def root():
     """기본 엔드포인트"""
     return {
@@ -44,13 +104,18 @@ async def root():
             "uploadTime": "/api/upload-time/recommend",
             "weeklyUploadTime": "/api/upload-time/weekly-recommend",
             "uploadStats": "/api/upload-time/stats",
+            "cacheWarmStatus": "/api/upload-time/warm-status",
+            "holidays": "/api/upload-time/holidays",
+            "embeddings": "/api/embeddings",
+            "stats": "/api/stats",
             "health": "/health",
+            "metrics": "/metrics",
             "docs": "/docs"
         },
         "timestamp": datetime.now().isoformat()
     }
 
-@app.get("/health", response_class=JSONResponse)
+@app.get("/health")
 async def health_check():
     """헬스 체크 엔드포인트"""
     return {
@@ -60,22 +125,29 @@ async def health_check():
         "environment": "development" if settings.DEBUG else "production"
     }
 
+@app.get("/metrics", response_class=PlainTextResponse)
+async def get_metrics():
+    """Prometheus 형식 지표 (모든 워커 합산, 다른 워커 값은 최대 METRICS_FLUSH_INTERVAL초 전 값)"""
+    return PlainTextResponse(metrics.render(), media_type="text/plain; version=0.0.4; charset=utf-8")
+
 @app.exception_handler(HTTPException)
 async def http_exception_handler(request, exc):
-    """HTTP 예외 처리"""
-    return JSONResponse(
+    """HTTP 예외 처리 (예외에 붙은 Retry-After 등의 헤더는 그대로 전달)"""
+    return DefaultJSONResponse(
         status_code=exc.status_code,
         content={
             "error": exc.detail,
             "status_code": exc.status_code,
             "timestamp": datetime.now().isoformat()
-        }
+        },
+        headers=getattr(exc, "headers", None)
     )
 
 @app.exception_handler(Exception)
 async def general_exception_handler(request, exc):
     """일반 예외 처리"""
-    return JSONResponse(
+    logger.exception("처리되지 않은 예외", extra={"path": request.url.path})
+    return DefaultJSONResponse(
         status_code=500,
         content={
             "error": "서버 내부 오류가 발생했습니다.",
@@ -0,0 +1,320 @@
+import asyncio
+import json
+import logging
+import math
+import os
+import sys
+import time
+from collections import deque
+from dataclasses import dataclass, fields
+from datetime import datetime
+from typing import Any, Callable, Deque, Dict, Optional
+from urllib.parse import parse_qsl
+
+from fastapi.responses import JSONResponse
+
+# 현재 디렉토리를 Python 경로에 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from config import settings
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class GroupLimits:
+    """
+    경로 그룹별 동시 처리 한도
+
+    - max_concurrency: 동시에 처리할 요청 수 (0이면 제한 없음, 처리 중인 요청 수만 기록)
+    - max_queue: 처리 자리를 기다릴 수 있는 요청 수 (넘으면 바로 거절)
+    - max_queue_wait: 자리를 기다릴 최대 시간 (초, 예상 대기 시간이 이보다 길면 기다리지 않고 바로 거절)
+    """
+    max_concurrency: int = 0
+    max_queue: int = 0
+    max_queue_wait: float = 0.0
+
+
+# 기본 그룹별 한도 (ADMISSION_LIMITS 환경변수로 덮어쓸 수 있음)
+# stats 그룹(통계, 상태, 공휴일 조회)은 가벼운 요청이라 제한 없이 받고 처리 중인 수만 기록합니다.
+DEFAULT_GROUP_LIMITS: Dict[str, GroupLimits] = {
+    "chat": GroupLimits(max_concurrency=32, max_queue=64, max_queue_wait=10),
+    "upload_time": GroupLimits(max_concurrency=16, max_queue=32, max_queue_wait=5),
+    "embeddings": GroupLimits(max_concurrency=8, max_queue=16, max_queue_wait=30),
+    "stats": GroupLimits(),
+}
+
+# 그룹 판단 없이 항상 받는 경로
+EXEMPT_PATHS = ("/", "/health", "/metrics", "/docs", "/redoc", "/openapi.json")
+
+# 그룹에 관계없이 가벼운 조회로 보는 경로 끝부분
+STATS_SUFFIXES = ("/stats", "/warm-status", "/holidays")
+
+# 경로 앞부분별 그룹
+GROUP_PREFIXES = (
+    ("/api/chat", "chat"),
+    ("/api/upload-time", "upload_time"),
+    ("/api/embeddings", "embeddings"),
+)
+
+
+def parse_group_limits(raw: str) -> Dict[str, GroupLimits]:
+    """
+    기본 한도에 JSON 설정을 덮어쓴 그룹별 한도
+
+    예: '{"chat": {"max_concurrency": 64}, "upload_time": {"max_queue_wait": 2}}'
+    """
+    limits = dict(DEFAULT_GROUP_LIMITS)
+    if not raw:
+        return limits
+
+    names = {field.name for field in fields(GroupLimits)}
+    for group, overrides in json.loads(raw).items():
+        base = limits.get(group, GroupLimits())
+        values = {name: getattr(base, name) for name in names}
+        values.update({key: value for key, value in overrides.items() if key in names})
+        limits[group] = GroupLimits(**values)
+    return limits
+
+
+class AdmissionRejected(Exception):
+    """과부하로 요청을 받지 않음"""
+
+    def __init__(self, group: str, reason: str, retry_after: float):
+        super().__init__(f"{group} 요청이 많아 처리하지 않았습니다 ({reason})")
+        self.group = group
+        self.reason = reason
+        self.retry_after = retry_after
+
+
+class _GroupState:
+    """그룹 하나의 처리 중/대기 중 요청과 통계 (워커 프로세스 단위)"""
+
+    # 평균 처리 시간 이동 평균의 가중치
+    SERVICE_TIME_ALPHA = 0.2
+
+    def __init__(self, name: str, limits: GroupLimits):
+        self.name = name
+        self.limits = limits
+        self.in_flight = 0
+        self.waiters: Deque[asyncio.Future] = deque()
+        # 요청 하나를 처리하는 데 걸린 평균 시간 (초, 아직 기록이 없으면 None)
+        self.service_time: Optional[float] = None
+        self.stats = {
+            "admitted": 0,
+            "queued": 0,
+            "bypassed": 0,
+            "rejectedQueueFull": 0,
+            "rejectedQueueLatency": 0,
+            "rejectedQueueTimeout": 0,
+            "queueWaitSeconds": 0.0
+        }
+
+    def estimated_wait(self, position: int) -> float:
+        """대기열 position번째(0부터)로 들어간 요청이 자리를 얻기까지 예상 시간 (초)"""
+        if self.service_time is None or self.limits.max_concurrency <= 0:
+            return 0.0
+        return (position + 1) * self.service_time / self.limits.max_concurrency
+
+    def record_service_time(self, seconds: float) -> None:
+        """처리 시간 기록 (스트리밍 응답은 마지막 청크를 보낼 때까지)"""
+        if self.service_time is None:
+            self.service_time = seconds
+        else:
+            self.service_time += self.SERVICE_TIME_ALPHA * (seconds - self.service_time)
+
+    def release(self) -> None:
+        """처리 자리 반납 (기다리는 요청이 있으면 자리를 그대로 넘김)"""
+        while self.waiters:
+            waiter = self.waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(None)
+                return
+        self.in_flight -= 1
+
+    def snapshot(self) -> Dict[str, Any]:
+        """한도, 현재 처리 중/대기 중 요청 수, 통계"""
+        return {
+            "maxConcurrency": self.limits.max_concurrency,
+            "maxQueue": self.limits.max_queue,
+            "maxQueueWait": self.limits.max_queue_wait,
+            "inFlight": self.in_flight,
+            "waiting": len(self.waiters),
+            "avgServiceSeconds": round(self.service_time, 3) if self.service_time is not None else None,
+            **self.stats,
+            "queueWaitSeconds": round(self.stats["queueWaitSeconds"], 3)
+        }
+
+
+class AdmissionController:
+    """
+    경로 그룹별 요청 수락 제어 (부하 차단)
+
+    그룹마다 동시에 처리할 요청 수를 정해두고, 넘치는 요청은 도착 순서대로 기다리게 합니다.
+    대기열이 가득 찼거나 최근 평균 처리 시간으로 계산한 예상 대기 시간이 max_queue_wait를 넘으면
+    기다리게 하지 않고 바로 503과 Retry-After로 거절하므로, 과부하 때 모든 요청이 함께
+    시간 초과되지 않고 받은 요청만 제 시간에 처리합니다.
+    헬스 체크, 통계 조회와 캐시로 바로 응답할 수 있는 요청은 항상 받습니다.
+    """
+
+    def __init__(self, limits: Dict[str, GroupLimits], enabled: bool = True):
+        self.enabled = enabled
+        self.groups = {name: _GroupState(name, group_limits) for name, group_limits in limits.items()}
+        # 그룹별 "업스트림 호출 없이 바로 응답할 수 있는 요청" 판단 함수 (라우터 기준 경로, 쿼리)
+        self._cheap_checks: Dict[str, Callable[[str, Dict[str, str]], bool]] = {}
+
+    def register_cheap_check(self, group: str, check: Callable[[str, Dict[str, str]], bool]) -> None:
+        """
+        과부하 때도 항상 받을 가벼운 요청 판단 함수 등록
+
+        요청을 받기 전에 이벤트 루프에서 매번 호출되므로 판단 함수는 파일이나 네트워크 I/O 없이 답해야 합니다.
+        """
+        self._cheap_checks[group] = check
+
+    def classify(self, path: str) -> Optional[str]:
+        """
+        요청 경로의 그룹 (항상 받는 경로나 그룹이 없는 경로는 None)
+        """
+        if path in EXEMPT_PATHS or path.startswith("/docs"):
+            return None
+        if path.endswith(STATS_SUFFIXES):
+            return "stats"
+        for prefix, group in GROUP_PREFIXES:
+            if path == prefix or path.startswith(prefix + "/"):
+                return group
+        return None
+
+    def is_cheap(self, group: str, path: str, query_string: bytes) -> bool:
+        """캐시나 규칙으로 바로 응답할 수 있는 요청인지 (판단 중 오류는 일반 요청으로 취급)"""
+        check = self._cheap_checks.get(group)
+        if check is None:
+            return False
+        prefix = next((prefix for prefix, name in GROUP_PREFIXES if name == group), "")
+        try:
+            return check(path[len(prefix):], dict(parse_qsl(query_string.decode("latin-1"))))
+        except Exception as error:
+            logger.warning("요청 수락 판단 오류", extra={"group": group, "path": path, "error": str(error)})
+            return False
+
+    async def acquire(self, group: str) -> None:
+        """
+        그룹의 처리 자리 확보 (자리가 없으면 예상 대기 시간 안에서 도착 순서대로 대기)
+
+        Raises:
+            AdmissionRejected: 대기열이 가득 찼거나 예상/실제 대기 시간이 max_queue_wait를 넘는 경우
+        """
+        state = self.groups[group]
+        limits = state.limits
+        if limits.max_concurrency <= 0 or state.in_flight < limits.max_concurrency and not state.waiters:
+            state.in_flight += 1
+            state.stats["admitted"] += 1
+            return
+
+        position = len(state.waiters)
+        estimated = state.estimated_wait(position)
+        if position >= limits.max_queue:
+            state.stats["rejectedQueueFull"] += 1
+            raise AdmissionRejected(group, "대기열 가득 참", max(estimated, 1.0))
+        if estimated > limits.max_queue_wait:
+            state.stats["rejectedQueueLatency"] += 1
+            raise AdmissionRejected(group, f"예상 대기 {estimated:.1f}초", estimated)
+
+        waiter = asyncio.get_running_loop().create_future()
+        state.waiters.append(waiter)
+        state.stats["queued"] += 1
+        started = time.monotonic()
+        try:
+            await asyncio.wait_for(asyncio.shield(waiter), timeout=limits.max_queue_wait)
+        except asyncio.TimeoutError:
+            # 시간 초과와 동시에 자리를 넘겨받았으면 그대로 처리
+            if not (waiter.done() and not waiter.cancelled()):
+                waiter.cancel()
+                state.waiters.remove(waiter)
+                state.stats["rejectedQueueTimeout"] += 1
+                raise AdmissionRejected(group, "대기 시간 초과", max(state.estimated_wait(len(state.waiters)), 1.0))
+        except asyncio.CancelledError:
+            # 자리를 넘겨받은 뒤 취소되었으면 다음 요청에게 넘김
+            if waiter.done() and not waiter.cancelled():
+                state.release()
+            else:
+                waiter.cancel()
+                state.waiters.remove(waiter)
+            raise
+        finally:
+            state.stats["queueWaitSeconds"] += time.monotonic() - started
+        state.stats["admitted"] += 1
+
+    def release(self, group: str, service_seconds: float) -> None:
+        """처리 자리 반납과 처리 시간 기록"""
+        state = self.groups[group]
+        state.record_service_time(service_seconds)
+        state.release()
+
+    def snapshot(self) -> Dict[str, Any]:
+        """그룹별 한도와 현재 상태 (워커 프로세스 단위)"""
+        if not self.enabled:
+            return {"enabled": False}
+        return {name: state.snapshot() for name, state in self.groups.items()}
+
+
+class AdmissionMiddleware:
+    """
+    요청 수락 제어 ASGI 미들웨어
+
+    스트리밍 응답도 마지막 청크를 보낼 때까지 처리 중으로 셉니다.
+    CORS 헤더가 거절 응답에도 붙도록 CORSMiddleware보다 먼저(안쪽에) 등록합니다.
+    """
+
+    def __init__(self, app, controller: "AdmissionController"):
+        self.app = app
+        self.controller = controller
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        path = scope["path"]
+        group = self.controller.classify(path) if self.controller.enabled else None
+        state = self.controller.groups.get(group) if group else None
+        if state is None:
+            await self.app(scope, receive, send)
+            return
+
+        if state.limits.max_concurrency > 0 and self.controller.is_cheap(group, path, scope.get("query_string", b"")):
+            state.stats["bypassed"] += 1
+            await self.app(scope, receive, send)
+            return
+
+        try:
+            await self.controller.acquire(group)
+        except AdmissionRejected as rejected:
+            retry_after = max(1, math.ceil(rejected.retry_after))
+            logger.warning(
+                "과부하로 요청 거절",
+                extra={"group": rejected.group, "reason": rejected.reason, "retryAfter": retry_after}
+            )
+            response = JSONResponse(
+                status_code=503,
+                content={
+                    "error": "요청이 많아 잠시 후 다시 시도해주세요.",
+                    "status_code": 503,
+                    "timestamp": datetime.now().isoformat()
+                },
+                headers={"Retry-After": str(retry_after)}
+            )
+            await response(scope, receive, send)
+            return
+
+        started = time.monotonic()
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            self.controller.release(group, time.monotonic() - started)
+
+
+# 워커 프로세스 전역 요청 수락 제어기
+admission_controller = AdmissionController(
+    parse_group_limits(settings.ADMISSION_LIMITS),
+    enabled=settings.ADMISSION_CONTROL_ENABLED
+)
@@ -0,0 +1,111 @@
+import gzip
+import os
+import sys
+from typing import Optional
+
+try:
+    import brotli
+except ImportError:  # 설치되어 있지 않으면 gzip만 사용
+    brotli = None
+
+from starlette.datastructures import Headers, MutableHeaders
+
+# 현재 디렉토리를 Python 경로에 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from services.metrics import metrics
+
+# 압축할 응답 형식 (벡터 바이트처럼 잘 줄지 않는 형식과 SSE 스트림은 제외)
+COMPRESSIBLE_TYPES = ("application/json", "application/jsonl", "text/plain", "text/html", "text/csv")
+
+
+def negotiate_encoding(accept_encoding: str, brotli_available: bool = True) -> Optional[str]:
+    """
+    Accept-Encoding 헤더에서 사용할 압축 방식 선택 (br을 gzip보다 우선, q=0은 거절로 처리)
+
+    Returns:
+        "br", "gzip" 또는 None (압축하지 않음)
+    """
+    accepted = {}
+    for part in accept_encoding.split(","):
+        name, _, params = part.strip().partition(";")
+        quality = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                quality = float(params[2:])
+            except ValueError:
+                quality = 0.0
+        if name:
+            accepted[name.strip().lower()] = quality
+
+    wildcard = accepted.get("*", 0.0)
+    if brotli_available and accepted.get("br", wildcard) > 0:
+        return "br"
+    if accepted.get("gzip", wildcard) > 0:
+        return "gzip"
+    return None
+
+
+class CompressionMiddleware:
+    """
+    응답 압축 ASGI 미들웨어 (brotli/gzip 협상)
+
+    본문을 한 번에 보내는 응답 중 형식이 JSON/텍스트이고 minimum_size 바이트 이상인 것만 압축합니다.
+    본문을 여러 번에 나눠 보내는 스트리밍 응답(SSE 등)은 지연이 생기지 않도록 그대로 보냅니다.
+    """
+
+    def __init__(self, app, minimum_size: int = 1024, gzip_level: int = 6, brotli_quality: int = 4):
+        self.app = app
+        self.minimum_size = minimum_size
+        self.gzip_level = gzip_level
+        self.brotli_quality = brotli_quality
+
+    def compress(self, body: bytes, encoding: str) -> bytes:
+        if encoding == "br":
+            return brotli.compress(body, quality=self.brotli_quality)
+        return gzip.compress(body, compresslevel=self.gzip_level, mtime=0)
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        encoding = negotiate_encoding(Headers(scope=scope).get("accept-encoding", ""), brotli is not None)
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+
+        pending = {"start": None}
+
+        async def send_compressed(message):
+            # 응답 시작은 첫 본문을 보고 압축 여부를 정할 때까지 보류
+            if message["type"] == "http.response.start":
+                pending["start"] = message
+                return
+            start = pending["start"]
+            if start is None or message["type"] != "http.response.body":
+                await send(message)
+                return
+            pending["start"] = None
+
+            headers = MutableHeaders(raw=list(start.get("headers", [])))
+            content_type = headers.get("content-type", "")
+            compressible = content_type.startswith(COMPRESSIBLE_TYPES) and "content-encoding" not in headers
+            if compressible:
+                headers.add_vary_header("Accept-Encoding")
+            body = message.get("body", b"")
+            if not compressible or message.get("more_body", False) or len(body) < self.minimum_size:
+                await send({**start, "headers": headers.raw})
+                await send(message)
+                return
+
+            compressed = self.compress(body, encoding)
+            headers["Content-Encoding"] = encoding
+            headers["Content-Length"] = str(len(compressed))
+            metrics.inc("http_compressed_response_bytes_total", len(body), encoding=encoding, stage="original")
+            metrics.inc("http_compressed_response_bytes_total", len(compressed), encoding=encoding, stage="compressed")
+            await send({**start, "headers": headers.raw})
+            await send({**message, "body": compressed})
+
+        await self.app(scope, receive, send_compressed)
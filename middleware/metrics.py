@@ -0,0 +1,63 @@
+import os
+import sys
+import time
+from typing import Any, Callable, Dict
+
+# 현재 디렉토리를 Python 경로에 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from middleware.admission import admission_controller
+from services.metrics import metrics
+
+
+class MetricsMiddleware:
+    """
+    HTTP 요청 지표 ASGI 미들웨어
+
+    경로 그룹별 처리 중인 요청 수와, 라우트 경로 템플릿(예: /api/chat/message)별 처리 시간을 기록합니다.
+    레이블 수가 늘어나지 않도록 실제 경로 대신 템플릿을 쓰고, 일치하는 라우트가 없으면 unmatched로 기록합니다.
+    """
+
+    def __init__(self, app):
+        self.app = app
+        # 엔드포인트 함수 -> 경로 템플릿 (첫 요청에서 앱 라우트로 만듦)
+        self._route_paths: Dict[Callable[..., Any], str] = {}
+
+    def _route_path(self, scope) -> str:
+        """요청이 처리된 라우트의 경로 템플릿"""
+        endpoint = scope.get("endpoint")
+        if endpoint is None:
+            return "unmatched"
+        path = self._route_paths.get(endpoint)
+        if path is None:
+            for route in scope["app"].routes:
+                self._route_paths.setdefault(getattr(route, "endpoint", None), getattr(route, "path", ""))
+            path = self._route_paths.get(endpoint, "unmatched")
+        return path
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        group = admission_controller.classify(scope["path"]) or "other"
+        status = {"code": 500}
+
+        async def send_with_status(message):
+            if message["type"] == "http.response.start":
+                status["code"] = message["status"]
+            await send(message)
+
+        metrics.gauge_add("http_requests_in_flight", 1, group=group)
+        started = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            metrics.gauge_add("http_requests_in_flight", -1, group=group)
+            metrics.observe(
+                "http_request_duration_seconds",
+                time.perf_counter() - started,
+                route=self._route_path(scope),
+                method=scope["method"],
+                status=status["code"]
+            )
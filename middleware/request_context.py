@@ -0,0 +1,70 @@
+import logging
+import os
+import re
+import sys
+import time
+import uuid
+
+# 현재 디렉토리를 Python 경로에 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from services.structured_logging import request_id_var
+
+logger = logging.getLogger(__name__)
+
+REQUEST_ID_HEADER = "x-request-id"
+# 클라이언트가 보낸 요청 ID는 이 형식일 때만 그대로 사용 (로그 오염 방지)
+_VALID_REQUEST_ID = re.compile(r"^[A-Za-z0-9._:-]{1,128}$")
+
+
+class RequestContextMiddleware:
+    """
+    요청 상관관계 ID ASGI 미들웨어
+
+    X-Request-ID 헤더가 있으면 그 값을, 없으면 새 ID를 요청 컨텍스트에 설정해
+    요청을 처리하며 남기는 모든 로그에 requestId로 붙이고, 응답 헤더로도 돌려줍니다.
+    요청이 끝나면 처리 결과 로그를 남깁니다 (5xx가 아니면 샘플링).
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        request_id = None
+        for name, value in scope["headers"]:
+            if name == REQUEST_ID_HEADER.encode("latin-1"):
+                candidate = value.decode("latin-1")
+                if _VALID_REQUEST_ID.match(candidate):
+                    request_id = candidate
+                break
+        request_id = request_id or uuid.uuid4().hex
+        token = request_id_var.set(request_id)
+        status = {"code": 500}
+
+        async def send_with_request_id(message):
+            if message["type"] == "http.response.start":
+                status["code"] = message["status"]
+                message["headers"] = list(message.get("headers", [])) + [
+                    (REQUEST_ID_HEADER.encode("latin-1"), request_id.encode("latin-1"))
+                ]
+            await send(message)
+
+        started = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_with_request_id)
+        finally:
+            logger.info(
+                "요청 처리 완료",
+                extra={
+                    "method": scope["method"],
+                    "path": scope["path"],
+                    "status": status["code"],
+                    "durationMs": round((time.perf_counter() - started) * 1000, 1),
+                    "sample": status["code"] < 500
+                }
+            )
+            request_id_var.reset(token)
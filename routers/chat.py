@@ -1,17 +1,42 @@
-from fastapi import APIRouter, HTTPException
-from pydantic import BaseModel, Field
-from typing import Optional, List, Dict, Any
+from fastapi import APIRouter, Header, HTTPException, Request
+from fastapi.responses import Response, StreamingResponse
+from pydantic import BaseModel, Field, field_validator
+from typing import Optional, List, Dict, Any, Tuple
+from typing_extensions import TypedDict
 from datetime import datetime
+import asyncio
+import logging
+import math
 import sys
 import os
 
 # 현재 디렉토리를 Python 경로에 추가
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from services.openai_service import OpenAIService
+from services.openai_service import openai_service
+from services.history_compactor import history_compactor
+from services.semantic_cache import semantic_cache
+from services.chat_batch import add_usage, build_batch_jsonl, empty_usage, parse_batch_output
+from services.resilience import classify_error
+from services.structured_logging import truncate
+from routers.streaming import sse_event, SSE_MEDIA_TYPE, SSE_HEADERS
 from config import settings
 
 router = APIRouter()
+logger = logging.getLogger(__name__)
+
+def validate_model_name(model: Optional[str]) -> Optional[str]:
+    """모델 목록 캐시로 OpenAI가 거절할 모델 이름을 호출 전에 걸러냄"""
+    if model is not None and settings.MODEL_VALIDATION_ENABLED and not openai_service.model_catalog.is_available(model):
+        raise ValueError(f"사용할 수 없는 모델입니다: {model} (/api/chat/models에서 목록을 확인해주세요)")
+    return model
+
+def cache_bypassed(cache_control: Optional[str]) -> bool:
+    """Cache-Control 요청 헤더에 no-cache나 no-store가 있으면 응답 캐시를 거치지 않음"""
+    if not cache_control:
+        return False
+    directives = {directive.strip().lower() for directive in cache_control.split(",")}
+    return bool(directives & {"no-cache", "no-store"})
 
 # Pydantic 모델 정의
 class ChatMessage(BaseModel):
@@ -20,6 +45,11 @@ class ChatMessage(BaseModel):
     max_tokens: Optional[int] = Field(default=settings.MAX_TOKENS, description="최대 토큰 수", ge=1, le=8000)
     temperature: Optional[float] = Field(default=settings.TEMPERATURE, description="온도 설정", ge=0.0, le=2.0)
 
+    @field_validator("model")
+    @classmethod
+    def check_model(cls, model: Optional[str]) -> Optional[str]:
+        return validate_model_name(model)
+
 class ConversationMessage(BaseModel):
     role: str = Field(..., description="메시지 역할 (user, assistant, system)")
     content: str = Field(..., description="메시지 내용", min_length=1, max_length=4000)
@@ -30,18 +60,203 @@ class ConversationRequest(BaseModel):
     max_tokens: Optional[int] = Field(default=settings.MAX_TOKENS, description="최대 토큰 수", ge=1, le=8000)
     temperature: Optional[float] = Field(default=settings.TEMPERATURE, description="온도 설정", ge=0.0, le=2.0)
 
+    @field_validator("model")
+    @classmethod
+    def check_model(cls, model: Optional[str]) -> Optional[str]:
+        return validate_model_name(model)
+
+class BatchChatRequest(BaseModel):
+    items: List[ChatMessage] = Field(
+        ..., description="요청 목록 (각 항목은 /message 요청과 같은 형식)",
+        min_length=1, max_length=settings.CHAT_BATCH_MAX_ITEMS
+    )
+    concurrency: Optional[int] = Field(
+        default=settings.CHAT_BATCH_CONCURRENCY, description="동시에 처리할 항목 수",
+        ge=1, le=settings.CHAT_BATCH_CONCURRENCY
+    )
+
 class ChatResponse(BaseModel):
     success: bool
     data: Dict[str, Any]
     timestamp: str
 
-# OpenAI 서비스 인스턴스
-openai_service = OpenAIService()
+# 응답 모델 (자주 호출되는 /message, /conversation은 필드를 정해 두어 검증과 직렬화가 빠름)
+# 안쪽 구조는 모델 객체를 만들지 않도록 TypedDict로 정의 (없는 키는 응답에서도 빠짐)
+class Usage(TypedDict):
+    prompt_tokens: int
+    completion_tokens: int
+    total_tokens: int
+
+class CacheStatus(TypedDict, total=False):
+    semantic: str  # 의미 기반 캐시 결과 (hit, miss, disabled, bypass)
+    similarity: float  # 의미 기반 캐시 적중 시 코사인 유사도
+    exact: str  # 응답 캐시 결과 (hit, miss, bypass)
+
+class HistoryCompaction(TypedDict):
+    compacted: bool
+    originalTokens: int
+    sentTokens: int
+    tokensSaved: int
+    summaryTokens: int
+    summarizedMessages: int
+    summaryCached: bool
+
+class ChatMessageData(BaseModel):
+    message: Optional[str]
+    model: str
+    usage: Usage
+    cache: CacheStatus
+    timestamp: str
+
+class ConversationData(ChatMessageData):
+    compaction: Optional[HistoryCompaction]
 
-@router.post("/message", response_model=ChatResponse)
-async def chat_message(request: ChatMessage):
+class ChatMessageResponse(BaseModel):
+    success: bool
+    data: ChatMessageData
+    timestamp: str
+
+class ConversationResponse(BaseModel):
+    success: bool
+    data: ConversationData
+    timestamp: str
+
+# 오류 종류별 사용자 안내 메시지
+ERROR_MESSAGES = {
+    "quota": "API 할당량이 부족합니다. OpenAI API 할당량을 확인해주세요.",
+    "auth": "유효하지 않은 API 키입니다. OpenAI API 키를 확인해주세요.",
+    "rate_limit": "API 요청 한도를 초과했습니다. 잠시 후 다시 시도해주세요.",
+    "throttled": "요청이 많아 처리 대기 시간을 초과했습니다. 잠시 후 다시 시도해주세요.",
+    "timeout": "ChatGPT 응답 시간이 초과되었습니다. 잠시 후 다시 시도해주세요.",
+    "connection": "ChatGPT 서버에 연결할 수 없습니다. 잠시 후 다시 시도해주세요.",
+    "server": "ChatGPT 서버에 일시적인 오류가 발생했습니다. 잠시 후 다시 시도해주세요.",
+    "circuit_open": "ChatGPT 서버 장애로 요청을 잠시 중단했습니다. 잠시 후 다시 시도해주세요.",
+    "not_found": "요청한 모델을 찾을 수 없습니다.",
+}
+
+def to_http_exception(error: Exception) -> HTTPException:
+    """
+    OpenAI API 오류를 종류별로 분류해 HTTP 예외로 변환
+    """
+    classification = classify_error(error)
+
+    if classification.kind == "bad_request":
+        return HTTPException(
+            status_code=400,
+            detail=f"잘못된 요청입니다: {str(error)}"
+        )
+
+    if classification.kind in ERROR_MESSAGES:
+        headers = None
+        if classification.retry_after is not None:
+            headers = {"Retry-After": str(max(1, math.ceil(classification.retry_after)))}
+        return HTTPException(
+            status_code=classification.status_code,
+            detail=ERROR_MESSAGES[classification.kind],
+            headers=headers
+        )
+    
+    # 기타 오류
+    return HTTPException(
+        status_code=500,
+        detail=f"ChatGPT API 호출 중 오류가 발생했습니다: {str(error)}"
+    )
+
+async def prepare_history(messages: List[ConversationMessage]) -> Tuple[List[Dict[str, str]], Optional[Dict[str, Any]]]:
+    """
+    대화 히스토리를 OpenAI 메시지 형식으로 바꾸고 토큰 예산에 맞게 압축
+
+    Returns:
+        (보낼 메시지 목록, 압축 정보 - 압축을 끈 경우 None)
+    """
+    history = [{"role": msg.role, "content": msg.content} for msg in messages]
+    if not settings.HISTORY_COMPACTION_ENABLED:
+        return history, None
+
+    history, compaction = await history_compactor.compact(history)
+    if compaction["compacted"]:
+        logger.info(
+            "대화 히스토리 압축",
+            extra={
+                "originalTokens": compaction["originalTokens"],
+                "sentTokens": compaction["sentTokens"],
+                "summarizedMessages": compaction["summarizedMessages"]
+            }
+        )
+    return history, compaction
+
+def validate_roles(messages: List[ConversationMessage]) -> None:
+    """
+    대화 메시지 역할 검증
+    """
+    for msg in messages:
+        if msg.role not in ["user", "assistant", "system"]:
+            raise HTTPException(
+                status_code=400,
+                detail="메시지 역할은 'user', 'assistant', 'system' 중 하나여야 합니다."
+            )
+
+async def stream_chat_response(
+    messages: List[Dict[str, str]],
+    model: Optional[str],
+    max_tokens: Optional[int],
+    temperature: Optional[float],
+    route: str,
+    compaction: Optional[Dict[str, Any]] = None
+) -> StreamingResponse:
+    """
+    ChatGPT 응답을 SSE로 스트리밍
+
+    첫 이벤트를 받기 전에 발생한 오류는 일반 HTTP 오류로 응답하고,
+    스트리밍 도중 발생한 오류는 error 이벤트로 전달한 뒤 스트림을 종료합니다.
+    이벤트: delta (토큰 조각), done (모델, 사용량, 히스토리 압축 정보), error (오류)
+    """
+    events = openai_service.stream_chat_completion(
+        messages=messages,
+        model=model,
+        max_tokens=max_tokens,
+        temperature=temperature,
+        route=route
+    )
+
+    try:
+        first_event = await events.__anext__()
+    except Exception as error:
+        logger.error("ChatGPT 스트리밍 오류", extra={"error": str(error)})
+        raise to_http_exception(error)
+
+    async def event_stream():
+        try:
+            yield sse_event(first_event["type"], first_event)
+            async for event in events:
+                if event["type"] == "done" and compaction is not None:
+                    event = {**event, "compaction": compaction}
+                yield sse_event(event["type"], event)
+            logger.debug("ChatGPT 스트리밍 응답 성공")
+        except Exception as error:
+            logger.error("ChatGPT 스트리밍 중 오류", extra={"error": str(error)})
+            http_error = to_http_exception(error)
+            yield sse_event("error", {
+                "type": "error",
+                "error": http_error.detail,
+                "status_code": http_error.status_code
+            })
+        finally:
+            await events.aclose()
+
+    return StreamingResponse(
+        event_stream(),
+        media_type=SSE_MEDIA_TYPE,
+        headers=SSE_HEADERS
+    )
+
+@router.post("/message", response_model=ChatMessageResponse)
+async def chat_message(request: ChatMessage, cache_control: Optional[str] = Header(default=None)):
     """
     ChatGPT와 단일 메시지로 대화
+
+    temperature가 0이면 같은 요청의 응답을 응답 캐시에서 돌려줍니다.
+    Cache-Control: no-cache (또는 no-store) 헤더를 보내면 응답 캐시와 의미 기반 캐시를 모두 거치지 않습니다.
     
     - **message**: 사용자 메시지 (필수)
     - **model**: 사용할 GPT 모델 (기본값: gpt-4o)
@@ -49,62 +264,78 @@ async def chat_message(request: ChatMessage):
     - **temperature**: 온도 설정 (기본값: 0.7)
     """
     try:
-        print(f"📨 받은 메시지: {request.message}")
-        print(f"🤖 사용할 모델: {request.model}")
+        logger.info(
+            "메시지 요청",
+            extra={"model": request.model, "messagePreview": truncate(request.message, settings.LOG_MAX_BODY_CHARS)}
+        )
+
+        model = request.model or settings.DEFAULT_MODEL
+        temperature = settings.TEMPERATURE if request.temperature is None else request.temperature
+        bypass = cache_bypassed(cache_control)
+        cache = {"semantic": "bypass" if bypass else "disabled"}
+
+        # 비슷한 질문에 저장된 답변이 있으면 ChatGPT를 호출하지 않음
+        use_semantic = semantic_cache.enabled and not bypass
+        vector = await semantic_cache.embed_message(request.message) if use_semantic else None
+        if vector is not None:
+            cached = semantic_cache.lookup(vector, model, temperature)
+            if cached is not None:
+                response, similarity = cached
+                logger.info("의미 기반 캐시 적중", extra={"model": model, "similarity": round(similarity, 4)})
+                timestamp = datetime.now().isoformat()
+                return ChatMessageResponse(
+                    success=True,
+                    data={
+                        "message": response["message"],
+                        "model": response["model"],
+                        "usage": {"prompt_tokens": 0, "completion_tokens": 0, "total_tokens": 0},
+                        "cache": {"semantic": "hit", "similarity": round(similarity, 4)},
+                        "timestamp": timestamp
+                    },
+                    timestamp=timestamp
+                )
+            cache = {"semantic": "miss"}
         
         # ChatGPT API 호출
         response = await openai_service.chat_with_gpt(
             message=request.message,
-            model=request.model,
+            model=model,
             max_tokens=request.max_tokens,
-            temperature=request.temperature
+            temperature=temperature,
+            route="chat",
+            cache=False if bypass else None
         )
         
-        print("✅ ChatGPT 응답 성공")
+        logger.debug("ChatGPT 응답 성공")
+        cache["exact"] = response["cache"]
+
+        # hedging으로 빠른 모델이 대신 답한 결과는 요청한 모델의 답으로 저장하지 않음
+        if vector is not None and not response["hedged"]:
+            semantic_cache.store(vector, model, temperature, {"message": response["message"], "model": response["model"]})
         
-        return ChatResponse(
+        timestamp = datetime.now().isoformat()
+        return ChatMessageResponse(
             success=True,
             data={
                 "message": response["message"],
                 "model": response["model"],
                 "usage": response["usage"],
-                "timestamp": datetime.now().isoformat()
+                "cache": cache,
+                "timestamp": timestamp
             },
-            timestamp=datetime.now().isoformat()
+            timestamp=timestamp
         )
         
     except Exception as error:
-        print(f"❌ ChatGPT API 오류: {error}")
-        
-        # OpenAI API 오류 처리
-        if "insufficient_quota" in str(error).lower():
-            raise HTTPException(
-                status_code=402,
-                detail="API 할당량이 부족합니다. OpenAI API 할당량을 확인해주세요."
-            )
-        
-        if "invalid_api_key" in str(error).lower():
-            raise HTTPException(
-                status_code=401,
-                detail="유효하지 않은 API 키입니다. OpenAI API 키를 확인해주세요."
-            )
-        
-        if "rate_limit_exceeded" in str(error).lower():
-            raise HTTPException(
-                status_code=429,
-                detail="API 요청 한도를 초과했습니다. 잠시 후 다시 시도해주세요."
-            )
-        
-        # 기타 오류
-        raise HTTPException(
-            status_code=500,
-            detail=f"ChatGPT API 호출 중 오류가 발생했습니다: {str(error)}"
-        )
+        logger.error("ChatGPT API 오류", extra={"error": str(error)})
+        raise to_http_exception(error)
 
-@router.post("/conversation", response_model=ChatResponse)
-async def chat_conversation(request: ConversationRequest):
+@router.post("/conversation", response_model=ConversationResponse)
+async def chat_conversation(request: ConversationRequest, cache_control: Optional[str] = Header(default=None)):
     """
     대화 히스토리와 함께 ChatGPT와 대화
+
+    temperature가 0이면 같은 대화의 응답을 응답 캐시에서 돌려줍니다 (Cache-Control: no-cache로 끌 수 있음).
     
     - **messages**: 대화 히스토리 배열 (필수)
     - **model**: 사용할 GPT 모델 (기본값: gpt-4o)
@@ -112,67 +343,231 @@ async def chat_conversation(request: ConversationRequest):
     - **temperature**: 온도 설정 (기본값: 0.7)
     """
     try:
-        print(f"📨 받은 대화: {len(request.messages)}개 메시지")
-        print(f"🤖 사용할 모델: {request.model}")
+        logger.info("대화 요청", extra={"model": request.model, "messages": len(request.messages)})
         
         # 메시지 형식 검증
-        for msg in request.messages:
-            if msg.role not in ["user", "assistant", "system"]:
-                raise HTTPException(
-                    status_code=400,
-                    detail="메시지 역할은 'user', 'assistant', 'system' 중 하나여야 합니다."
-                )
+        validate_roles(request.messages)
         
+        # 토큰 예산을 넘는 이전 대화는 요약으로 압축
+        messages, compaction = await prepare_history(request.messages)
+
         # ChatGPT API 호출 (대화 히스토리 포함)
         response = await openai_service.chat_with_history(
-            messages=[{"role": msg.role, "content": msg.content} for msg in request.messages],
+            messages=messages,
             model=request.model,
             max_tokens=request.max_tokens,
-            temperature=request.temperature
+            temperature=request.temperature,
+            route="conversation",
+            cache=False if cache_bypassed(cache_control) else None
         )
         
-        print("✅ ChatGPT 응답 성공")
+        logger.debug("ChatGPT 응답 성공")
         
-        return ChatResponse(
+        timestamp = datetime.now().isoformat()
+        return ConversationResponse(
             success=True,
             data={
                 "message": response["message"],
                 "model": response["model"],
                 "usage": response["usage"],
-                "timestamp": datetime.now().isoformat()
+                "compaction": compaction,
+                "cache": {"exact": response["cache"]},
+                "timestamp": timestamp
             },
-            timestamp=datetime.now().isoformat()
+            timestamp=timestamp
         )
         
     except HTTPException:
         raise
     except Exception as error:
-        print(f"❌ ChatGPT API 오류: {error}")
-        
-        # OpenAI API 오류 처리
-        if "insufficient_quota" in str(error).lower():
-            raise HTTPException(
-                status_code=402,
-                detail="API 할당량이 부족합니다. OpenAI API 할당량을 확인해주세요."
-            )
-        
-        if "invalid_api_key" in str(error).lower():
-            raise HTTPException(
-                status_code=401,
-                detail="유효하지 않은 API 키입니다. OpenAI API 키를 확인해주세요."
-            )
-        
-        if "rate_limit_exceeded" in str(error).lower():
-            raise HTTPException(
-                status_code=429,
-                detail="API 요청 한도를 초과했습니다. 잠시 후 다시 시도해주세요."
+        logger.error("ChatGPT API 오류", extra={"error": str(error)})
+        raise to_http_exception(error)
+
+@router.post("/message/stream")
+async def chat_message_stream(request: ChatMessage):
+    """
+    ChatGPT와 단일 메시지로 대화 (SSE 스트리밍)
+
+    토큰이 생성되는 대로 delta 이벤트로 전달하고, 마지막에 done 이벤트로 모델과 사용량을 전달합니다.
+
+    - **message**: 사용자 메시지 (필수)
+    - **model**: 사용할 GPT 모델 (기본값: gpt-4o)
+    - **max_tokens**: 최대 토큰 수 (기본값: 4000)
+    - **temperature**: 온도 설정 (기본값: 0.7)
+    """
+    logger.info(
+        "메시지 스트리밍 요청",
+        extra={"model": request.model, "messagePreview": truncate(request.message, settings.LOG_MAX_BODY_CHARS)}
+    )
+
+    return await stream_chat_response(
+        messages=[{"role": "user", "content": request.message}],
+        model=request.model,
+        max_tokens=request.max_tokens,
+        temperature=request.temperature,
+        route="chat"
+    )
+
+@router.post("/conversation/stream")
+async def chat_conversation_stream(request: ConversationRequest):
+    """
+    대화 히스토리와 함께 ChatGPT와 대화 (SSE 스트리밍)
+
+    토큰이 생성되는 대로 delta 이벤트로 전달하고, 마지막에 done 이벤트로 모델과 사용량을 전달합니다.
+
+    - **messages**: 대화 히스토리 배열 (필수)
+    - **model**: 사용할 GPT 모델 (기본값: gpt-4o)
+    - **max_tokens**: 최대 토큰 수 (기본값: 4000)
+    - **temperature**: 온도 설정 (기본값: 0.7)
+    """
+    logger.info("대화 스트리밍 요청", extra={"model": request.model, "messages": len(request.messages)})
+
+    validate_roles(request.messages)
+
+    messages, compaction = await prepare_history(request.messages)
+
+    return await stream_chat_response(
+        messages=messages,
+        model=request.model,
+        max_tokens=request.max_tokens,
+        temperature=request.temperature,
+        route="conversation",
+        compaction=compaction
+    )
+
+async def run_batch_item(index: int, item: ChatMessage, semaphore: asyncio.Semaphore) -> Dict[str, Any]:
+    """
+    일괄 요청 항목 하나 처리 (실패해도 예외 대신 항목별 오류로 반환)
+    """
+    async with semaphore:
+        try:
+            response = await openai_service.chat_with_gpt(
+                message=item.message,
+                model=item.model,
+                max_tokens=item.max_tokens,
+                temperature=item.temperature,
+                route="chat"
             )
-        
-        # 기타 오류
-        raise HTTPException(
-            status_code=500,
-            detail=f"ChatGPT API 호출 중 오류가 발생했습니다: {str(error)}"
-        )
+        except Exception as error:
+            http_error = to_http_exception(error)
+            return {"index": index, "success": False, "error": http_error.detail, "status_code": http_error.status_code}
+
+    return {
+        "index": index,
+        "success": True,
+        "message": response["message"],
+        "model": response["model"],
+        "usage": response["usage"]
+    }
+
+@router.post("/batch", response_model=ChatResponse)
+async def chat_batch(request: BatchChatRequest):
+    """
+    서로 관련 없는 여러 메시지를 한 번에 처리 (예: 동영상 여러 개의 제목 생성)
+
+    항목을 최대 concurrency개씩 동시에 ChatGPT로 보내고, 요청 순서대로 결과를 반환합니다.
+    일부 항목이 실패해도 나머지 결과는 그대로 반환하며, 실패한 항목에는 error와 status_code가 담깁니다.
+
+    - **items**: /message 요청과 같은 형식의 요청 목록 (최대 CHAT_BATCH_MAX_ITEMS개)
+    - **concurrency**: 동시에 처리할 항목 수 (기본값/최댓값: CHAT_BATCH_CONCURRENCY)
+    """
+    logger.info("일괄 메시지 요청", extra={"items": len(request.items), "concurrency": request.concurrency})
+
+    semaphore = asyncio.Semaphore(request.concurrency)
+    results = await asyncio.gather(
+        *(run_batch_item(index, item, semaphore) for index, item in enumerate(request.items))
+    )
+
+    usage = empty_usage()
+    for result in results:
+        if result["success"]:
+            add_usage(usage, result["usage"])
+    succeeded = sum(1 for result in results if result["success"])
+    if succeeded < len(results):
+        logger.warning("일괄 메시지 일부 실패", extra={"items": len(results), "failed": len(results) - succeeded})
+
+    timestamp = datetime.now().isoformat()
+    return ChatResponse(
+        success=succeeded > 0,
+        data={
+            "results": results,
+            "usage": usage,
+            "succeeded": succeeded,
+            "failed": len(results) - succeeded,
+            "timestamp": timestamp
+        },
+        timestamp=timestamp
+    )
+
+@router.post("/batch/offline")
+async def create_offline_batch(request: BatchChatRequest):
+    """
+    급하지 않은 대량 요청용 OpenAI Batch API 입력 파일(JSONL) 생성
+
+    OpenAI 호출 없이 항목마다 custom_id가 item-<순서>인 /v1/chat/completions 요청 한 줄씩을 담아 반환합니다.
+    이 파일을 OpenAI Batch API에 올리고, 받은 결과 파일을 /batch/offline/results로 보내면
+    /batch와 같은 형식의 결과로 정리됩니다. concurrency는 무시합니다.
+    """
+    items = [
+        {
+            "message": item.message,
+            "model": item.model or settings.DEFAULT_MODEL,
+            "max_tokens": item.max_tokens or settings.MAX_TOKENS,
+            "temperature": settings.TEMPERATURE if item.temperature is None else item.temperature
+        }
+        for item in request.items
+    ]
+    logger.info("일괄 메시지 오프라인 파일 생성", extra={"items": len(items)})
+
+    return Response(
+        content=build_batch_jsonl(items),
+        media_type="application/jsonl",
+        headers={"Content-Disposition": 'attachment; filename="chat_batch_input.jsonl"'}
+    )
+
+async def read_limited_body(request: Request, max_bytes: int) -> bytes:
+    """
+    요청 본문을 max_bytes까지만 읽음 (Content-Length가 없어도 받는 도중에 끊음)
+
+    Raises:
+        HTTPException: 본문이 max_bytes를 넘는 경우 (413)
+    """
+    too_large = HTTPException(status_code=413, detail=f"요청 본문이 너무 큽니다 (최대 {max_bytes}바이트).")
+    content_length = request.headers.get("content-length")
+    if content_length and content_length.isdigit() and int(content_length) > max_bytes:
+        raise too_large
+
+    chunks = []
+    size = 0
+    async for chunk in request.stream():
+        size += len(chunk)
+        if size > max_bytes:
+            raise too_large
+        chunks.append(chunk)
+    return b"".join(chunks)
+
+@router.post("/batch/offline/results", response_model=ChatResponse)
+async def read_offline_batch_results(request: Request):
+    """
+    OpenAI Batch API 결과 파일(JSONL)을 /batch와 같은 형식으로 정리
+
+    요청 본문에 결과 파일 내용을 그대로 보냅니다 (오류 파일을 이어 붙여도 됩니다).
+    결과는 custom_id 순서대로 정렬되며, 결과가 없는 항목은 실패로 표시됩니다.
+    본문이 CHAT_BATCH_RESULTS_MAX_BYTES를 넘으면 413으로 응답합니다.
+    """
+    body = await read_limited_body(request, settings.CHAT_BATCH_RESULTS_MAX_BYTES)
+    try:
+        # 큰 파일의 JSON 파싱이 이벤트 루프를 막지 않도록 스레드에서 처리
+        parsed = await asyncio.to_thread(parse_batch_output, body.decode("utf-8"), settings.CHAT_BATCH_MAX_ITEMS)
+    except (UnicodeDecodeError, ValueError) as error:
+        raise HTTPException(status_code=400, detail=f"Batch 결과 파일을 읽을 수 없습니다: {str(error)}")
+
+    timestamp = datetime.now().isoformat()
+    return ChatResponse(
+        success=parsed["succeeded"] > 0,
+        data={**parsed, "timestamp": timestamp},
+        timestamp=timestamp
+    )
 
 @router.get("/models", response_model=ChatResponse)
 async def get_available_models():
@@ -180,24 +575,44 @@ async def get_available_models():
     사용 가능한 GPT 모델 목록 조회
     """
     try:
-        print("📋 사용 가능한 모델 목록 조회 중...")
-        
         models = await openai_service.get_available_models()
         
-        print(f"✅ 모델 목록 조회 완료: {len(models)}개 모델")
+        logger.debug("모델 목록 조회 완료", extra={"models": len(models)})
         
+        timestamp = datetime.now().isoformat()
         return ChatResponse(
             success=True,
             data={
                 "models": models,
-                "timestamp": datetime.now().isoformat()
+                "catalog": openai_service.model_catalog.snapshot(),
+                "timestamp": timestamp
             },
-            timestamp=datetime.now().isoformat()
+            timestamp=timestamp
         )
         
     except Exception as error:
-        print(f"❌ 모델 목록 조회 오류: {error}")
+        logger.error("모델 목록 조회 오류", extra={"error": str(error)})
         raise HTTPException(
             status_code=500,
             detail=f"모델 목록을 가져오는 중 오류가 발생했습니다: {str(error)}"
         )
+
+
+@router.get("/stats", response_model=ChatResponse)
+async def get_chat_stats():
+    """
+    채팅 기능 통계 조회 (워커 프로세스 단위)
+
+    의미 기반 캐시와 대화 히스토리 압축 통계만 보여줍니다.
+    OpenAI 호출 계층(호출 합치기, 응답 캐시, 라우팅, 호출 한도, 재시도)과 서버 상태는 /api/stats에서 조회합니다.
+    """
+    timestamp = datetime.now().isoformat()
+    return ChatResponse(
+        success=True,
+        data={
+            "semanticCache": semantic_cache.snapshot(),
+            "historyCompaction": history_compactor.stats,
+            "timestamp": timestamp
+        },
+        timestamp=timestamp
+    )
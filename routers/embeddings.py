@@ -0,0 +1,141 @@
+from fastapi import APIRouter
+from fastapi.responses import Response
+from pydantic import BaseModel, Field, field_validator
+from typing import Dict, Any, List, Optional
+from datetime import datetime
+from array import array
+import base64
+import logging
+import sys
+import os
+
+# 현재 디렉토리를 Python 경로에 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from services.embedding_pipeline import embedding_pipeline
+from routers.chat import to_http_exception, validate_model_name
+from config import settings
+
+router = APIRouter()
+logger = logging.getLogger(__name__)
+
+# 벡터 바이트 형식 (응답 헤더와 본문에 표시)
+VECTOR_ENCODING = "float32-le"
+
+# Pydantic 모델 정의
+class EmbeddingRequest(BaseModel):
+    texts: List[str] = Field(
+        ..., description="임베딩할 텍스트 목록",
+        min_length=1, max_length=settings.EMBEDDING_MAX_TEXTS
+    )
+    model: Optional[str] = Field(default=settings.EMBEDDING_MODEL, description="임베딩 모델")
+    dimensions: Optional[int] = Field(default=None, description="줄일 차원 수 (text-embedding-3 모델만)", ge=1, le=3072)
+    encoding_format: str = Field(
+        default="base64", description="벡터 형식 (base64, binary, float)", pattern="^(base64|binary|float)$"
+    )
+
+    @field_validator("texts")
+    @classmethod
+    def check_texts(cls, texts: List[str]) -> List[str]:
+        if any(not text for text in texts):
+            raise ValueError("빈 텍스트는 임베딩할 수 없습니다.")
+        return texts
+
+    @field_validator("model")
+    @classmethod
+    def check_model(cls, model: Optional[str]) -> Optional[str]:
+        return validate_model_name(model)
+
+class EmbeddingResponse(BaseModel):
+    success: bool
+    data: Dict[str, Any]
+    timestamp: str
+
+def to_floats(vector: bytes) -> List[float]:
+    """float32 little-endian 바이트를 실수 목록으로 변환"""
+    values = array("f")
+    values.frombytes(vector)
+    if sys.byteorder == "big":
+        values.byteswap()
+    return values.tolist()
+
+@router.post("")
+async def create_embeddings(request: EmbeddingRequest):
+    """
+    여러 텍스트의 임베딩 생성 (캐시 사용)
+
+    캐시에 없는 텍스트만 업스트림 요청 크기로 나눠 동시에 보내고, 입력 순서대로 벡터를 반환합니다.
+
+    - **texts**: 임베딩할 텍스트 목록 (최대 EMBEDDING_MAX_TEXTS개)
+    - **model**: 임베딩 모델 (기본값: EMBEDDING_MODEL)
+    - **dimensions**: 줄일 차원 수 (선택사항)
+    - **encoding_format**: base64 (기본값, 벡터마다 float32 little-endian 바이트의 base64),
+      binary (모든 벡터를 이어 붙인 application/octet-stream, 정보는 X-Embedding-* 헤더),
+      float (실수 목록, 크기가 가장 큼)
+    """
+    logger.info(
+        "임베딩 요청",
+        extra={"model": request.model, "texts": len(request.texts), "encoding": request.encoding_format}
+    )
+
+    try:
+        result = await embedding_pipeline.embed(request.texts, request.model, request.dimensions)
+    except Exception as error:
+        logger.error("임베딩 생성 오류", extra={"error": str(error)})
+        raise to_http_exception(error)
+
+    cache = {
+        "hits": result["cacheHits"],
+        "upstreamTexts": result["upstreamTexts"],
+        "upstreamBatches": result["upstreamBatches"]
+    }
+
+    if request.encoding_format == "binary":
+        return Response(
+            content=b"".join(result["vectors"]),
+            media_type="application/octet-stream",
+            headers={
+                "X-Embedding-Model": request.model,
+                "X-Embedding-Count": str(len(result["vectors"])),
+                "X-Embedding-Dimensions": str(result["dimensions"]),
+                "X-Embedding-Encoding": VECTOR_ENCODING,
+                "X-Embedding-Cache-Hits": str(cache["hits"]),
+                "X-Embedding-Prompt-Tokens": str(result["usage"]["prompt_tokens"])
+            }
+        )
+
+    if request.encoding_format == "float":
+        embeddings = [to_floats(vector) for vector in result["vectors"]]
+    else:
+        embeddings = [base64.b64encode(vector).decode("ascii") for vector in result["vectors"]]
+
+    timestamp = datetime.now().isoformat()
+    return EmbeddingResponse(
+        success=True,
+        data={
+            "model": request.model,
+            "dimensions": result["dimensions"],
+            "encoding": VECTOR_ENCODING if request.encoding_format == "base64" else "float",
+            "embeddings": embeddings,
+            "usage": result["usage"],
+            "cache": cache,
+            "timestamp": timestamp
+        },
+        timestamp=timestamp
+    )
+
+@router.get("/stats", response_model=EmbeddingResponse)
+async def get_embedding_stats():
+    """
+    임베딩 파이프라인과 캐시 통계 조회 (워커 프로세스 단위)
+    """
+    timestamp = datetime.now().isoformat()
+    return EmbeddingResponse(
+        success=True,
+        data={
+            "pipeline": embedding_pipeline.stats,
+            "cache": embedding_pipeline.cache.stats,
+            "timestamp": timestamp
+        },
+        timestamp=timestamp
+    )
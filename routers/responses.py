@@ -0,0 +1,9 @@
+from fastapi.responses import JSONResponse, ORJSONResponse
+
+try:
+    import orjson
+except ImportError:  # 설치되어 있지 않으면 표준 json으로 직렬화
+    orjson = None
+
+# 앱 기본 JSON 응답 클래스 (orjson이 있으면 orjson으로 직렬화, 한글은 그대로 UTF-8)
+DefaultJSONResponse = ORJSONResponse if orjson is not None else JSONResponse
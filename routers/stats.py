@@ -0,0 +1,57 @@
+from fastapi import APIRouter
+from pydantic import BaseModel
+from typing import Dict, Any
+from datetime import datetime
+import asyncio
+import sys
+import os
+
+# 현재 디렉토리를 Python 경로에 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from services.openai_service import openai_service
+from services.structured_logging import dropped_count
+from middleware.admission import admission_controller
+
+router = APIRouter()
+
+# Pydantic 모델 정의
+class StatsResponse(BaseModel):
+    success: bool
+    data: Dict[str, Any]
+    timestamp: str
+
+@router.get("", response_model=StatsResponse)
+async def get_server_stats():
+    """
+    OpenAI 호출 계층과 서버 상태 통계 조회 (워커 프로세스 단위, 응답 캐시와 호출 한도는 모든 워커 공유)
+
+    채팅, 업로드 시간 추천, 대화 요약이 함께 쓰는 OpenAI 호출 합치기, 응답 캐시, 모델 라우팅,
+    호출 한도, 재시도/서킷 브레이커와 요청 수락 제어, 버린 로그 수를 한 번에 보여줍니다.
+    """
+    timestamp = datetime.now().isoformat()
+    return StatsResponse(
+        success=True,
+        data={
+            "openai": {
+                "coalescing": {
+                    **openai_service.single_flight.stats,
+                    "inFlight": openai_service.single_flight.in_flight
+                },
+                "completionCache": await asyncio.to_thread(openai_service.completion_cache.snapshot),
+                "routing": {
+                    **openai_service.model_router.stats,
+                    "latency": openai_service.model_router.latency.snapshot()
+                },
+                "rateLimit": openai_service.rate_limiter.snapshot(),
+                "resilience": {
+                    **openai_service.resilience.stats,
+                    "circuit": openai_service.resilience.breaker.snapshot()
+                }
+            },
+            "admission": admission_controller.snapshot(),
+            "logDropped": dropped_count(),
+            "timestamp": timestamp
+        },
+        timestamp=timestamp
+    )
@@ -0,0 +1,12 @@
+from typing import Any, Dict
+import json
+
+# SSE 스트리밍 응답 공통 설정
+SSE_MEDIA_TYPE = "text/event-stream"
+SSE_HEADERS = {"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+
+def sse_event(event: str, data: Dict[str, Any]) -> str:
+    """
+    Server-Sent Events 형식의 이벤트 문자열 생성
+    """
+    return f"event: {event}\ndata: {json.dumps(data, ensure_ascii=False)}\n\n"
@@ -1,7 +1,11 @@
 from fastapi import APIRouter, HTTPException, Query
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
-from typing import Dict, Any
-from datetime import datetime, date
+from typing import Dict, Any, List, Optional
+from typing_extensions import NotRequired, TypedDict
+from datetime import datetime, date, timedelta
+import asyncio
+import logging
 import sys
 import os
 
@@ -9,9 +13,12 @@ import os
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from services.upload_time_service import UploadTimeService
+from services.cache_warmer import CacheWarmer
+from routers.streaming import sse_event, SSE_MEDIA_TYPE, SSE_HEADERS
 from config import settings
 
 router = APIRouter()
+logger = logging.getLogger(__name__)
 
 # Pydantic 모델 정의
 class UploadTimeResponse(BaseModel):
@@ -19,12 +26,112 @@ class UploadTimeResponse(BaseModel):
     data: Dict[str, Any]
     timestamp: str
 
+# 추천 응답 모델 (자주 호출되는 /recommend, /weekly-recommend는 필드를 정해 두어 검증과 직렬화가 빠름)
+# 서비스가 만드는 안쪽 구조는 모델 객체를 만들지 않도록 TypedDict로 정의 (없는 키는 응답에서도 빠짐)
+class TimeWindow(TypedDict):
+    start: str
+    end: str
+
+class ExtractedTimeDetail(TypedDict):
+    display: str
+    startMinutes: int
+    endMinutes: Optional[int]
+    period: Optional[str]
+    approximate: bool
+
+class RecommendationData(BaseModel):
+    date: str
+    dayName: str
+    contentType: str
+    recommendation: Optional[str]
+    extractedTime: Optional[str] = None
+    extractedTimeDetail: Optional[ExtractedTimeDetail] = None
+    timeWindow: Optional[TimeWindow] = None
+    source: str
+    timestamp: str
+
+class DailyRecommendation(TypedDict):
+    date: str
+    dayName: str
+    dayType: str
+    holiday: Optional[Dict[str, Any]]
+    recommendation: Optional[str]
+    extractedTime: Optional[str]
+    extractedTimeDetail: Optional[ExtractedTimeDetail]
+    timeWindow: NotRequired[Optional[TimeWindow]]
+    source: NotRequired[str]
+    error: NotRequired[str]
+
+class WeeklyAnalysis(TypedDict):
+    text: Optional[str]
+    extractedTime: Optional[str]
+    extractedTimeDetail: Optional[ExtractedTimeDetail]
+    timeWindow: NotRequired[Optional[TimeWindow]]
+    source: NotRequired[str]
+    error: NotRequired[str]
+
+class WeeklySummary(TypedDict):
+    totalDays: int
+    holidayDays: int
+    weekendDays: int
+    weekdayDays: int
+    failedDays: List[str]
+
+class WeeklyRecommendation(TypedDict):
+    weekStart: str
+    contentType: str
+    mode: str
+    dailyRecommendations: List[DailyRecommendation]
+    weeklyAnalysis: WeeklyAnalysis
+    summary: WeeklySummary
+
+class WeeklyRecommendationData(BaseModel):
+    weekStart: str
+    weekStartName: str
+    contentType: str
+    weeklyRecommendation: WeeklyRecommendation
+    timestamp: str
+
+class RecommendationResponse(BaseModel):
+    success: bool
+    data: RecommendationData
+    timestamp: str
+
+class WeeklyRecommendationResponse(BaseModel):
+    success: bool
+    data: WeeklyRecommendationData
+    timestamp: str
+
 # 업로드 시간 서비스 인스턴스
 upload_time_service = UploadTimeService()
 
-@router.get("/recommend", response_model=UploadTimeResponse)
+# 추천 캐시 예열 스케줄러 (main.py의 앱 수명주기에서 시작)
+cache_warmer = CacheWarmer(
+    upload_time_service,
+    lock_path=os.path.join(settings.CACHE_DIR, "cache_warmer.lock"),
+    status_path=os.path.join(settings.CACHE_DIR, "cache_warmer_status.json")
+)
+
+def is_cached_request(path: str, query: Dict[str, str]) -> bool:
+    """
+    LLM 호출 없이 캐시나 규칙으로 바로 응답할 추천 요청인지 확인 (과부하 시에도 항상 받음)
+
+    Args:
+        path: 라우터 기준 경로 (예: /recommend)
+        query: 쿼리 파라미터
+    """
+    content_type = query.get("content_type", "general")
+    mode = query.get("mode")
+    if path == "/recommend":
+        return upload_time_service.can_answer_without_llm("daily", upload_time_service.today(), content_type, mode)
+    if path == "/weekly-recommend":
+        return upload_time_service.can_answer_without_llm("weekly", upload_time_service.today(), content_type, mode)
+    return False
+
+@router.get("/recommend", response_model=RecommendationResponse)
 async def recommend_upload_time(
-    content_type: str = Query(default="general", description="콘텐츠 타입 (general, entertainment, education, gaming)")
+    content_type: str = Query(default="general", description="콘텐츠 타입 (general, entertainment, education, gaming)"),
+    mode: str = Query(default="llm", description="추천 방식 (llm, fast)", pattern="^(llm|fast)$")
 ):
     """
     동영상 업로드 시간 추천 (GET 요청)
@@ -33,23 +140,28 @@ async def recommend_upload_time(
     사용자는 아무것도 입력할 필요가 없습니다.
     
     - **content_type**: 콘텐츠 타입 (선택사항, 기본값: general)
+    - **mode**: 추천 방식 (선택사항, 기본값: llm / fast: 네트워크 호출 없는 규칙 기반 추천)
     """
     try:
-        # 서버에서 현재 날짜 자동 확인
-        target_date = date.today()
+        # 서버에서 현재 날짜(KST) 자동 확인
+        target_date = upload_time_service.today()
         
-        print(f"📅 업로드 시간 추천 요청 (자동 날짜): {target_date}")
-        print(f"📺 콘텐츠 타입: {content_type}")
+        logger.info(
+            "업로드 시간 추천 요청",
+            extra={"date": target_date.isoformat(), "contentType": content_type, "mode": mode, "sample": True}
+        )
         
         # 업로드 시간 추천 서비스 호출
         recommendation = await upload_time_service.get_upload_time_recommendation(
             target_date=target_date,
-            content_type=content_type
+            content_type=content_type,
+            mode=mode
         )
         
-        print("✅ 업로드 시간 추천 완료")
+        logger.debug("업로드 시간 추천 완료", extra={"source": recommendation["source"]})
         
-        return UploadTimeResponse(
+        timestamp = datetime.now().isoformat()
+        return RecommendationResponse(
             success=True,
             data={
                 "date": target_date.isoformat(),
@@ -57,21 +169,25 @@ async def recommend_upload_time(
                 "contentType": content_type,
                 "recommendation": recommendation["text"],
                 "extractedTime": recommendation["extractedTime"],
-                "timestamp": datetime.now().isoformat()
+                "extractedTimeDetail": recommendation["extractedTimeDetail"],
+                "timeWindow": recommendation.get("timeWindow"),
+                "source": recommendation["source"],
+                "timestamp": timestamp
             },
-            timestamp=datetime.now().isoformat()
+            timestamp=timestamp
         )
         
     except Exception as error:
-        print(f"❌ 업로드 시간 추천 오류: {error}")
+        logger.error("업로드 시간 추천 오류", extra={"error": str(error)})
         raise HTTPException(
             status_code=500,
             detail=f"업로드 시간 추천 중 오류가 발생했습니다: {str(error)}"
         )
 
-@router.get("/weekly-recommend", response_model=UploadTimeResponse)
+@router.get("/weekly-recommend", response_model=WeeklyRecommendationResponse)
 async def recommend_weekly_upload_time(
-    content_type: str = Query(default="general", description="콘텐츠 타입 (general, entertainment, education, gaming)")
+    content_type: str = Query(default="general", description="콘텐츠 타입 (general, entertainment, education, gaming)"),
+    mode: Optional[str] = Query(default=None, description="생성 방식 (per_day, structured, fast)", pattern="^(per_day|structured|fast)$")
 ):
     """
     주간 동영상 업로드 시간 추천 (GET 요청)
@@ -80,41 +196,87 @@ async def recommend_weekly_upload_time(
     사용자는 아무것도 입력할 필요가 없습니다.
     
     - **content_type**: 콘텐츠 타입 (선택사항, 기본값: general)
+    - **mode**: 생성 방식 (선택사항, 기본값: WEEKLY_RECOMMEND_MODE 설정값)
     """
     try:
-        # 서버에서 현재 날짜를 주간 시작점으로 자동 설정
-        week_start = date.today()
+        # 서버에서 현재 날짜(KST)를 주간 시작점으로 자동 설정
+        week_start = upload_time_service.today()
         
-        print(f"📅 주간 업로드 시간 추천 요청 (자동 날짜): {week_start}")
-        print(f"📺 콘텐츠 타입: {content_type}")
+        logger.info(
+            "주간 업로드 시간 추천 요청",
+            extra={"weekStart": week_start.isoformat(), "contentType": content_type, "mode": mode, "sample": True}
+        )
         
         # 주간 추천 서비스 호출
         weekly_recommendation = await upload_time_service.get_weekly_upload_recommendation(
             start_date=week_start,
-            content_type=content_type
+            content_type=content_type,
+            mode=mode
         )
         
-        print("✅ 주간 업로드 시간 추천 완료")
+        logger.debug("주간 업로드 시간 추천 완료")
         
-        return UploadTimeResponse(
+        timestamp = datetime.now().isoformat()
+        return WeeklyRecommendationResponse(
             success=True,
             data={
                 "weekStart": week_start.isoformat(),
                 "weekStartName": week_start.strftime('%Y년 %m월 %d일 %A'),
                 "contentType": content_type,
                 "weeklyRecommendation": weekly_recommendation,
-                "timestamp": datetime.now().isoformat()
+                "timestamp": timestamp
             },
-            timestamp=datetime.now().isoformat()
+            timestamp=timestamp
         )
         
     except Exception as error:
-        print(f"❌ 주간 업로드 시간 추천 오류: {error}")
+        logger.error("주간 업로드 시간 추천 오류", extra={"error": str(error)})
         raise HTTPException(
             status_code=500,
             detail=f"주간 업로드 시간 추천 중 오류가 발생했습니다: {str(error)}"
         )
 
+@router.get("/weekly-recommend/stream")
+async def stream_weekly_upload_time(
+    content_type: str = Query(default="general", description="콘텐츠 타입 (general, entertainment, education, gaming)")
+):
+    """
+    주간 동영상 업로드 시간 추천 (SSE 스트리밍)
+
+    날짜, 요일 타입, 명절, 요약 개수를 skeleton 이벤트로 바로 보내고,
+    일별 추천은 완료되는 대로 day 이벤트로, 주간 분석은 마지막에 weekly 이벤트로 보냅니다.
+    모든 항목을 보낸 뒤 실패한 날짜 목록을 담은 done 이벤트로 끝납니다.
+
+    - **content_type**: 콘텐츠 타입 (선택사항, 기본값: general)
+    """
+    week_start = upload_time_service.today()
+
+    logger.info(
+        "주간 업로드 시간 추천 스트리밍 요청",
+        extra={"weekStart": week_start.isoformat(), "contentType": content_type, "sample": True}
+    )
+
+    async def event_stream():
+        events = upload_time_service.stream_weekly_upload_recommendation(
+            start_date=week_start,
+            content_type=content_type
+        )
+        try:
+            async for event in events:
+                yield sse_event(event["type"], event)
+            logger.debug("주간 업로드 시간 추천 스트리밍 완료")
+        except Exception as error:
+            logger.error("주간 업로드 시간 추천 스트리밍 오류", extra={"error": str(error)})
+            yield sse_event("error", {
+                "type": "error",
+                "error": f"주간 업로드 시간 추천 중 오류가 발생했습니다: {str(error)}",
+                "status_code": 500
+            })
+        finally:
+            await events.aclose()
+
+    return StreamingResponse(event_stream(), media_type=SSE_MEDIA_TYPE, headers=SSE_HEADERS)
+
 @router.get("/stats", response_model=UploadTimeResponse)
 async def get_upload_time_stats(
     content_type: str = Query(default="general", description="콘텐츠 타입")
@@ -125,25 +287,82 @@ async def get_upload_time_stats(
     - **content_type**: 콘텐츠 타입 (general, entertainment, education, gaming)
     """
     try:
-        print(f"📊 업로드 시간 통계 조회: {content_type}")
-        
         stats = await upload_time_service.get_upload_time_stats(content_type)
         
-        print("✅ 업로드 시간 통계 조회 완료")
+        logger.debug("업로드 시간 통계 조회 완료", extra={"contentType": content_type})
         
+        timestamp = datetime.now().isoformat()
         return UploadTimeResponse(
             success=True,
             data={
                 "contentType": content_type,
                 "stats": stats,
-                "timestamp": datetime.now().isoformat()
+                "timestamp": timestamp
             },
-            timestamp=datetime.now().isoformat()
+            timestamp=timestamp
         )
         
     except Exception as error:
-        print(f"❌ 업로드 시간 통계 조회 오류: {error}")
+        logger.error("업로드 시간 통계 조회 오류", extra={"error": str(error)})
         raise HTTPException(
             status_code=500,
             detail=f"업로드 시간 통계 조회 중 오류가 발생했습니다: {str(error)}"
         )
+
+
+@router.get("/warm-status", response_model=UploadTimeResponse)
+async def get_cache_warm_status():
+    """
+    추천 캐시 예열 상태 조회
+
+    마지막 예열 실행 날짜, 시작/종료 시각, 소요 시간, 콘텐츠 타입별 결과를 반환합니다.
+    """
+    timestamp = datetime.now().isoformat()
+    return UploadTimeResponse(
+        success=True,
+        data={
+            "enabled": settings.CACHE_WARM_ENABLED,
+            "lastRun": await asyncio.to_thread(cache_warmer.get_status) or None,
+            "timestamp": timestamp
+        },
+        timestamp=timestamp
+    )
+
+
+@router.get("/holidays", response_model=UploadTimeResponse)
+async def get_special_days(
+    start_date: Optional[date] = Query(default=None, description="시작 날짜 (기본값: 오늘)"),
+    days: int = Query(default=30, ge=1, le=366, description="조회 기간 (일)")
+):
+    """
+    기간 안의 공휴일과 특별한 날 조회
+
+    - **start_date**: 시작 날짜 (YYYY-MM-DD, 기본값: 오늘)
+    - **days**: 시작 날짜부터 조회할 일 수 (1~366)
+
+    음력 계산이 맞는 연도(1900~2100년) 밖에서 시작하면 400, 기간이 그 끝을 넘으면 2100년 12월 31일까지만 조회합니다.
+    """
+    calendar = upload_time_service.holiday_calendar
+    start = start_date or upload_time_service.today()
+    if not calendar.MIN_YEAR <= start.year <= calendar.MAX_YEAR:
+        raise HTTPException(
+            status_code=400,
+            detail=f"공휴일은 {calendar.MIN_YEAR}년부터 {calendar.MAX_YEAR}년까지만 조회할 수 있습니다"
+        )
+    end = min(start + timedelta(days=days - 1), date(calendar.MAX_YEAR, 12, 31))
+    special_days = calendar.between(start, end)
+
+    timestamp = datetime.now().isoformat()
+    return UploadTimeResponse(
+        success=True,
+        data={
+            "startDate": start.isoformat(),
+            "endDate": end.isoformat(),
+            "specialDays": [
+                {"date": day.isoformat(), **info}
+                for day, info in special_days
+            ],
+            "timestamp": timestamp
+        },
+        timestamp=timestamp
+    )
@@ -0,0 +1,185 @@
+import asyncio
+import json
+import logging
+import os
+import random
+import sys
+import time
+from datetime import datetime, timedelta
+from typing import Any, Dict, Optional
+
+try:
+    import fcntl
+except ImportError:  # Windows 개발 환경에서는 워커가 하나라고 가정
+    fcntl = None
+
+# 현재 디렉토리를 Python 경로에 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from config import settings
+
+logger = logging.getLogger(__name__)
+
+
+class CacheWarmer:
+    """
+    업로드 시간 추천 캐시 예열 스케줄러
+
+    매일 자정 직후(KST)에 오늘의 일별 추천과 오늘부터 7일간의 주간 추천을
+    모든 콘텐츠 타입에 대해 미리 생성해 추천 캐시에 채워 둡니다.
+    여러 워커 중 파일 잠금을 얻은 하나만 실행하고, 실행 결과는 상태 파일로 공유합니다.
+    규칙 기반 대체 결과는 캐시에 남지 않으므로 예열되지 않은 것으로 기록합니다.
+    잠금과 상태 파일 입출력은 이벤트 루프를 막지 않도록 스레드에서 실행합니다.
+    """
+
+    # 추천 캐시에 저장되는 생성 방식 (그 외는 규칙 기반 대체나 오류)
+    CACHED_SOURCES = ("llm", "structured")
+
+    def __init__(self, upload_time_service, lock_path: str, status_path: str):
+        self.upload_time_service = upload_time_service
+        self.lock_path = lock_path
+        self.status_path = status_path
+        self._task: Optional[asyncio.Task] = None
+
+    async def start(self) -> None:
+        """백그라운드 스케줄러 시작"""
+        if self._task is None:
+            self._task = asyncio.create_task(self._run_forever())
+
+    async def stop(self) -> None:
+        """백그라운드 스케줄러 종료"""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    def _seconds_until_next_run(self) -> float:
+        """다음 예열 시각(설정된 시간대 기준)까지 남은 시간 (초)"""
+        now = datetime.now(self.upload_time_service.timezone)
+        hour, minute = (int(part) for part in settings.CACHE_WARM_TIME.split(":"))
+        next_run = now.replace(hour=hour, minute=minute, second=0, microsecond=0)
+        if next_run <= now:
+            next_run += timedelta(days=1)
+        return (next_run - now).total_seconds()
+
+    async def _run_forever(self) -> None:
+        """예열 루프 (배포 직후 오늘 예열이 안 되어 있으면 바로 한 번 실행)"""
+        await asyncio.sleep(random.uniform(0, settings.CACHE_WARM_JITTER_SECONDS))
+        await self._safe_warm()
+
+        while True:
+            delay = self._seconds_until_next_run() + random.uniform(0, settings.CACHE_WARM_JITTER_SECONDS)
+            await asyncio.sleep(delay)
+            await self._safe_warm()
+
+    async def _safe_warm(self) -> None:
+        """예열 중 오류가 스케줄러를 멈추지 않도록 감싸서 실행"""
+        try:
+            await self.warm_once()
+        except asyncio.CancelledError:
+            raise
+        except Exception as error:
+            logger.exception("추천 캐시 예열 오류", extra={"error": str(error)})
+
+    def _acquire_lock(self):
+        """리더 잠금 획득 (다른 워커가 잡고 있으면 None)"""
+        os.makedirs(os.path.dirname(self.lock_path), exist_ok=True)
+        lock_file = open(self.lock_path, "a")
+        if fcntl is None:
+            return lock_file
+        try:
+            fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except OSError:
+            lock_file.close()
+            return None
+        return lock_file
+
+    def _write_status(self, status: Dict[str, Any]) -> None:
+        """상태 파일을 원자적으로 갱신"""
+        temp_path = f"{self.status_path}.{os.getpid()}.tmp"
+        with open(temp_path, "w", encoding="utf-8") as f:
+            json.dump(status, f, ensure_ascii=False)
+        os.replace(temp_path, self.status_path)
+
+    def get_status(self) -> Dict[str, Any]:
+        """
+        마지막 예열 실행 상태 조회
+
+        Returns:
+            마지막 실행 날짜, 시작/종료 시각, 소요 시간, 결과 (실행 기록이 없으면 빈 딕셔너리)
+        """
+        try:
+            with open(self.status_path, encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def _weekly_result(self, weekly: Dict[str, Any]) -> str:
+        """주간 추천 예열 결과 (캐시에 남지 않은 날짜와 주간 분석을 partial로 기록)"""
+        missed = [
+            day["date"] for day in weekly["dailyRecommendations"]
+            if day.get("source") not in self.CACHED_SOURCES
+        ]
+        if weekly["weeklyAnalysis"].get("source") not in self.CACHED_SOURCES:
+            missed.append("analysis")
+        return f"partial: {', '.join(missed)}" if missed else "ok"
+
+    async def warm_once(self) -> bool:
+        """
+        오늘 추천 캐시 예열 (이미 오늘 완료되었거나 다른 워커가 실행 중이면 건너뜀)
+
+        Returns:
+            이번 호출에서 예열을 실행했는지 여부
+        """
+        lock_file = await asyncio.to_thread(self._acquire_lock)
+        if lock_file is None:
+            return False
+
+        try:
+            today = self.upload_time_service.today()
+            last_status = await asyncio.to_thread(self.get_status)
+            if last_status.get("date") == today.isoformat() and last_status.get("finishedAt"):
+                return False
+
+            logger.info("추천 캐시 예열 시작", extra={"date": today.isoformat()})
+            started_at = datetime.now(self.upload_time_service.timezone)
+            started = time.perf_counter()
+            status = {
+                "date": today.isoformat(),
+                "startedAt": started_at.isoformat(),
+                "finishedAt": None,
+                "durationSeconds": None,
+                "pid": os.getpid(),
+                "results": {}
+            }
+            await asyncio.to_thread(self._write_status, status)
+
+            for content_type in self.upload_time_service.content_type_peak_times:
+                result = {"daily": "ok", "weekly": "ok"}
+                try:
+                    daily = await self.upload_time_service.get_upload_time_recommendation(today, content_type)
+                    if daily["source"] not in self.CACHED_SOURCES:
+                        result["daily"] = f"fallback: {daily['source']}"
+                except Exception as error:
+                    result["daily"] = f"error: {error}"
+                try:
+                    weekly = await self.upload_time_service.get_weekly_upload_recommendation(today, content_type)
+                    result["weekly"] = self._weekly_result(weekly)
+                except Exception as error:
+                    result["weekly"] = f"error: {error}"
+                status["results"][content_type] = result
+
+            status["finishedAt"] = datetime.now(self.upload_time_service.timezone).isoformat()
+            status["durationSeconds"] = round(time.perf_counter() - started, 3)
+            await asyncio.to_thread(self._write_status, status)
+            logger.info(
+                "추천 캐시 예열 완료",
+                extra={"durationSeconds": status["durationSeconds"], "results": status["results"]}
+            )
+            return True
+
+        finally:
+            await asyncio.to_thread(lock_file.close)
@@ -0,0 +1,135 @@
+import json
+from typing import Any, Dict, List, Optional
+
+# OpenAI Batch API 요청 한 줄의 custom_id 접두사 (뒤에 요청 순서가 붙음)
+CUSTOM_ID_PREFIX = "item-"
+BATCH_ENDPOINT = "/v1/chat/completions"
+
+
+def empty_usage() -> Dict[str, int]:
+    """합산용 사용량"""
+    return {"prompt_tokens": 0, "completion_tokens": 0, "total_tokens": 0}
+
+
+def add_usage(total: Dict[str, int], usage: Optional[Dict[str, Any]]) -> None:
+    """응답 사용량을 합산값에 더함"""
+    for key in total:
+        total[key] += (usage or {}).get(key) or 0
+
+
+def build_batch_jsonl(items: List[Dict[str, Any]]) -> str:
+    """
+    채팅 요청 목록을 OpenAI Batch API 입력 JSONL로 변환
+
+    Args:
+        items: [{"message": ..., "model": ..., "max_tokens": ..., "temperature": ...}, ...]
+
+    Returns:
+        한 줄에 요청 하나씩 담긴 JSONL 문자열 (custom_id는 item-<순서>)
+    """
+    lines = []
+    for index, item in enumerate(items):
+        lines.append(json.dumps({
+            "custom_id": f"{CUSTOM_ID_PREFIX}{index}",
+            "method": "POST",
+            "url": BATCH_ENDPOINT,
+            "body": {
+                "model": item["model"],
+                "messages": [{"role": "user", "content": item["message"]}],
+                "max_tokens": item["max_tokens"],
+                "temperature": item["temperature"]
+            }
+        }, ensure_ascii=False))
+    return "\n".join(lines) + "\n"
+
+
+def _item_index(custom_id: Any) -> Optional[int]:
+    """custom_id에서 요청 순서 추출 (item- 뒤가 0 이상의 10진 정수가 아니면 None)"""
+    if not isinstance(custom_id, str) or not custom_id.startswith(CUSTOM_ID_PREFIX):
+        return None
+    suffix = custom_id[len(CUSTOM_ID_PREFIX):]
+    if not suffix.isascii() or not suffix.isdigit():
+        return None
+    return int(suffix)
+
+
+def _as_dict(value: Any) -> Dict[str, Any]:
+    """결과 파일의 객체 필드 (객체가 아니면 빈 딕셔너리)"""
+    return value if isinstance(value, dict) else {}
+
+
+def _error_message(error: Any) -> str:
+    """오류 필드의 메시지 (객체가 아니면 문자열로)"""
+    if isinstance(error, dict):
+        return error.get("message") or str(error)
+    return str(error)
+
+
+def _parse_line(line: Dict[str, Any]) -> Dict[str, Any]:
+    """Batch API 결과 한 줄을 항목별 결과로 변환 (필드 형식이 다르면 실패 항목으로)"""
+    error = line.get("error")
+    if error:
+        return {"success": False, "error": _error_message(error), "status_code": None}
+
+    response = _as_dict(line.get("response"))
+    status_code = response.get("status_code")
+    body = _as_dict(response.get("body"))
+    if status_code != 200:
+        body_error = body.get("error")
+        message = _error_message(body_error) if body_error else f"요청이 실패했습니다 (HTTP {status_code})"
+        return {"success": False, "error": message, "status_code": status_code}
+
+    choices = body.get("choices")
+    choice = _as_dict(choices[0]) if isinstance(choices, list) and choices else {}
+    return {
+        "success": True,
+        "message": _as_dict(choice.get("message")).get("content"),
+        "model": body.get("model"),
+        "usage": _as_dict(body.get("usage")) or None
+    }
+
+
+def parse_batch_output(text: str, max_items: int) -> Dict[str, Any]:
+    """
+    OpenAI Batch API 결과(또는 오류) JSONL을 요청 순서대로 정리
+
+    결과 파일은 요청 순서를 보장하지 않으므로 custom_id로 순서를 맞추고,
+    중간에 빠진 요청은 결과가 없는 실패 항목으로 채웁니다.
+
+    Args:
+        text: 결과 JSONL 문자열 (결과 파일과 오류 파일을 이어 붙여도 됨)
+        max_items: 입력 파일 하나에 담을 수 있는 최대 항목 수 (순서는 0 ~ max_items - 1)
+
+    Returns:
+        {"results": [...], "usage": 합산 사용량, "succeeded": 성공 수, "failed": 실패 수}
+
+    Raises:
+        ValueError: JSON이 아니거나, custom_id가 item-<순서> 형식이 아니거나 순서가 범위를 벗어난 줄이 있는 경우
+    """
+    parsed: Dict[int, Dict[str, Any]] = {}
+    for number, raw in enumerate(text.splitlines(), start=1):
+        if not raw.strip():
+            continue
+        try:
+            line = json.loads(raw)
+        except ValueError:
+            raise ValueError(f"{number}번째 줄이 JSON이 아닙니다.")
+        index = _item_index(line.get("custom_id") if isinstance(line, dict) else None)
+        if index is None:
+            raise ValueError(f"{number}번째 줄의 custom_id가 '{CUSTOM_ID_PREFIX}<순서>' 형식이 아닙니다.")
+        # 결과 목록 길이가 custom_id로 정해지므로 입력 파일에 있을 수 없는 순서는 거절
+        if index >= max_items:
+            raise ValueError(f"{number}번째 줄의 요청 순서({index})가 최대 항목 수({max_items})를 넘습니다.")
+        parsed[index] = _parse_line(line)
+
+    count = max(parsed) + 1 if parsed else 0
+    results = []
+    usage = empty_usage()
+    for index in range(count):
+        result = parsed.get(index) or {"success": False, "error": "결과가 없습니다.", "status_code": None}
+        if result["success"]:
+            add_usage(usage, result["usage"])
+        results.append({"index": index, **result})
+
+    succeeded = sum(1 for result in results if result["success"])
+    return {"results": results, "usage": usage, "succeeded": succeeded, "failed": len(results) - succeeded}
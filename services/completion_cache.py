@@ -0,0 +1,173 @@
+import json
+import sqlite3
+import time
+import zlib
+from typing import Any, Dict, List, Optional
+
+from services.metrics import metrics
+from services.sqlite_cache import SQLiteCache
+
+
+class CompletionCache(SQLiteCache):
+    """
+    결정적 채팅 완료 응답 캐시 (SQLite 파일 기반, 같은 요청이면 같은 응답)
+
+    같은 호스트의 모든 워커 프로세스가 하나의 파일을 공유하며 재시작 후에도 유지됩니다.
+    항목은 (모델, 메시지, max_tokens, temperature, 응답 형식, 경로)의 정규화된 해시로 찾고,
+    프롬프트와 응답을 압축한 JSON으로 저장해 해시가 같아도 프롬프트가 다르면 쓰지 않습니다.
+    압축된 크기의 합이 max_bytes를 넘으면 가장 오래 사용되지 않은 항목부터 삭제합니다 (LRU).
+    크기 합계는 트리거가 별도 테이블에 유지하므로 저장할 때 전체 테이블을 훑지 않습니다.
+    """
+
+    # 한도를 넘으면 합계가 max_bytes의 이 비율 아래로 내려갈 때까지 한 번에 정리 (매 저장마다 정리하지 않도록)
+    EVICT_TARGET_RATIO = 0.9
+    # 정리할 때 오래된 순으로 한 번에 읽는 항목 수
+    EVICT_BATCH_SIZE = 200
+
+    def __init__(self, path: str, max_bytes: int, ttl: float):
+        # 항목 수가 아니라 크기 합계로 정리하므로 max_entries는 쓰지 않음
+        super().__init__(path, table="completion_cache", max_entries=0)
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self.stats = {"hits": 0, "misses": 0, "stored": 0, "evicted": 0}
+
+    def _create_table(self, conn: sqlite3.Connection) -> None:
+        """응답 캐시 테이블과 크기 합계 테이블 (합계는 트리거로 유지)"""
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            conn.execute(
+                """CREATE TABLE IF NOT EXISTS completion_cache (
+                    key TEXT PRIMARY KEY,
+                    value BLOB NOT NULL,
+                    size INTEGER NOT NULL,
+                    created_at REAL NOT NULL,
+                    last_access REAL NOT NULL
+                )"""
+            )
+            conn.execute(
+                """CREATE TABLE IF NOT EXISTS completion_cache_size (
+                    id INTEGER PRIMARY KEY CHECK (id = 0),
+                    total INTEGER NOT NULL
+                )"""
+            )
+            # 트리거 이전에 만들어진 파일이면 현재 합계로 한 번 채움
+            conn.execute(
+                "INSERT OR IGNORE INTO completion_cache_size (id, total) "
+                "SELECT 0, COALESCE(SUM(size), 0) FROM completion_cache"
+            )
+            conn.execute(
+                """CREATE TRIGGER IF NOT EXISTS completion_cache_size_insert
+                AFTER INSERT ON completion_cache BEGIN
+                    UPDATE completion_cache_size SET total = total + NEW.size WHERE id = 0;
+                END"""
+            )
+            conn.execute(
+                """CREATE TRIGGER IF NOT EXISTS completion_cache_size_update
+                AFTER UPDATE OF size ON completion_cache BEGIN
+                    UPDATE completion_cache_size SET total = total - OLD.size + NEW.size WHERE id = 0;
+                END"""
+            )
+            conn.execute(
+                """CREATE TRIGGER IF NOT EXISTS completion_cache_size_delete
+                AFTER DELETE ON completion_cache BEGIN
+                    UPDATE completion_cache_size SET total = total - OLD.size WHERE id = 0;
+                END"""
+            )
+            conn.execute("COMMIT")
+        except sqlite3.Error:
+            conn.execute("ROLLBACK")
+            raise
+
+    @staticmethod
+    def _encode(messages: List[Dict[str, str]], response: Dict[str, Any]) -> bytes:
+        """프롬프트와 응답을 압축한 JSON"""
+        payload = json.dumps([messages, response], ensure_ascii=False, separators=(",", ":"))
+        return zlib.compress(payload.encode("utf-8"))
+
+    def get(self, key: str, messages: List[Dict[str, str]]) -> Optional[Dict[str, Any]]:
+        """
+        캐시된 응답 조회 (만료되었거나 저장된 프롬프트가 다르면 None)
+        """
+        now = time.time()
+        with self._lock:
+            conn = self._connection()
+            row = conn.execute(
+                "SELECT value, created_at FROM completion_cache WHERE key = ?", (key,)
+            ).fetchone()
+            if row is not None and now - row[1] < self.ttl:
+                conn.execute("UPDATE completion_cache SET last_access = ? WHERE key = ?", (now, key))
+
+        if row is not None and now - row[1] < self.ttl:
+            stored_messages, response = json.loads(zlib.decompress(row[0]))
+            if stored_messages == messages:
+                self.stats["hits"] += 1
+                metrics.inc("completion_cache_events_total", event="hit")
+                return response
+
+        self.stats["misses"] += 1
+        metrics.inc("completion_cache_events_total", event="miss")
+        return None
+
+    def set(self, key: str, messages: List[Dict[str, str]], response: Dict[str, Any]) -> None:
+        """응답 저장 후 크기 합계가 max_bytes를 넘었을 때만 LRU 정리"""
+        value = self._encode(messages, response)
+        if len(value) > self.max_bytes:
+            return
+        now = time.time()
+        evicted = 0
+        with self._lock:
+            conn = self._connection()
+            conn.execute("BEGIN")
+            try:
+                # REPLACE는 삭제 트리거를 부르지 않으므로 UPSERT로 크기 변경을 합계에 반영
+                conn.execute(
+                    "INSERT INTO completion_cache (key, value, size, created_at, last_access) "
+                    "VALUES (?, ?, ?, ?, ?) "
+                    "ON CONFLICT (key) DO UPDATE SET value = excluded.value, size = excluded.size, "
+                    "created_at = excluded.created_at, last_access = excluded.last_access",
+                    (key, value, len(value), now, now)
+                )
+                total = conn.execute("SELECT total FROM completion_cache_size WHERE id = 0").fetchone()[0]
+                if total > self.max_bytes:
+                    evicted = self._evict(conn, key, total - int(self.max_bytes * self.EVICT_TARGET_RATIO))
+                conn.execute("COMMIT")
+            except sqlite3.Error:
+                conn.execute("ROLLBACK")
+                raise
+        self.stats["stored"] += 1
+        self.stats["evicted"] += evicted
+
+    def _evict(self, conn: sqlite3.Connection, keep_key: str, excess: int) -> int:
+        """
+        가장 오래 사용되지 않은 항목부터 excess 바이트 이상을 삭제 (방금 저장한 항목은 남김)
+
+        Returns:
+            삭제한 항목 수
+        """
+        evicted = 0
+        while excess > 0:
+            rows = conn.execute(
+                "SELECT key, size FROM completion_cache WHERE key != ? ORDER BY last_access LIMIT ?",
+                (keep_key, self.EVICT_BATCH_SIZE)
+            ).fetchall()
+            if not rows:
+                break
+            victims = []
+            for victim, size in rows:
+                victims.append(victim)
+                excess -= size
+                if excess <= 0:
+                    break
+            conn.execute(
+                f"DELETE FROM completion_cache WHERE key IN ({','.join('?' * len(victims))})", victims
+            )
+            evicted += len(victims)
+        return evicted
+
+    def snapshot(self) -> Dict[str, Any]:
+        """현재 상태 (통계 조회용, 크기는 모든 워커 공유 값)"""
+        with self._lock:
+            conn = self._connection()
+            entries = conn.execute("SELECT COUNT(*) FROM completion_cache").fetchone()[0]
+            size = conn.execute("SELECT total FROM completion_cache_size WHERE id = 0").fetchone()[0]
+        return {**self.stats, "entries": entries, "bytes": size, "maxBytes": self.max_bytes}
@@ -0,0 +1,93 @@
+import hashlib
+import sqlite3
+import time
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from services.sqlite_cache import SQLiteCache
+
+
+def embedding_key(text: str, model: str, dimensions: Optional[int] = None) -> str:
+    """(모델, 차원, 텍스트 내용) 캐시 키"""
+    return hashlib.sha256(f"{model}\0{dimensions or ''}\0{text}".encode("utf-8")).hexdigest()
+
+
+class EmbeddingCache(SQLiteCache):
+    """
+    임베딩 벡터 캐시 (SQLite 파일 기반, float32 바이트 그대로 저장)
+
+    같은 호스트의 모든 워커 프로세스가 하나의 파일을 공유하며 재시작 후에도 유지됩니다.
+    임베딩은 같은 입력이면 결과가 같으므로 만료 없이 보관하고,
+    항목 수가 max_entries를 넘으면 가장 오래 사용되지 않은 항목부터 삭제합니다 (LRU).
+    수만 건을 한 번에 읽고 쓰므로 이벤트 루프가 아닌 스레드에서 호출하는 것을 전제로 합니다.
+    """
+
+    def __init__(self, path: str, max_entries: int):
+        super().__init__(path, table="embedding_cache", max_entries=max_entries)
+        self.stats = {"hits": 0, "misses": 0, "stored": 0}
+
+    def _create_table(self, conn: sqlite3.Connection) -> None:
+        """임베딩 캐시 테이블 (값은 JSON이 아닌 float32 바이트)"""
+        conn.execute(
+            """CREATE TABLE IF NOT EXISTS embedding_cache (
+                key TEXT PRIMARY KEY,
+                vector BLOB NOT NULL,
+                last_access REAL NOT NULL
+            )"""
+        )
+
+    def get_many(self, keys: List[str]) -> Dict[str, bytes]:
+        """
+        캐시된 벡터 일괄 조회
+
+        Returns:
+            {키: float32 바이트} (없는 키는 빠짐)
+        """
+        found: Dict[str, bytes] = {}
+        now = time.time()
+        with self._lock:
+            conn = self._connection()
+            for start in range(0, len(keys), self.QUERY_CHUNK_SIZE):
+                chunk = keys[start:start + self.QUERY_CHUNK_SIZE]
+                placeholders = ",".join("?" * len(chunk))
+                rows = conn.execute(
+                    f"SELECT key, vector FROM embedding_cache WHERE key IN ({placeholders})", chunk
+                ).fetchall()
+                found.update(rows)
+                if rows:
+                    conn.execute(
+                        f"UPDATE embedding_cache SET last_access = ? "
+                        f"WHERE key IN ({placeholders}) AND last_access <= ?",
+                        (now, *chunk, now - self.ACCESS_TOUCH_INTERVAL)
+                    )
+            self.stats["hits"] += len(found)
+            self.stats["misses"] += len(keys) - len(found)
+        return found
+
+    def set(self, key: str, value: bytes) -> None:
+        """벡터 하나 저장 (기본 클래스의 JSON 저장 대신 set_many 사용)"""
+        self.set_many([(key, value)])
+
+    def set_many(self, items: Iterable[Tuple[str, bytes]]) -> None:
+        """벡터 일괄 저장 후 LRU 정리 (한 트랜잭션)"""
+        now = time.time()
+        rows = [(key, vector, now) for key, vector in items]
+        if not rows:
+            return
+        with self._lock:
+            conn = self._connection()
+            conn.execute("BEGIN")
+            try:
+                conn.executemany(
+                    "INSERT OR REPLACE INTO embedding_cache (key, vector, last_access) VALUES (?, ?, ?)", rows
+                )
+                conn.execute(
+                    "DELETE FROM embedding_cache WHERE key IN ("
+                    "SELECT key FROM embedding_cache ORDER BY last_access DESC LIMIT -1 OFFSET ?)",
+                    (self.max_entries,)
+                )
+                conn.execute("COMMIT")
+            except sqlite3.Error:
+                conn.execute("ROLLBACK")
+                raise
+            self.stats["stored"] += len(rows)
+
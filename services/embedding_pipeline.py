@@ -0,0 +1,142 @@
+import asyncio
+import logging
+import os
+import sqlite3
+import sys
+from typing import Any, Dict, List, Optional
+
+# 현재 디렉토리를 Python 경로에 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from services.openai_service import openai_service
+from services.embedding_cache import EmbeddingCache, embedding_key
+from services.token_counter import count_tokens
+from config import settings
+
+logger = logging.getLogger(__name__)
+
+
+class EmbeddingPipeline:
+    """
+    대량 텍스트 임베딩 (중복 제거, 캐시, 업스트림 일괄 요청)
+
+    같은 요청 안의 중복 텍스트는 한 번만 임베딩하고, 캐시에 있는 텍스트는 업스트림을 호출하지 않습니다.
+    나머지는 batch_size개, batch_max_tokens 토큰 이하의 묶음으로 나눠 최대 concurrency개를 동시에 보내고,
+    묶음이 끝날 때마다 캐시에 저장합니다. 중간에 실패해도 끝난 묶음은 캐시에 남으므로 다시 요청하면 나머지만 호출합니다.
+    """
+
+    def __init__(
+        self,
+        openai_service,
+        cache: EmbeddingCache,
+        batch_size: int,
+        batch_max_tokens: int,
+        concurrency: int
+    ):
+        self.openai_service = openai_service
+        self.cache = cache
+        self.batch_size = batch_size
+        self.batch_max_tokens = batch_max_tokens
+        self.concurrency = concurrency
+        self.stats = {"requests": 0, "texts": 0, "cacheHits": 0, "upstreamTexts": 0, "upstreamBatches": 0}
+
+    def split_batches(self, texts: List[str]) -> List[List[str]]:
+        """업스트림 한 요청에 들어갈 크기(개수, 토큰 수)로 나누기"""
+        batches: List[List[str]] = []
+        current: List[str] = []
+        current_tokens = 0
+        for text in texts:
+            tokens = count_tokens(text)
+            if current and (len(current) >= self.batch_size or current_tokens + tokens > self.batch_max_tokens):
+                batches.append(current)
+                current, current_tokens = [], 0
+            current.append(text)
+            current_tokens += tokens
+        if current:
+            batches.append(current)
+        return batches
+
+    async def _cached(self, keys: List[str]) -> Dict[str, bytes]:
+        """캐시 조회 (오류가 나면 캐시 없이 진행)"""
+        try:
+            return await asyncio.to_thread(self.cache.get_many, keys)
+        except sqlite3.Error as error:
+            logger.warning("임베딩 캐시 조회 오류", extra={"error": str(error)})
+            return {}
+
+    async def _store(self, items: List[Any]) -> None:
+        """캐시 저장 (오류가 나도 응답은 그대로 반환)"""
+        try:
+            await asyncio.to_thread(self.cache.set_many, items)
+        except sqlite3.Error as error:
+            logger.warning("임베딩 캐시 저장 오류", extra={"error": str(error)})
+
+    async def embed(self, texts: List[str], model: str, dimensions: Optional[int] = None) -> Dict[str, Any]:
+        """
+        텍스트 목록 임베딩
+
+        Args:
+            texts: 임베딩할 텍스트 목록
+            model: 임베딩 모델
+            dimensions: 줄일 차원 수 (None이면 모델 기본값)
+
+        Returns:
+            {"vectors": [입력 순서대로 float32 little-endian 바이트], "dimensions": 차원 수,
+             "usage": 업스트림 사용량, "cacheHits": 캐시로 응답한 고유 텍스트 수,
+             "upstreamTexts": 업스트림으로 보낸 고유 텍스트 수, "upstreamBatches": 업스트림 요청 수}
+        """
+        unique = list(dict.fromkeys(texts))
+        keys = {text: embedding_key(text, model, dimensions) for text in unique}
+        vectors: Dict[str, bytes] = {}
+
+        cached = await self._cached(list(keys.values()))
+        missing = []
+        for text in unique:
+            vector = cached.get(keys[text])
+            if vector is None:
+                missing.append(text)
+            else:
+                vectors[text] = vector
+
+        usage = {"prompt_tokens": 0, "total_tokens": 0}
+        batches = self.split_batches(missing)
+        semaphore = asyncio.Semaphore(self.concurrency)
+
+        async def run_batch(batch: List[str]) -> None:
+            async with semaphore:
+                response = await self.openai_service.create_embeddings(batch, model, dimensions)
+            for key in usage:
+                usage[key] += response["usage"][key]
+            vectors.update(zip(batch, response["vectors"]))
+            await self._store([(keys[text], vector) for text, vector in zip(batch, response["vectors"])])
+
+        await asyncio.gather(*(run_batch(batch) for batch in batches))
+
+        self.stats["requests"] += 1
+        self.stats["texts"] += len(texts)
+        self.stats["cacheHits"] += len(unique) - len(missing)
+        self.stats["upstreamTexts"] += len(missing)
+        self.stats["upstreamBatches"] += len(batches)
+
+        ordered = [vectors[text] for text in texts]
+        return {
+            "vectors": ordered,
+            "dimensions": len(ordered[0]) // 4 if ordered else 0,
+            "usage": usage,
+            "cacheHits": len(unique) - len(missing),
+            "upstreamTexts": len(missing),
+            "upstreamBatches": len(batches)
+        }
+
+
+# 워커 프로세스 전역에서 공유하는 임베딩 파이프라인 (캐시는 워커 간 공유)
+embedding_pipeline = EmbeddingPipeline(
+    openai_service,
+    cache=EmbeddingCache(
+        path=os.path.join(settings.CACHE_DIR, "embeddings.sqlite3"),
+        max_entries=settings.EMBEDDING_CACHE_MAX_ENTRIES
+    ),
+    batch_size=settings.EMBEDDING_BATCH_SIZE,
+    batch_max_tokens=settings.EMBEDDING_BATCH_MAX_TOKENS,
+    concurrency=settings.EMBEDDING_CONCURRENCY
+)
@@ -0,0 +1,229 @@
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import sys
+from typing import Any, Dict, List, Optional, Tuple
+
+# 현재 디렉토리를 Python 경로에 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from services.openai_service import openai_service
+from services.sqlite_cache import SQLiteCache
+from services.token_counter import MESSAGE_OVERHEAD_TOKENS, count_tokens, message_tokens, messages_tokens
+from config import settings
+
+logger = logging.getLogger(__name__)
+
+SUMMARY_PREFIX = "이전 대화 요약:\n"
+
+
+class HistoryCompactor:
+    """
+    대화 히스토리 압축
+
+    시스템 메시지와 최근 대화는 토큰 예산 안에서 그대로 두고, 예산을 넘는 이전 대화는
+    요약 하나로 바꿔 보냅니다. 요약은 대화 앞부분의 해시로 캐시해 두었다가
+    다음 턴에서는 캐시된 요약에 새로 밀려난 메시지만 더해 갱신합니다 (처음부터 다시 요약하지 않음).
+    절약한 토큰 수에서는 요약 호출에 쓴 토큰을 뺍니다.
+    """
+
+    def __init__(
+        self,
+        openai_service,
+        budget: int,
+        summary_model: str,
+        summary_max_tokens: int,
+        cache: Optional[SQLiteCache] = None,
+        summary_ttl: float = 86400
+    ):
+        self.openai_service = openai_service
+        self.budget = budget
+        self.summary_model = summary_model
+        self.summary_max_tokens = summary_max_tokens
+        self.cache = cache
+        self.summary_ttl = summary_ttl
+        self.stats = {
+            "compacted": 0, "summaryCacheHits": 0, "summaryPartialHits": 0, "summaryCalls": 0,
+            "summaryTokens": 0, "tokensSaved": 0, "failures": 0
+        }
+
+    def _prefix_keys(self, messages: List[Dict[str, str]]) -> List[str]:
+        """
+        메시지 앞부분마다의 연쇄 해시 (keys[i]는 messages[:i + 1]을 식별)
+        """
+        keys = []
+        digest = hashlib.sha256(f"summary:{self.summary_model}".encode("utf-8")).hexdigest()
+        for message in messages:
+            payload = json.dumps([digest, message["role"], message["content"]], ensure_ascii=False)
+            digest = hashlib.sha256(payload.encode("utf-8")).hexdigest()
+            keys.append(digest)
+        return keys
+
+    async def _cached_summary(self, keys: List[str]) -> Tuple[int, Optional[str]]:
+        """
+        캐시된 요약 중 가장 긴 앞부분을 덮는 것 찾기 (모든 앞부분 키를 한 번에 조회)
+
+        이전 턴보다 요약할 대화가 줄어 마지막 요약을 쓸 수 없어도, 그 안쪽에서 캐시된
+        가장 긴 앞부분(len(keys) 이하)부터 이어서 요약하도록 돌려줍니다.
+
+        Returns:
+            (요약된 메시지 수, 요약) - 캐시가 없으면 (0, None)
+        """
+        if self.cache is None:
+            return 0, None
+        try:
+            found = await asyncio.to_thread(self.cache.get_many, keys)
+        except sqlite3.Error as error:
+            logger.warning("대화 요약 캐시 조회 오류", extra={"error": str(error)})
+            return 0, None
+        for count in range(len(keys), 0, -1):
+            cached = found.get(keys[count - 1])
+            if cached is not None and cached["age"] < self.summary_ttl:
+                return count, cached["value"]
+        return 0, None
+
+    def build_summary_prompt(self, previous_summary: Optional[str], messages: List[Dict[str, str]]) -> List[Dict[str, str]]:
+        """
+        요약 갱신 프롬프트 작성 (이전 요약 + 새로 밀려난 메시지)
+        """
+        role_names = {"user": "사용자", "assistant": "어시스턴트", "system": "시스템"}
+        transcript = "\n".join(f"{role_names.get(m['role'], m['role'])}: {m['content']}" for m in messages)
+        return [
+            {
+                "role": "system",
+                "content": (
+                    "당신은 대화 기록을 요약하는 도우미입니다. 이후 대화에 필요한 사실, 사용자의 요청과 선호, "
+                    "결정된 사항을 빠짐없이 간결하게 정리하세요. 요약문만 출력하세요."
+                )
+            },
+            {
+                "role": "user",
+                "content": (
+                    f"기존 요약:\n{previous_summary or '(없음)'}\n\n"
+                    f"추가된 대화:\n{transcript}\n\n"
+                    "기존 요약에 추가된 대화 내용을 반영한 새 요약을 작성해주세요."
+                )
+            }
+        ]
+
+    async def _summarize(self, older: List[Dict[str, str]]) -> Tuple[str, bool, int]:
+        """
+        이전 대화 요약 (캐시된 요약이 있으면 이후 메시지만 더해 갱신)
+
+        Returns:
+            (요약, 캐시를 그대로 사용했는지 여부, 요약 호출에 쓴 토큰 수)
+        """
+        keys = self._prefix_keys(older)
+        summarized, summary = await self._cached_summary(keys)
+        if summarized == len(older):
+            self.stats["summaryCacheHits"] += 1
+            return summary, True, 0
+        if summarized:
+            self.stats["summaryPartialHits"] += 1
+
+        self.stats["summaryCalls"] += 1
+        response = await self.openai_service.chat_with_history(
+            messages=self.build_summary_prompt(summary, older[summarized:]),
+            model=self.summary_model,
+            max_tokens=self.summary_max_tokens,
+            temperature=0,
+            route="summary"
+        )
+        summary = response["message"].strip()
+        usage = response.get("usage") or {}
+        summary_tokens = usage.get("prompt_tokens", 0) + usage.get("completion_tokens", 0)
+        self.stats["summaryTokens"] += summary_tokens
+
+        if self.cache is not None:
+            try:
+                await asyncio.to_thread(self.cache.set, keys[-1], summary)
+            except sqlite3.Error as error:
+                logger.warning("대화 요약 캐시 저장 오류", extra={"error": str(error)})
+        return summary, False, summary_tokens
+
+    async def compact(self, messages: List[Dict[str, str]]) -> Tuple[List[Dict[str, str]], Dict[str, Any]]:
+        """
+        토큰 예산에 맞게 대화 히스토리 압축
+
+        시스템 메시지는 모두 유지하고, 최근 메시지부터 예산이 허락하는 만큼 그대로 둔 뒤
+        나머지 이전 대화를 요약 메시지 하나로 바꿉니다. 요약에 실패하면 원래 히스토리를 그대로 보냅니다.
+
+        Args:
+            messages: 대화 히스토리 [{"role": ..., "content": ...}, ...]
+
+        Returns:
+            (보낼 메시지 목록, 압축 정보)
+        """
+        original_tokens = messages_tokens(messages)
+        info = {
+            "compacted": False,
+            "originalTokens": original_tokens,
+            "sentTokens": original_tokens,
+            "tokensSaved": 0,
+            "summaryTokens": 0,
+            "summarizedMessages": 0,
+            "summaryCached": False
+        }
+        if original_tokens <= self.budget:
+            return messages, info
+
+        # 시스템 메시지와 요약 메시지가 들어갈 자리를 남기고 최근 메시지부터 예산 안에 담기
+        available = (
+            self.budget - messages_tokens([m for m in messages if m["role"] == "system"])
+            - self.summary_max_tokens - MESSAGE_OVERHEAD_TOKENS - count_tokens(SUMMARY_PREFIX)
+        )
+        keep_from = len(messages)
+        while keep_from > 0:
+            message = messages[keep_from - 1]
+            if message["role"] != "system":
+                cost = message_tokens(message)
+                # 마지막 메시지는 예산을 넘더라도 항상 보냄
+                if cost > available and keep_from < len(messages):
+                    break
+                available -= cost
+            keep_from -= 1
+
+        older_system = [m for m in messages[:keep_from] if m["role"] == "system"]
+        older = [m for m in messages[:keep_from] if m["role"] != "system"]
+        if not older:
+            return messages, info
+
+        try:
+            summary, cached, summary_tokens = await self._summarize(older)
+        except Exception as error:
+            self.stats["failures"] += 1
+            logger.warning("대화 요약 실패, 원래 히스토리 사용", extra={"error": str(error)})
+            return messages, info
+
+        compacted = older_system + [{"role": "system", "content": SUMMARY_PREFIX + summary}] + messages[keep_from:]
+        sent_tokens = messages_tokens(compacted)
+        info.update({
+            "compacted": True,
+            "sentTokens": sent_tokens,
+            # 요약 호출의 프롬프트/완료 토큰만큼은 절약이 아님
+            "tokensSaved": max(0, original_tokens - sent_tokens - summary_tokens),
+            "summaryTokens": summary_tokens,
+            "summarizedMessages": len(older),
+            "summaryCached": cached
+        })
+        self.stats["compacted"] += 1
+        self.stats["tokensSaved"] += info["tokensSaved"]
+        return compacted, info
+
+
+# 워커 프로세스 전역에서 공유하는 히스토리 압축기 (요약 캐시는 워커 간 공유)
+history_compactor = HistoryCompactor(
+    openai_service,
+    budget=settings.HISTORY_TOKEN_BUDGET,
+    summary_model=settings.HISTORY_SUMMARY_MODEL,
+    summary_max_tokens=settings.HISTORY_SUMMARY_MAX_TOKENS,
+    cache=SQLiteCache(
+        path=os.path.join(settings.CACHE_DIR, "history_summaries.sqlite3"),
+        table="summary_cache",
+        max_entries=settings.HISTORY_SUMMARY_CACHE_MAX_ENTRIES
+    ),
+    summary_ttl=settings.HISTORY_SUMMARY_CACHE_TTL
+)
@@ -0,0 +1,345 @@
+import bisect
+import json
+import math
+import os
+import sys
+from datetime import date, datetime, timedelta
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Tuple
+
+# 현재 디렉토리를 Python 경로에 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from config import settings
+
+# 한국 표준시 (음력 날짜는 동경 135도 기준으로 정함)
+_KST_OFFSET_DAYS = 9 / 24
+# 율리우스일 2440587.5 = 1970-01-01 00:00 UTC
+_UNIX_EPOCH_JD = 2440587.5
+_SYNODIC_MONTH = 29.530588861
+
+# 양력 공휴일: (월, 일, 이름)
+_SOLAR_HOLIDAYS = (
+    (1, 1, "신정"),
+    (3, 1, "삼일절"),
+    (5, 5, "어린이날"),
+    (6, 6, "현충일"),
+    (8, 15, "광복절"),
+    (10, 3, "개천절"),
+    (10, 9, "한글날"),
+    (12, 25, "크리스마스"),
+)
+
+# 대체공휴일 규칙: 이름 → (토요일도 대체하는지, 적용 시작 연도)
+# 설날·추석은 연휴 중 일요일이나 다른 공휴일과 겹칠 때만 대체합니다.
+_SUBSTITUTE_RULES = {
+    "설날": (False, 2014),
+    "추석": (False, 2014),
+    "어린이날": (True, 2014),
+    "삼일절": (True, 2021),
+    "광복절": (True, 2021),
+    "개천절": (True, 2021),
+    "한글날": (True, 2021),
+    "부처님오신날": (True, 2023),
+    "크리스마스": (True, 2023),
+}
+
+
+def _sin(degrees: float) -> float:
+    return math.sin(math.radians(degrees))
+
+
+def _delta_t_days(year: float) -> float:
+    """지구 시간(TT)과 세계시(UT)의 차이 (일 단위, 2005~2050 근사식)"""
+    t = year - 2000
+    return (62.92 + 0.32217 * t + 0.005589 * t * t) / 86400
+
+
+def _jd_to_kst_date(jd: float) -> date:
+    """율리우스일(UT)을 한국 표준시 날짜로 변환"""
+    return (datetime(1970, 1, 1) + timedelta(days=jd - _UNIX_EPOCH_JD + _KST_OFFSET_DAYS)).date()
+
+
+def _date_to_jd(value: date) -> float:
+    """날짜의 0시(UT) 율리우스일"""
+    return _UNIX_EPOCH_JD + (value - date(1970, 1, 1)).days
+
+
+def _new_moon_jd(k: int) -> float:
+    """
+    k번째 합삭 시각 (율리우스일, UT)
+
+    Jean Meeus, Astronomical Algorithms 49장의 주요 보정항을 사용합니다 (오차 수 분 이내).
+    k=0은 2000년 1월 6일 합삭입니다.
+    """
+    t = k / 1236.85
+    jde = (2451550.09766 + _SYNODIC_MONTH * k + 0.00015437 * t ** 2
+           - 0.000000150 * t ** 3 + 0.00000000073 * t ** 4)
+    e = 1 - 0.002516 * t - 0.0000074 * t ** 2
+    m = 2.5534 + 29.10535670 * k - 0.0000014 * t ** 2 - 0.00000011 * t ** 3
+    mp = 201.5643 + 385.81693528 * k + 0.0107582 * t ** 2 + 0.00001238 * t ** 3 - 0.000000058 * t ** 4
+    f = 160.7108 + 390.67050284 * k - 0.0016118 * t ** 2 - 0.00000227 * t ** 3 + 0.000000011 * t ** 4
+    omega = 124.7746 - 1.56375588 * k + 0.0020672 * t ** 2 + 0.00000215 * t ** 3
+
+    jde += (
+        -0.40720 * _sin(mp)
+        + 0.17241 * e * _sin(m)
+        + 0.01608 * _sin(2 * mp)
+        + 0.01039 * _sin(2 * f)
+        + 0.00739 * e * _sin(mp - m)
+        - 0.00514 * e * _sin(mp + m)
+        + 0.00208 * e * e * _sin(2 * m)
+        - 0.00111 * _sin(mp - 2 * f)
+        - 0.00057 * _sin(mp + 2 * f)
+        + 0.00056 * e * _sin(2 * mp + m)
+        - 0.00042 * _sin(3 * mp)
+        + 0.00042 * e * _sin(m + 2 * f)
+        + 0.00038 * e * _sin(m - 2 * f)
+        - 0.00024 * e * _sin(2 * mp - m)
+        - 0.00017 * _sin(omega)
+        - 0.00007 * _sin(mp + 2 * m)
+        + 0.00004 * _sin(2 * mp - 2 * f)
+        + 0.00004 * _sin(3 * m)
+        + 0.00003 * _sin(mp + m - 2 * f)
+        + 0.00003 * _sin(2 * mp + 2 * f)
+        - 0.00003 * _sin(mp + m + 2 * f)
+        + 0.00003 * _sin(mp - m + 2 * f)
+        - 0.00002 * _sin(mp - m - 2 * f)
+        - 0.00002 * _sin(3 * mp + m)
+        + 0.00002 * _sin(4 * mp)
+    )
+    return jde - _delta_t_days(2000 + k / 12.3685)
+
+
+def _sun_longitude(jd: float) -> float:
+    """태양의 겉보기 황경 (도, Meeus 25장 저정밀 식, 오차 약 0.01도)"""
+    t = (jd + _delta_t_days(2000 + (jd - 2451545.0) / 365.25) - 2451545.0) / 36525
+    l0 = 280.46646 + 36000.76983 * t + 0.0003032 * t ** 2
+    m = 357.52911 + 35999.05029 * t - 0.0001537 * t ** 2
+    c = ((1.914602 - 0.004817 * t - 0.000014 * t ** 2) * _sin(m)
+         + (0.019993 - 0.000101 * t) * _sin(2 * m)
+         + 0.000289 * _sin(3 * m))
+    omega = 125.04 - 1934.136 * t
+    return (l0 + c - 0.00569 - 0.00478 * _sin(omega)) % 360
+
+
+def _solar_term_jd(year: int, longitude: float) -> float:
+    """해당 연도에 태양 황경이 longitude가 되는 시각 (율리우스일, UT)"""
+    # 춘분(0도)이 3월 20일 무렵이므로 거기서부터 대략적인 위치를 잡고 뉴턴법으로 보정
+    jd = _date_to_jd(date(year, 3, 20)) + ((longitude % 360) / 360) * 365.2422
+    for _ in range(6):
+        diff = (longitude - _sun_longitude(jd) + 180) % 360 - 180
+        jd += diff / 360 * 365.2422
+        if abs(diff) < 1e-6:
+            break
+    return jd
+
+
+def _new_moon_on_or_before(value: date) -> Tuple[int, date]:
+    """날짜(KST) 이전이나 당일에 있는 마지막 합삭 (k, 날짜)"""
+    k = math.floor((_date_to_jd(value) - 2451550.09766) / _SYNODIC_MONTH) + 1
+    while _jd_to_kst_date(_new_moon_jd(k)) > value:
+        k -= 1
+    return k, _jd_to_kst_date(_new_moon_jd(k))
+
+
+@lru_cache(maxsize=64)
+def lunar_months(year: int) -> Tuple[Tuple[int, bool, date], ...]:
+    """
+    양력 year년 동지 전후의 음력 달 목록
+
+    전년도 동지가 든 달(11월)부터 올해 동지가 든 달 직전까지의 달을 계산합니다.
+    두 동짓달 사이에 달이 13개이면 중기(30도 단위 황경)가 없는 첫 달을 윤달로 둡니다.
+
+    Returns:
+        (음력 월, 윤달 여부, 초하루 날짜) 튜플 목록
+    """
+    start_k, _ = _new_moon_on_or_before(_jd_to_kst_date(_solar_term_jd(year - 1, 270)))
+    end_k, _ = _new_moon_on_or_before(_jd_to_kst_date(_solar_term_jd(year, 270)))
+    starts = [_jd_to_kst_date(_new_moon_jd(k)) for k in range(start_k, end_k + 1)]
+
+    leap_index = None
+    if end_k - start_k == 13:
+        terms = sorted(
+            _jd_to_kst_date(_solar_term_jd(y, longitude))
+            for y, longitude in [(year - 1, 300), (year - 1, 330)] + [(year, 30 * i) for i in range(10)]
+        )
+        for index in range(1, len(starts) - 1):
+            if not any(starts[index] <= term < starts[index + 1] for term in terms):
+                leap_index = index
+                break
+
+    months = []
+    month = 11
+    for index, start in enumerate(starts[:-1]):
+        is_leap = index == leap_index
+        if index > 0 and not is_leap:
+            month = month % 12 + 1
+        months.append((month, is_leap, start))
+    return tuple(months)
+
+
+def lunar_to_solar(year: int, month: int, day: int) -> date:
+    """
+    음력 날짜(평달)를 양력으로 변환
+
+    Args:
+        year: 음력 연도
+        month: 음력 월 (1~10)
+        day: 음력 일
+
+    Returns:
+        양력 날짜
+    """
+    for lunar_month, is_leap, start in lunar_months(year):
+        if lunar_month == month and not is_leap and start.year >= year:
+            return start + timedelta(days=day - 1)
+    raise ValueError(f"음력 {year}년 {month}월을 찾을 수 없습니다")
+
+
+@lru_cache(maxsize=64)
+def compute_holidays(year: int) -> Dict[date, Dict[str, str]]:
+    """
+    한 해의 법정 공휴일 계산 (양력 공휴일, 설날·추석 연휴, 부처님오신날, 대체공휴일)
+
+    Args:
+        year: 연도
+
+    Returns:
+        날짜별 공휴일 정보
+    """
+    # (이름, 연휴 날짜 목록, 연휴 안에서 각 날짜의 표시 이름)
+    occurrences: List[Tuple[str, List[date], List[str]]] = []
+    for month, day, name in _SOLAR_HOLIDAYS:
+        occurrences.append((name, [date(year, month, day)], [name]))
+
+    for name, month, day in (("설날", 1, 1), ("추석", 8, 15)):
+        center = lunar_to_solar(year, month, day)
+        occurrences.append((
+            name,
+            [center - timedelta(days=1), center, center + timedelta(days=1)],
+            [f"{name} 연휴", name, f"{name} 연휴"]
+        ))
+    occurrences.append(("부처님오신날", [lunar_to_solar(year, 4, 8)], ["부처님오신날"]))
+    occurrences.sort(key=lambda item: item[1][0])
+
+    holidays: Dict[date, Dict[str, str]] = {}
+    substitutes_needed: List[Tuple[str, date]] = []
+    for name, days, labels in occurrences:
+        saturday, since = _SUBSTITUTE_RULES.get(name, (False, None))
+        triggered = False
+        for day, label in zip(days, labels):
+            if day in holidays:
+                # 같은 날 공휴일이 겹치면 이름을 함께 표시
+                holidays[day] = {"name": f"{holidays[day]['name']}·{label}", "type": "holiday"}
+                triggered = True
+            else:
+                holidays[day] = {"name": label, "type": "holiday"}
+            if day.weekday() == 6 or (saturday and day.weekday() == 5):
+                triggered = True
+        if since is not None and year >= since and triggered:
+            substitutes_needed.append((name, days[-1]))
+
+    for name, last_day in substitutes_needed:
+        day = last_day + timedelta(days=1)
+        while day.weekday() >= 5 or day in holidays:
+            day += timedelta(days=1)
+        holidays[day] = {"name": f"{name} 대체공휴일", "type": "holiday"}
+
+    return holidays
+
+
+class HolidayCalendar:
+    """
+    한국 공휴일 및 특별한 날 달력
+
+    공휴일은 연도별로 처음 조회될 때 계산해 색인해 두고 (프로세스당 한 번),
+    선거일이나 임시공휴일 같은 추가 일정은 데이터 파일에서 읽어 합칩니다.
+    날짜별 조회와 기간 조회(예: 주간 일정) 모두 연도별 정렬 색인을 사용합니다.
+    """
+
+    # 음력 계산을 검증한 연도 범위 (ΔT 근사식과 설날 날짜가 알려진 값과 맞는 구간)
+    MIN_YEAR = 1900
+    MAX_YEAR = 2100
+
+    def __init__(self, data_path: Optional[str] = None):
+        self.data_path = data_path
+        self._extra_days: Optional[Dict[int, Dict[date, Dict[str, str]]]] = None
+        # 연도별 (정렬된 날짜 목록, 날짜별 정보)
+        self._years: Dict[int, Tuple[List[date], Dict[date, Dict[str, str]]]] = {}
+
+    def _load_extra_days(self) -> Dict[int, Dict[date, Dict[str, str]]]:
+        """데이터 파일의 추가 일정을 연도별로 읽기 (파일이 없으면 비어 있음)"""
+        if self._extra_days is None:
+            extra: Dict[int, Dict[date, Dict[str, str]]] = {}
+            if self.data_path and os.path.exists(self.data_path):
+                with open(self.data_path, encoding="utf-8") as f:
+                    for date_str, info in json.load(f).items():
+                        day = date.fromisoformat(date_str)
+                        extra.setdefault(day.year, {})[day] = {
+                            "name": info["name"],
+                            "type": info.get("type", "holiday")
+                        }
+            self._extra_days = extra
+        return self._extra_days
+
+    def _year(self, year: int) -> Tuple[List[date], Dict[date, Dict[str, str]]]:
+        """연도별 색인 (처음 조회할 때 계산)"""
+        index = self._years.get(year)
+        if index is None:
+            days = dict(compute_holidays(year))
+            for day, info in self._load_extra_days().get(year, {}).items():
+                if day in days and info["type"] != "holiday":
+                    continue
+                days[day] = info
+            index = (sorted(days), days)
+            self._years[year] = index
+        return index
+
+    def get(self, target_date: date) -> Optional[Dict[str, str]]:
+        """
+        날짜의 공휴일 또는 특별한 날 정보
+
+        Args:
+            target_date: 확인할 날짜
+
+        Returns:
+            {"name": ..., "type": "holiday" | "event"} 또는 None
+        """
+        return self._year(target_date.year)[1].get(target_date)
+
+    def is_holiday(self, target_date: date) -> Optional[Dict[str, str]]:
+        """
+        날짜가 공휴일인지 확인 (공휴일이 아닌 특별한 날은 제외)
+
+        Args:
+            target_date: 확인할 날짜
+
+        Returns:
+            공휴일 정보 또는 None
+        """
+        info = self.get(target_date)
+        return info if info and info["type"] == "holiday" else None
+
+    def between(self, start_date: date, end_date: date) -> List[Tuple[date, Dict[str, str]]]:
+        """
+        기간 안의 모든 공휴일과 특별한 날 (양 끝 포함, 날짜순)
+
+        Args:
+            start_date: 시작 날짜
+            end_date: 종료 날짜
+
+        Returns:
+            (날짜, 정보) 목록
+        """
+        result = []
+        for year in range(start_date.year, end_date.year + 1):
+            days, info = self._year(year)
+            lo = bisect.bisect_left(days, start_date)
+            hi = bisect.bisect_right(days, end_date)
+            result.extend((day, info[day]) for day in days[lo:hi])
+        return result
+
+
+# 워커 프로세스 전역에서 공유하는 공휴일 달력
+holiday_calendar = HolidayCalendar(settings.HOLIDAY_DATA_PATH)
@@ -0,0 +1,285 @@
+import asyncio
+import glob
+import json
+import logging
+import os
+import sys
+import time
+from bisect import bisect_left
+from collections import defaultdict
+from typing import Any, Dict, List, Optional, Tuple
+
+# 현재 디렉토리를 Python 경로에 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from config import settings
+
+logger = logging.getLogger(__name__)
+
+# 응답 시간 히스토그램 구간 (초)
+DEFAULT_BUCKETS = (0.01, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 20, 30, 60, 120)
+
+# 기본 구간과 다른 구간을 쓰는 히스토그램
+HISTOGRAM_BUCKETS: Dict[str, Tuple[float, ...]] = {
+    "event_loop_lag_seconds": (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5),
+}
+
+# 지표 이름별 (종류, 설명)
+METRIC_DEFINITIONS: Dict[str, Tuple[str, str]] = {
+    "http_request_duration_seconds": ("histogram", "HTTP 요청 처리 시간 (스트리밍은 마지막 청크까지)"),
+    "http_requests_in_flight": ("gauge", "처리 중인 HTTP 요청 수"),
+    "http_compressed_response_bytes_total": ("counter", "압축한 응답의 압축 전후 본문 바이트 수"),
+    "openai_request_duration_seconds": ("histogram", "OpenAI 업스트림 호출 시간 (재시도는 시도마다)"),
+    "openai_errors_total": ("counter", "OpenAI 호출 시도 실패 수 (오류 종류별)"),
+    "openai_calls_total": ("counter", "재시도를 거친 OpenAI 호출 최종 결과 수"),
+    "openai_tokens_total": ("counter", "OpenAI 응답 usage 기준 사용 토큰 수"),
+    "recommendation_cache_events_total": ("counter", "추천 캐시 조회 결과 수"),
+    "single_flight_calls_total": ("counter", "합치기(single-flight) 대상 호출 수 (실제 호출/합쳐짐)"),
+    "semantic_cache_events_total": ("counter", "의미 기반 응답 캐시 조회 결과 수 (hit, miss)"),
+    "completion_cache_events_total": ("counter", "결정적 호출 응답 캐시 조회 결과 수 (hit, miss)"),
+    "event_loop_lag_seconds": ("histogram", "이벤트 루프 지연 (예약한 시각보다 늦게 깨어난 시간)"),
+}
+
+LabelKey = Tuple[Tuple[str, str], ...]
+
+
+def _labels(labels: Dict[str, Any]) -> LabelKey:
+    """레이블 딕셔너리를 정렬된 튜플로 변환 (딕셔너리 키로 사용)"""
+    return tuple(sorted((key, str(value)) for key, value in labels.items()))
+
+
+def _escape(value: str) -> str:
+    """Prometheus 레이블 값 이스케이프"""
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(labels: LabelKey, extra: Optional[Tuple[str, str]] = None) -> str:
+    """{key="value",...} 형식 레이블 문자열"""
+    items = list(labels) + ([extra] if extra else [])
+    if not items:
+        return ""
+    return "{" + ",".join(f'{key}="{_escape(value)}"' for key, value in items) + "}"
+
+
+def _buckets(name: str) -> Tuple[float, ...]:
+    """히스토그램 구간 상한 목록"""
+    return HISTOGRAM_BUCKETS.get(name, DEFAULT_BUCKETS)
+
+
+def _format_value(value: float) -> str:
+    """정수는 소수점 없이 표시"""
+    return str(int(value)) if float(value).is_integer() else repr(float(value))
+
+
+class MetricsRegistry:
+    """
+    Prometheus 형식 지표 수집 (워커 프로세스별 기록, 조회 시 합산)
+
+    기록은 이벤트 루프 스레드에서 딕셔너리 값만 바꾸므로 잠금이 필요 없습니다.
+    워커마다 flush_interval마다(그리고 /metrics 조회 시) 자기 값을 METRICS_DIR의 파일로 내보내고,
+    /metrics는 모든 워커 파일을 합산해 응답합니다. 카운터와 히스토그램은 종료된 워커 값도
+    dead_worker_ttl 동안 합산에 남기고(값이 줄어들지 않도록), 게이지는 살아 있는 워커 값만 합산합니다.
+    """
+
+    def __init__(
+        self,
+        directory: str,
+        flush_interval: float,
+        dead_worker_ttl: float,
+        enabled: bool = True,
+        loop_lag_interval: float = 0
+    ):
+        self.directory = directory
+        self.flush_interval = flush_interval
+        self.dead_worker_ttl = dead_worker_ttl
+        self.enabled = enabled
+        self.loop_lag_interval = loop_lag_interval
+        self._counters: Dict[Tuple[str, LabelKey], float] = defaultdict(float)
+        self._gauges: Dict[Tuple[str, LabelKey], float] = defaultdict(float)
+        # (이름, 레이블) -> [구간별 개수..., +Inf 개수, 합계]
+        self._histograms: Dict[Tuple[str, LabelKey], List[float]] = {}
+        self._task: Optional[asyncio.Task] = None
+        self._lag_task: Optional[asyncio.Task] = None
+
+    def inc(self, name: str, value: float = 1, **labels: Any) -> None:
+        """카운터 증가"""
+        if self.enabled:
+            self._counters[(name, _labels(labels))] += value
+
+    def gauge_add(self, name: str, delta: float, **labels: Any) -> None:
+        """게이지 증감"""
+        if self.enabled:
+            self._gauges[(name, _labels(labels))] += delta
+
+    def observe(self, name: str, value: float, **labels: Any) -> None:
+        """히스토그램에 값 기록"""
+        if not self.enabled:
+            return
+        key = (name, _labels(labels))
+        buckets = _buckets(name)
+        histogram = self._histograms.get(key)
+        if histogram is None:
+            histogram = self._histograms[key] = [0.0] * (len(buckets) + 2)
+        histogram[bisect_left(buckets, value)] += 1
+        histogram[-1] += value
+
+    def _path(self, pid: int) -> str:
+        """워커별 지표 파일 경로"""
+        return os.path.join(self.directory, f"worker-{pid}.json")
+
+    def flush(self) -> None:
+        """현재 워커의 지표를 파일로 내보냄 (임시 파일에 쓴 뒤 교체)"""
+        if not self.enabled:
+            return
+        os.makedirs(self.directory, exist_ok=True)
+        snapshot = {
+            "pid": os.getpid(),
+            "writtenAt": time.time(),
+            "counters": [[name, list(labels), value] for (name, labels), value in self._counters.items()],
+            "gauges": [[name, list(labels), value] for (name, labels), value in self._gauges.items()],
+            "histograms": [[name, list(labels), values] for (name, labels), values in self._histograms.items()]
+        }
+        path = self._path(os.getpid())
+        temp_path = f"{path}.tmp"
+        with open(temp_path, "w", encoding="utf-8") as file:
+            json.dump(snapshot, file)
+        os.replace(temp_path, path)
+
+    @staticmethod
+    def _is_alive(pid: int) -> bool:
+        """프로세스가 살아 있는지 확인"""
+        try:
+            os.kill(pid, 0)
+        except ProcessLookupError:
+            return False
+        except PermissionError:
+            return True
+        return True
+
+    def collect(self) -> Dict[str, Any]:
+        """
+        모든 워커 파일을 읽어 합산 (오래된 종료 워커 파일은 삭제)
+
+        Returns:
+            {"counters": {...}, "gauges": {...}, "histograms": {...}, "workers": 살아 있는 워커 수}
+        """
+        self.flush()
+        counters: Dict[Tuple[str, LabelKey], float] = defaultdict(float)
+        gauges: Dict[Tuple[str, LabelKey], float] = defaultdict(float)
+        histograms: Dict[Tuple[str, LabelKey], List[float]] = {}
+        workers = 0
+        now = time.time()
+
+        for path in glob.glob(os.path.join(self.directory, "worker-*.json")):
+            try:
+                with open(path, encoding="utf-8") as file:
+                    snapshot = json.load(file)
+            except (OSError, ValueError) as error:
+                logger.warning("지표 파일 읽기 오류", extra={"file": path, "error": str(error)})
+                continue
+
+            alive = self._is_alive(snapshot["pid"])
+            if not alive and now - snapshot["writtenAt"] > self.dead_worker_ttl:
+                try:
+                    os.remove(path)
+                except OSError:
+                    pass
+                continue
+
+            for name, labels, value in snapshot["counters"]:
+                counters[(name, tuple(map(tuple, labels)))] += value
+            if alive:
+                workers += 1
+                for name, labels, value in snapshot["gauges"]:
+                    gauges[(name, tuple(map(tuple, labels)))] += value
+            for name, labels, values in snapshot["histograms"]:
+                key = (name, tuple(map(tuple, labels)))
+                total = histograms.get(key)
+                if total is None:
+                    histograms[key] = list(values)
+                else:
+                    for index, value in enumerate(values):
+                        total[index] += value
+
+        return {"counters": counters, "gauges": gauges, "histograms": histograms, "workers": workers}
+
+    def render(self) -> str:
+        """모든 워커를 합산한 Prometheus 텍스트 형식 (0.0.4)"""
+        collected = self.collect()
+        series: Dict[str, List[str]] = defaultdict(list)
+
+        for kind in ("counters", "gauges"):
+            for (name, labels), value in sorted(collected[kind].items()):
+                series[name].append(f"{name}{_format_labels(labels)} {_format_value(value)}")
+
+        for (name, labels), values in sorted(collected["histograms"].items()):
+            buckets = _buckets(name)
+            cumulative = 0.0
+            for bound, count in zip(buckets, values):
+                cumulative += count
+                series[name].append(f"{name}_bucket{_format_labels(labels, ('le', _format_value(bound)))} {_format_value(cumulative)}")
+            cumulative += values[len(buckets)]
+            series[name].append(f"{name}_bucket{_format_labels(labels, ('le', '+Inf'))} {_format_value(cumulative)}")
+            series[name].append(f"{name}_sum{_format_labels(labels)} {_format_value(values[-1])}")
+            series[name].append(f"{name}_count{_format_labels(labels)} {_format_value(cumulative)}")
+
+        series["metrics_workers"].append(f"metrics_workers {collected['workers']}")
+        definitions = {**METRIC_DEFINITIONS, "metrics_workers": ("gauge", "지표를 내보내는 살아 있는 워커 수")}
+
+        lines = []
+        for name, samples in series.items():
+            kind, description = definitions.get(name, ("untyped", name))
+            lines.append(f"# HELP {name} {description}")
+            lines.append(f"# TYPE {name} {kind}")
+            lines.extend(samples)
+        return "\n".join(lines) + "\n"
+
+    async def start(self) -> None:
+        """주기적으로 파일 내보내기 시작"""
+        if self.enabled and self._task is None:
+            self._task = asyncio.create_task(self._run_forever())
+        if self.enabled and self.loop_lag_interval > 0 and self._lag_task is None:
+            self._lag_task = asyncio.create_task(self._measure_loop_lag())
+
+    async def stop(self) -> None:
+        """주기적 내보내기 종료 (마지막 값은 한 번 더 내보냄)"""
+        for task in (self._task, self._lag_task):
+            if task is not None:
+                task.cancel()
+                try:
+                    await task
+                except asyncio.CancelledError:
+                    pass
+        self._task = None
+        self._lag_task = None
+        try:
+            self.flush()
+        except OSError as error:
+            logger.warning("지표 파일 저장 오류", extra={"error": str(error)})
+
+    async def _run_forever(self) -> None:
+        """flush_interval마다 파일로 내보냄"""
+        while True:
+            await asyncio.sleep(self.flush_interval)
+            try:
+                self.flush()
+            except OSError as error:
+                logger.warning("지표 파일 저장 오류", extra={"error": str(error)})
+
+    async def _measure_loop_lag(self) -> None:
+        """loop_lag_interval마다 잠들었다 깨어난 시각이 예약보다 얼마나 늦었는지 기록"""
+        loop = asyncio.get_running_loop()
+        while True:
+            scheduled = loop.time() + self.loop_lag_interval
+            await asyncio.sleep(self.loop_lag_interval)
+            self.observe("event_loop_lag_seconds", max(0.0, loop.time() - scheduled))
+
+
+# 워커 프로세스 전역 지표 수집기
+metrics = MetricsRegistry(
+    directory=settings.METRICS_DIR,
+    flush_interval=settings.METRICS_FLUSH_INTERVAL,
+    dead_worker_ttl=settings.METRICS_DEAD_WORKER_TTL,
+    enabled=settings.METRICS_ENABLED,
+    loop_lag_interval=settings.METRICS_LOOP_LAG_INTERVAL
+)
@@ -0,0 +1,124 @@
+import asyncio
+import logging
+import time
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Set
+
+logger = logging.getLogger(__name__)
+
+
+class ModelCatalog:
+    """
+    OpenAI 모델 목록 캐시 (워커 프로세스 메모리)
+
+    모델 목록은 거의 바뀌지 않으므로 앱 시작 시 한 번 받아 두고 ttl마다 백그라운드에서 갱신합니다.
+    갱신에 실패하면 마지막으로 받은 목록을 계속 쓰고 retry_interval 뒤에 다시 시도합니다.
+    요청 모델 검증에는 필터링 전 전체 모델 ID를 사용합니다.
+    """
+
+    def __init__(
+        self,
+        fetch: Callable[[], Awaitable[List[Any]]],
+        ttl: float,
+        retry_interval: float
+    ):
+        self._fetch = fetch
+        self.ttl = ttl
+        self.retry_interval = retry_interval
+        self._models: Optional[List[Dict[str, Any]]] = None
+        self._model_ids: Set[str] = set()
+        self._fetched_at: Optional[float] = None
+        self._last_error: Optional[str] = None
+        self._lock = asyncio.Lock()
+        self._task: Optional[asyncio.Task] = None
+        self.stats = {"refreshes": 0, "failures": 0}
+
+    @property
+    def loaded(self) -> bool:
+        """한 번이라도 목록을 받아왔는지"""
+        return self._models is not None
+
+    async def start(self) -> None:
+        """백그라운드 갱신 시작 (시작하자마자 한 번 받아오며, 앱 시작을 기다리게 하지 않음)"""
+        if self._task is None:
+            self._task = asyncio.create_task(self._run_forever())
+
+    async def stop(self) -> None:
+        """백그라운드 갱신 종료"""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def _run_forever(self) -> None:
+        """시작 시 한 번, 이후 ttl마다 갱신 (마지막 갱신이 실패했으면 retry_interval 뒤에 다시 시도)"""
+        while True:
+            await self.refresh()
+            await asyncio.sleep(self.ttl if self._last_error is None else self.retry_interval)
+
+    async def refresh(self) -> bool:
+        """
+        업스트림에서 모델 목록을 다시 받아 교체
+
+        Returns:
+            갱신 성공 여부
+        """
+        async with self._lock:
+            return await self._refresh_locked()
+
+    async def _refresh_locked(self) -> bool:
+        """목록 갱신 (잠금을 잡은 상태에서 호출)"""
+        try:
+            models = await self._fetch()
+        except asyncio.CancelledError:
+            raise
+        except Exception as error:
+            self.stats["failures"] += 1
+            self._last_error = str(error)
+            logger.warning("모델 목록 갱신 실패", extra={"usingPrevious": self.loaded, "error": str(error)})
+            return False
+
+        self._model_ids = {model.id for model in models}
+        self._models = [
+            {"id": model.id, "name": model.id, "created": model.created}
+            for model in models if 'gpt' in model.id
+        ]
+        self._fetched_at = time.time()
+        self._last_error = None
+        self.stats["refreshes"] += 1
+        logger.info("모델 목록 갱신 완료", extra={"models": len(self._models)})
+        return True
+
+    async def get(self) -> List[Dict[str, Any]]:
+        """
+        GPT 모델 목록 (아직 받은 적이 없으면 지금 받아옴)
+
+        Raises:
+            RuntimeError: 목록을 한 번도 받아오지 못한 경우
+        """
+        if not self.loaded:
+            # 동시에 들어온 요청들은 잠금을 기다렸다가 먼저 받은 목록을 사용
+            async with self._lock:
+                if not self.loaded:
+                    await self._refresh_locked()
+        if not self.loaded:
+            raise RuntimeError(f"모델 목록을 가져오지 못했습니다: {self._last_error}")
+        return self._models
+
+    def is_available(self, model: str) -> bool:
+        """
+        OpenAI가 받아줄 모델인지 확인 (목록을 아직 받지 못했으면 판단하지 않고 허용)
+        """
+        return not self.loaded or model in self._model_ids
+
+    def snapshot(self) -> Dict[str, Any]:
+        """목록 상태와 통계"""
+        return {
+            "loaded": self.loaded,
+            "models": len(self._models or []),
+            "ageSeconds": round(time.time() - self._fetched_at) if self._fetched_at else None,
+            "lastError": self._last_error,
+            **self.stats
+        }
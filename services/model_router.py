@@ -0,0 +1,222 @@
+import asyncio
+import json
+import logging
+import math
+import time
+from collections import deque
+from dataclasses import dataclass, fields
+from typing import Any, Awaitable, Callable, Deque, Dict, List, Optional
+
+from services.token_counter import messages_tokens
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class RoutePolicy:
+    """
+    경로(route)별 모델 선택 정책
+
+    - fast: 항상 빠른 모델로 보냄 (한 줄 추천처럼 짧고 가치가 낮은 요청)
+    - hedge: 기본 모델이 지연 기준(p95)을 넘기면 빠른 모델에도 요청을 보내 먼저 온 응답 사용
+    - short_prompt_tokens: 프롬프트가 이 토큰 수 이하이면 빠른 모델로 보냄 (0이면 사용 안 함)
+    """
+    fast: bool = False
+    hedge: bool = False
+    short_prompt_tokens: int = 0
+
+
+# 기본 경로별 정책 (MODEL_ROUTE_POLICIES 환경변수로 덮어쓸 수 있음)
+DEFAULT_ROUTE_POLICIES: Dict[str, RoutePolicy] = {
+    "chat": RoutePolicy(hedge=True),
+    "conversation": RoutePolicy(hedge=True),
+    "upload_time": RoutePolicy(fast=True),
+    "summary": RoutePolicy(fast=True),
+}
+
+
+def parse_route_policies(raw: str) -> Dict[str, RoutePolicy]:
+    """
+    기본 정책에 JSON 설정을 덮어쓴 경로별 정책
+
+    예: '{"chat": {"hedge": false}, "upload_time": {"fast": false, "short_prompt_tokens": 300}}'
+    """
+    policies = dict(DEFAULT_ROUTE_POLICIES)
+    if not raw:
+        return policies
+
+    names = {field.name for field in fields(RoutePolicy)}
+    for route, overrides in json.loads(raw).items():
+        base = policies.get(route, RoutePolicy())
+        values = {name: getattr(base, name) for name in names}
+        values.update({key: value for key, value in overrides.items() if key in names})
+        policies[route] = RoutePolicy(**values)
+    return policies
+
+
+class LatencyTracker:
+    """모델별 최근 응답 시간 기록 (이동 구간 백분위수)"""
+
+    def __init__(self, window: int):
+        self.window = window
+        self._samples: Dict[str, Deque[float]] = {}
+
+    def record(self, model: str, seconds: float) -> None:
+        """응답 시간 기록"""
+        samples = self._samples.get(model)
+        if samples is None:
+            samples = self._samples[model] = deque(maxlen=self.window)
+        samples.append(seconds)
+
+    def percentile(self, model: str, percentile: float) -> Optional[float]:
+        """최근 응답 시간의 백분위수 (기록이 없으면 None)"""
+        samples = self._samples.get(model)
+        if not samples:
+            return None
+        ordered = sorted(samples)
+        index = min(len(ordered) - 1, max(0, math.ceil(percentile / 100 * len(ordered)) - 1))
+        return ordered[index]
+
+    def count(self, model: str) -> int:
+        """기록된 응답 수"""
+        return len(self._samples.get(model, ()))
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        """모델별 응답 수와 p50/p95 (초)"""
+        return {
+            model: {
+                "count": len(samples),
+                "p50": round(self.percentile(model, 50), 3),
+                "p95": round(self.percentile(model, 95), 3)
+            }
+            for model, samples in self._samples.items() if samples
+        }
+
+
+class ModelRouter:
+    """
+    지연 시간 기반 모델 라우팅
+
+    경로별 정책에 따라 빠른 모델(FALLBACK_MODEL)로 바로 보내거나,
+    기본 모델 요청이 최근 p95 응답 시간을 넘기면 빠른 모델에도 같은 요청을 보내(hedging)
+    먼저 도착한 응답을 쓰고 나머지 요청은 취소합니다.
+    """
+
+    def __init__(
+        self,
+        fast_model: str,
+        policies: Dict[str, RoutePolicy],
+        hedge_percentile: float,
+        hedge_min_delay: float,
+        hedge_default_delay: float,
+        min_samples: int,
+        window: int
+    ):
+        self.fast_model = fast_model
+        self.policies = policies
+        self.hedge_percentile = hedge_percentile
+        self.hedge_min_delay = hedge_min_delay
+        self.hedge_default_delay = hedge_default_delay
+        self.min_samples = min_samples
+        self.latency = LatencyTracker(window)
+        self.stats = {"requests": 0, "fastRouted": 0, "hedged": 0, "hedgeWins": 0}
+
+    def policy(self, route: Optional[str]) -> RoutePolicy:
+        """경로 정책 (등록되지 않은 경로는 라우팅 없이 요청한 모델 사용)"""
+        return self.policies.get(route or "", RoutePolicy())
+
+    def resolve_model(
+        self,
+        route: Optional[str],
+        model: str,
+        messages: Optional[List[Dict[str, str]]] = None
+    ) -> str:
+        """
+        경로 정책에 따라 실제로 호출할 모델 결정
+
+        Args:
+            route: 요청 경로 이름 (예: chat, upload_time)
+            model: 요청한 모델
+            messages: 요청 메시지 (짧은 프롬프트 판단용, 없으면 생략)
+
+        Returns:
+            호출할 모델
+        """
+        policy = self.policy(route)
+        if policy.fast:
+            return self.fast_model
+        if policy.short_prompt_tokens and messages is not None:
+            if messages_tokens(messages) <= policy.short_prompt_tokens:
+                return self.fast_model
+        return model
+
+    def hedge_delay(self, model: str) -> float:
+        """기본 모델 요청을 얼마나 기다린 뒤 빠른 모델로 hedging할지 (초)"""
+        if self.latency.count(model) < self.min_samples:
+            return self.hedge_default_delay
+        return max(self.hedge_min_delay, self.latency.percentile(model, self.hedge_percentile))
+
+    async def _timed(self, model: str, call: Callable[[str], Awaitable[Dict[str, Any]]]) -> Dict[str, Any]:
+        """응답 시간을 기록하며 호출 (취소된 요청은 취소 시점까지의 시간을 하한값으로 기록)"""
+        started = time.perf_counter()
+        try:
+            result = await call(model)
+        except asyncio.CancelledError:
+            self.latency.record(model, time.perf_counter() - started)
+            raise
+        self.latency.record(model, time.perf_counter() - started)
+        return result
+
+    async def complete(
+        self,
+        route: Optional[str],
+        model: str,
+        messages: List[Dict[str, str]],
+        call: Callable[[str], Awaitable[Dict[str, Any]]]
+    ) -> Dict[str, Any]:
+        """
+        경로 정책에 따라 모델을 골라 호출
+
+        Args:
+            route: 요청 경로 이름
+            model: 요청한 모델
+            messages: 요청 메시지
+            call: 모델 이름을 받아 Chat Completions를 호출하는 코루틴 함수
+
+        Returns:
+            먼저 도착한 응답 (model 필드는 실제로 응답한 모델)
+        """
+        self.stats["requests"] += 1
+        policy = self.policy(route)
+        chosen = self.resolve_model(route, model, messages)
+        if chosen != model:
+            self.stats["fastRouted"] += 1
+        if chosen == self.fast_model or not policy.hedge:
+            return await self._timed(chosen, call)
+
+        primary = asyncio.create_task(self._timed(chosen, call))
+        hedge: Optional[asyncio.Task] = None
+        try:
+            done, _ = await asyncio.wait({primary}, timeout=self.hedge_delay(chosen))
+            if done:
+                return primary.result()
+
+            self.stats["hedged"] += 1
+            logger.info("기본 모델 응답 지연, 빠른 모델로 hedging", extra={"model": chosen, "fastModel": self.fast_model})
+            hedge = asyncio.create_task(self._timed(self.fast_model, call))
+            pending = {primary, hedge}
+            error: Optional[BaseException] = None
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.exception() is None:
+                        if task is hedge:
+                            self.stats["hedgeWins"] += 1
+                        return task.result()
+                    error = error or task.exception()
+            # 두 요청이 모두 실패하면 먼저 실패한 오류를 전달
+            raise error
+        finally:
+            for task in (primary, hedge):
+                if task is not None and not task.done():
+                    task.cancel()
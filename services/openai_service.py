@@ -1,5 +1,12 @@
 import openai
-from typing import List, Dict, Any, Optional
+import httpx
+import asyncio
+import base64
+import logging
+import sqlite3
+import time
+from array import array
+from typing import List, Dict, Any, Optional, AsyncIterator, Awaitable, Callable
 import sys
 import os
 
@@ -7,24 +14,435 @@ import os
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from config import settings
+from services.single_flight import SingleFlight, make_key
+from services.model_router import ModelRouter, parse_route_policies
+from services.resilience import CircuitBreaker, Resilience, classify_error
+from services.rate_limiter import RateLimiter
+from services.model_catalog import ModelCatalog
+from services.completion_cache import CompletionCache
+from services.token_counter import count_tokens, messages_tokens
+from services.metrics import metrics
+
+logger = logging.getLogger(__name__)
 
 class OpenAIService:
     def __init__(self):
         """OpenAI 서비스 초기화"""
-        self.client = openai.OpenAI(
-            api_key=settings.OPENAI_API_KEY
-        )
+        self._client: Optional[openai.AsyncOpenAI] = None
+        self._http_client: Optional[httpx.AsyncClient] = None
+        # 워커당 동시 OpenAI 호출 수 제한
+        self._semaphore = asyncio.Semaphore(settings.OPENAI_MAX_CONCURRENCY)
+        # 동일한 요청을 하나의 업스트림 호출로 합치기
+        self.single_flight = SingleFlight()
         self.default_model = settings.DEFAULT_MODEL
         self.fallback_model = settings.FALLBACK_MODEL
+        # 일시적 오류 재시도와 업스트림 장애 시 빠른 실패
+        self.resilience = Resilience(
+            CircuitBreaker(
+                failure_threshold=settings.CIRCUIT_FAILURE_THRESHOLD,
+                recovery_timeout=settings.CIRCUIT_RECOVERY_TIMEOUT
+            ),
+            max_attempts=settings.OPENAI_MAX_ATTEMPTS,
+            base_delay=settings.OPENAI_RETRY_BASE_DELAY,
+            max_delay=settings.OPENAI_RETRY_MAX_DELAY
+        )
+        # 워커 간 공유하는 분당 요청/토큰 한도
+        self.rate_limiter = RateLimiter(
+            path=os.path.join(settings.CACHE_DIR, "openai_rate_limit.bin"),
+            rpm=settings.OPENAI_RPM_LIMIT,
+            tpm=settings.OPENAI_TPM_LIMIT,
+            burst_seconds=settings.OPENAI_LIMIT_BURST_SECONDS
+        )
+        # 경로별 모델 선택과 지연 시 빠른 모델로 hedging
+        self.model_router = ModelRouter(
+            fast_model=self.fallback_model,
+            policies=parse_route_policies(settings.MODEL_ROUTE_POLICIES) if settings.MODEL_ROUTING_ENABLED else {},
+            hedge_percentile=settings.HEDGE_PERCENTILE,
+            hedge_min_delay=settings.HEDGE_MIN_DELAY,
+            hedge_default_delay=settings.HEDGE_DEFAULT_DELAY,
+            min_samples=settings.HEDGE_MIN_SAMPLES,
+            window=settings.LATENCY_WINDOW
+        )
+        # 모델 목록 캐시 (시작 시 한 번 받고 백그라운드에서 갱신)
+        self.model_catalog = ModelCatalog(
+            fetch=self._fetch_models,
+            ttl=settings.MODEL_CATALOG_TTL,
+            retry_interval=settings.MODEL_CATALOG_RETRY_INTERVAL
+        )
+        # 결정적 호출 응답 캐시 (워커 간 공유, 압축 크기 기준 LRU)
+        self.completion_cache = CompletionCache(
+            path=os.path.join(settings.CACHE_DIR, "completions.sqlite3"),
+            max_bytes=settings.COMPLETION_CACHE_MAX_BYTES,
+            ttl=settings.COMPLETION_CACHE_TTL
+        )
         self.max_tokens = settings.MAX_TOKENS
         self.temperature = settings.TEMPERATURE
 
+    @property
+    def client(self) -> openai.AsyncOpenAI:
+        """
+        비동기 OpenAI 클라이언트 (연결 풀은 워커 프로세스 내에서 공유)
+
+        앱 시작 전에 호출되더라도 첫 사용 시점에 생성됩니다.
+        """
+        if self._client is None:
+            self._http_client = httpx.AsyncClient(
+                timeout=httpx.Timeout(settings.OPENAI_TIMEOUT, connect=10.0),
+                limits=httpx.Limits(
+                    max_connections=settings.OPENAI_MAX_CONNECTIONS,
+                    max_keepalive_connections=settings.OPENAI_MAX_KEEPALIVE_CONNECTIONS
+                ),
+                follow_redirects=True
+            )
+            # 재시도는 self.resilience가 담당하므로 SDK 자체 재시도는 끔
+            self._client = openai.AsyncOpenAI(
+                api_key=settings.OPENAI_API_KEY,
+                base_url=settings.OPENAI_BASE_URL or None,
+                timeout=settings.OPENAI_TIMEOUT,
+                max_retries=0,
+                http_client=self._http_client
+            )
+        return self._client
+
+    async def startup(self) -> None:
+        """앱 시작 시 연결 풀 생성"""
+        _ = self.client
+        logger.info("OpenAI 연결 풀 준비 완료", extra={"maxConcurrency": settings.OPENAI_MAX_CONCURRENCY})
+
+    async def shutdown(self) -> None:
+        """앱 종료 시 연결 풀 정리"""
+        if self._http_client is not None:
+            await self._http_client.aclose()
+        self._client = None
+        self._http_client = None
+        logger.info("OpenAI 연결 풀 종료")
+
+    async def _measured(self, fn: Callable[[], Awaitable[Any]], model: str, operation: str) -> Any:
+        """업스트림 호출 한 번의 시간과 실패 종류를 지표로 기록"""
+        started = time.perf_counter()
+        try:
+            return await fn()
+        except Exception as error:
+            metrics.inc("openai_errors_total", model=model, operation=operation, kind=classify_error(error).kind)
+            raise
+        finally:
+            metrics.observe("openai_request_duration_seconds", time.perf_counter() - started, model=model, operation=operation)
+
+    async def _resilient_call(
+        self,
+        attempt: Callable[[], Awaitable[Any]],
+        model: str,
+        operation: str,
+        idempotent: bool = True
+    ) -> Any:
+        """재시도와 서킷 브레이커를 적용해 호출하고 최종 결과를 지표로 기록"""
+        try:
+            result = await self.resilience.call(attempt, idempotent=idempotent)
+        except Exception as error:
+            metrics.inc("openai_calls_total", model=model, operation=operation, outcome=classify_error(error).kind)
+            raise
+        metrics.inc("openai_calls_total", model=model, operation=operation, outcome="success")
+        return result
+
+    def _record_usage(self, model: str, prompt_tokens: Optional[int], completion_tokens: Optional[int]) -> None:
+        """응답 usage의 토큰 수를 지표로 기록"""
+        if prompt_tokens:
+            metrics.inc("openai_tokens_total", prompt_tokens, model=model, type="prompt")
+        if completion_tokens:
+            metrics.inc("openai_tokens_total", completion_tokens, model=model, type="completion")
+
+    async def _call_upstream(
+        self,
+        fn: Callable[[], Awaitable[Any]],
+        idempotent: bool = True,
+        tokens: Optional[int] = None,
+        used_tokens: Optional[Callable[[Any], int]] = None,
+        model: str = "none",
+        operation: str = "chat"
+    ) -> Any:
+        """
+        호출 한도, 동시 호출 제한, 재시도, 서킷 브레이커를 적용해 업스트림 호출
+
+        tokens가 주어지면 시도마다 분당 요청/토큰 한도에서 예약한 뒤 호출하고,
+        시도가 끝나면 예약한 토큰 중 쓰지 않은 만큼을 돌려줍니다
+        (성공하면 used_tokens(응답)로 계산한 실제 사용량을 빼고, 실패하거나 취소되면 전부).
+        재시도를 기다리는 동안에는 동시 호출 슬롯을 반납합니다.
+        """
+        async def attempt():
+            reserved = 0
+            if tokens is not None:
+                reserved = await self.rate_limiter.acquire(tokens, settings.OPENAI_LIMIT_MAX_WAIT)
+            used = 0
+            try:
+                async with self._semaphore:
+                    result = await self._measured(fn, model, operation)
+                if used_tokens is not None:
+                    used = used_tokens(result)
+                return result
+            finally:
+                self.rate_limiter.release(0, reserved - used)
+
+        return await self._resilient_call(attempt, model, operation, idempotent=idempotent)
+
+    async def _create_chat_completion(
+        self,
+        messages: List[Dict[str, str]],
+        model: str,
+        max_tokens: int,
+        temperature: float,
+        coalesce: bool = False,
+        response_format: Optional[Dict[str, str]] = None,
+        route: Optional[str] = None,
+        cache: Optional[bool] = None
+    ) -> Dict[str, Any]:
+        """
+        Chat Completions API 호출
+
+        coalesce가 True이거나 temperature가 0인 결정적 호출은
+        같은 (메시지, 모델, 파라미터, 경로)로 진행 중인 호출과 합쳐지고, 응답 캐시를 거칩니다.
+        실제 호출 모델은 경로(route) 정책에 따라 모델 라우터가 정합니다.
+        hedging으로 빠른 모델이 대신 응답한 결과는 요청한 모델의 답이 아니므로 응답 캐시에 저장하지 않습니다.
+
+        Args:
+            cache: 응답 캐시 사용 여부 (None이면 결정적 호출만, False면 읽지도 저장하지도 않음)
+
+        Returns:
+            응답 메시지, 실제로 응답한 모델, 사용량, 응답 캐시 결과(cache: hit, miss, bypass),
+            hedging으로 빠른 모델이 대신 응답했는지(hedged)를 담은 딕셔너리
+        """
+        deterministic = coalesce or temperature == 0
+        use_cache = settings.COMPLETION_CACHE_ENABLED and (deterministic if cache is None else cache)
+        key = make_key("chat", model, messages, max_tokens, temperature, response_format, route)
+        # 경로 정책대로라면 응답할 모델 (이 모델이 응답한 결과만 캐시 키와 맞음)
+        expected_model = self.model_router.resolve_model(route, model, messages)
+
+        if use_cache:
+            cached = await self._cached_completion(key, messages)
+            if cached is not None:
+                return {
+                    **cached,
+                    "usage": {"prompt_tokens": 0, "completion_tokens": 0, "total_tokens": 0},
+                    "cache": "hit",
+                    "hedged": False
+                }
+
+        async def call():
+            response = await self.model_router.complete(
+                route,
+                model,
+                messages,
+                lambda routed_model: self._request_chat_completion(
+                    messages, routed_model, max_tokens, temperature, response_format
+                )
+            )
+            if use_cache and response["model"] == expected_model:
+                await self._store_completion(key, messages, response)
+            return response
+
+        response = await (self.single_flight.do(key, call) if deterministic else call())
+        return {**response, "cache": "miss" if use_cache else "bypass", "hedged": response["model"] != expected_model}
+
+    async def _cached_completion(self, key: str, messages: List[Dict[str, str]]) -> Optional[Dict[str, Any]]:
+        """응답 캐시 조회 (오류가 나면 캐시 없이 진행)"""
+        try:
+            return await asyncio.to_thread(self.completion_cache.get, key, messages)
+        except (sqlite3.Error, ValueError) as error:
+            logger.warning("응답 캐시 조회 오류", extra={"error": str(error)})
+            return None
+
+    async def _store_completion(self, key: str, messages: List[Dict[str, str]], response: Dict[str, Any]) -> None:
+        """응답 캐시 저장 (오류가 나도 응답은 그대로 반환)"""
+        try:
+            await asyncio.to_thread(self.completion_cache.set, key, messages, response)
+        except sqlite3.Error as error:
+            logger.warning("응답 캐시 저장 오류", extra={"error": str(error)})
+
+    async def _request_chat_completion(
+        self,
+        messages: List[Dict[str, str]],
+        model: str,
+        max_tokens: int,
+        temperature: float,
+        response_format: Optional[Dict[str, str]] = None
+    ) -> Dict[str, Any]:
+        """
+        Chat Completions API 실제 호출 (동시 호출 제한 적용)
+        """
+        options = {"response_format": response_format} if response_format else {}
+        # 호출 한도 예약용 예상 토큰 (응답 후 실제 사용량과의 차이는 돌려줌)
+        estimated_tokens = messages_tokens(messages) + max_tokens
+
+        completion = await self._call_upstream(
+            lambda: self.client.chat.completions.create(
+                model=model,
+                messages=messages,
+                max_tokens=max_tokens,
+                temperature=temperature,
+                top_p=1,
+                frequency_penalty=0,
+                presence_penalty=0,
+                **options
+            ),
+            tokens=estimated_tokens,
+            used_tokens=lambda completion: completion.usage.total_tokens,
+            model=model
+        )
+
+        response = completion.choices[0].message.content
+        usage = completion.usage
+        self._record_usage(model, usage.prompt_tokens, usage.completion_tokens)
+
+        logger.info(
+            "OpenAI API 응답 완료",
+            extra={
+                "model": model,
+                "promptTokens": usage.prompt_tokens,
+                "completionTokens": usage.completion_tokens,
+                "sample": True
+            }
+        )
+
+        return {
+            "message": response,
+            "model": model,
+            "usage": {
+                "prompt_tokens": usage.prompt_tokens,
+                "completion_tokens": usage.completion_tokens,
+                "total_tokens": usage.total_tokens
+            }
+        }
+
+    async def stream_chat_completion(
+        self,
+        messages: List[Dict[str, str]],
+        model: Optional[str] = None,
+        max_tokens: Optional[int] = None,
+        temperature: Optional[float] = None,
+        route: Optional[str] = None
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        ChatGPT 스트리밍 대화 (생성되는 토큰을 바로 전달)
+
+        스트리밍은 hedging 없이 경로 정책에 따른 모델 선택만 적용합니다.
+
+        Args:
+            messages: 대화 히스토리 배열 [{"role": "user", "content": "..."}, ...]
+            model: 사용할 모델 (기본값: gpt-4o)
+            max_tokens: 최대 토큰 수 (기본값: 4000)
+            temperature: 온도 설정 (기본값: 0.7)
+            route: 요청 경로 이름 (모델 라우팅 정책 선택)
+
+        Yields:
+            {"type": "delta", "content": "..."} 이벤트들과
+            마지막 {"type": "done", "model": ..., "usage": ..., "finishReason": ...} 이벤트
+        """
+        model = self.model_router.resolve_model(route, model or self.default_model, messages)
+        max_tokens = max_tokens or self.max_tokens
+        temperature = self.temperature if temperature is None else temperature
+
+        logger.debug("OpenAI API 스트리밍 호출 시작", extra={"model": model})
+
+        usage = None
+        finish_reason = None
+        prompt_tokens = messages_tokens(messages)
+        estimated_tokens = prompt_tokens + max_tokens
+        # 스트림을 연 시도가 예약한 토큰 (스트림이 끝나면 실제 사용량과의 차이를 돌려줌)
+        reservation = {"tokens": 0}
+        streamed: List[str] = []
+
+        async def open_stream():
+            # _call_upstream과 같이 호출 한도를 먼저 확보한 뒤 동시 호출 슬롯을 잡음
+            # (한도를 기다리는 동안 슬롯을 차지하지 않도록, 슬롯은 스트림을 다 읽으면 반납)
+            reserved = await self.rate_limiter.acquire(estimated_tokens, settings.OPENAI_LIMIT_MAX_WAIT)
+            holding_slot = False
+            try:
+                await self._semaphore.acquire()
+                holding_slot = True
+                # 스트리밍은 응답 헤더를 받을 때까지(첫 응답까지)의 시간을 기록
+                stream = await self._measured(
+                    lambda: self.client.chat.completions.create(
+                        model=model,
+                        messages=messages,
+                        max_tokens=max_tokens,
+                        temperature=temperature,
+                        top_p=1,
+                        frequency_penalty=0,
+                        presence_penalty=0,
+                        stream=True,
+                        extra_body={"stream_options": {"include_usage": True}}
+                    ),
+                    model,
+                    "stream"
+                )
+            except BaseException:
+                # 스트림을 열지 못한 시도는 슬롯과 예약을 모두 돌려줌 (재시도 대기 중에는 슬롯을 잡지 않음)
+                if holding_slot:
+                    self._semaphore.release()
+                self.rate_limiter.release(0, reserved)
+                raise
+            reservation["tokens"] = reserved
+            return stream
+
+        # 첫 청크를 받기 전까지(스트림 생성)만 재시도
+        stream = await self._resilient_call(open_stream, model, "stream")
+        try:
+            async for chunk in stream:
+                if chunk.choices:
+                    choice = chunk.choices[0]
+                    if choice.delta.content:
+                        streamed.append(choice.delta.content)
+                        yield {"type": "delta", "content": choice.delta.content}
+                    if choice.finish_reason:
+                        finish_reason = choice.finish_reason
+
+                # 마지막 청크에만 포함되는 사용량 (SDK 모델에 없는 필드라 dict로 들어옴)
+                chunk_usage = getattr(chunk, "usage", None)
+                if chunk_usage:
+                    if not isinstance(chunk_usage, dict):
+                        chunk_usage = chunk_usage.model_dump()
+                    usage = {
+                        "prompt_tokens": chunk_usage.get("prompt_tokens"),
+                        "completion_tokens": chunk_usage.get("completion_tokens"),
+                        "total_tokens": chunk_usage.get("total_tokens")
+                    }
+        finally:
+            try:
+                await stream.response.aclose()
+            finally:
+                self._semaphore.release()
+                # 사용량을 받기 전에 끊긴 스트림(클라이언트 연결 종료, 오류)은 프롬프트와 받은 만큼 쓴 것으로 계산
+                if usage and usage["total_tokens"] is not None:
+                    used = usage["total_tokens"]
+                else:
+                    used = prompt_tokens + count_tokens("".join(streamed))
+                self.rate_limiter.release(0, reservation["tokens"] - used)
+
+        if usage:
+            self._record_usage(model, usage["prompt_tokens"], usage["completion_tokens"])
+
+        logger.info(
+            "OpenAI API 스트리밍 완료",
+            extra={
+                "model": model,
+                "promptTokens": usage["prompt_tokens"] if usage else None,
+                "completionTokens": usage["completion_tokens"] if usage else None,
+                "finishReason": finish_reason,
+                "sample": True
+            }
+        )
+
+        yield {"type": "done", "model": model, "usage": usage, "finishReason": finish_reason}
+
     async def chat_with_gpt(
         self, 
         message: str, 
         model: Optional[str] = None, 
         max_tokens: Optional[int] = None,
-        temperature: Optional[float] = None
+        temperature: Optional[float] = None,
+        coalesce: bool = False,
+        response_format: Optional[Dict[str, str]] = None,
+        route: Optional[str] = None,
+        cache: Optional[bool] = None
     ) -> Dict[str, Any]:
         """
         ChatGPT와 단일 메시지로 대화
@@ -34,51 +452,40 @@ class OpenAIService:
             model: 사용할 모델 (기본값: gpt-4o)
             max_tokens: 최대 토큰 수 (기본값: 4000)
             temperature: 온도 설정 (기본값: 0.7)
+            coalesce: 동일한 요청이 진행 중이면 그 결과를 공유 (temperature=0이면 항상 적용)
+            response_format: 응답 형식 (예: {"type": "json_object"})
+            route: 요청 경로 이름 (모델 라우팅 정책 선택, 예: chat, upload_time)
+            cache: 응답 캐시 사용 여부 (None이면 결정적 호출만, False면 캐시를 거치지 않음)
             
         Returns:
             ChatGPT 응답 딕셔너리
         """
         try:
-            print("OpenAI API 호출 시작...")
+            logger.debug("OpenAI API 호출 시작", extra={"route": route})
             
             # 기본값 설정
             model = model or self.default_model
             max_tokens = max_tokens or self.max_tokens
-            temperature = temperature or self.temperature
+            temperature = self.temperature if temperature is None else temperature
             
-            completion = self.client.chat.completions.create(
-                model=model,
+            return await self._create_chat_completion(
                 messages=[
                     {
                         "role": "user",
                         "content": message
                     }
                 ],
+                model=model,
                 max_tokens=max_tokens,
                 temperature=temperature,
-                top_p=1,
-                frequency_penalty=0,
-                presence_penalty=0
+                coalesce=coalesce,
+                response_format=response_format,
+                route=route,
+                cache=cache
             )
 
-            response = completion.choices[0].message.content
-            usage = completion.usage
-
-            print("OpenAI API 응답 완료")
-            print(f"사용된 토큰: {usage}")
-
-            return {
-                "message": response,
-                "model": model,
-                "usage": {
-                    "prompt_tokens": usage.prompt_tokens,
-                    "completion_tokens": usage.completion_tokens,
-                    "total_tokens": usage.total_tokens
-                }
-            }
-
         except Exception as error:
-            print(f"OpenAI API 오류: {error}")
+            logger.error("OpenAI API 오류", extra={"route": route, "error": str(error)})
             raise error
 
     async def chat_with_history(
@@ -86,7 +493,9 @@ class OpenAIService:
         messages: List[Dict[str, str]], 
         model: Optional[str] = None, 
         max_tokens: Optional[int] = None,
-        temperature: Optional[float] = None
+        temperature: Optional[float] = None,
+        route: Optional[str] = None,
+        cache: Optional[bool] = None
     ) -> Dict[str, Any]:
         """
         ChatGPT와 대화 히스토리와 함께 대화
@@ -96,75 +505,51 @@ class OpenAIService:
             model: 사용할 모델 (기본값: gpt-4o)
             max_tokens: 최대 토큰 수 (기본값: 4000)
             temperature: 온도 설정 (기본값: 0.7)
+            route: 요청 경로 이름 (모델 라우팅 정책 선택, 예: conversation)
+            cache: 응답 캐시 사용 여부 (None이면 결정적 호출만, False면 캐시를 거치지 않음)
             
         Returns:
             ChatGPT 응답 딕셔너리
         """
         try:
-            print("OpenAI API 호출 시작 (대화 히스토리 포함)...")
+            logger.debug("OpenAI API 호출 시작 (대화 히스토리 포함)", extra={"route": route, "messages": len(messages)})
             
             # 기본값 설정
             model = model or self.default_model
             max_tokens = max_tokens or self.max_tokens
-            temperature = temperature or self.temperature
+            temperature = self.temperature if temperature is None else temperature
             
-            completion = self.client.chat.completions.create(
-                model=model,
+            return await self._create_chat_completion(
                 messages=messages,
+                model=model,
                 max_tokens=max_tokens,
                 temperature=temperature,
-                top_p=1,
-                frequency_penalty=0,
-                presence_penalty=0
+                route=route,
+                cache=cache
             )
 
-            response = completion.choices[0].message.content
-            usage = completion.usage
-
-            print("OpenAI API 응답 완료")
-            print(f"사용된 토큰: {usage}")
-
-            return {
-                "message": response,
-                "model": model,
-                "usage": {
-                    "prompt_tokens": usage.prompt_tokens,
-                    "completion_tokens": usage.completion_tokens,
-                    "total_tokens": usage.total_tokens
-                }
-            }
-
         except Exception as error:
-            print(f"OpenAI API 오류: {error}")
+            logger.error("OpenAI API 오류", extra={"route": route, "error": str(error)})
             raise error
 
+    async def _fetch_models(self) -> List[Any]:
+        """업스트림에서 전체 모델 목록 조회 (모델 목록 캐시 갱신용)"""
+        logger.debug("사용 가능한 모델 목록 조회 중")
+        models = await self._call_upstream(lambda: self.client.models.list(), operation="models")
+        return models.data
+
     async def get_available_models(self) -> List[Dict[str, Any]]:
         """
-        사용 가능한 모델 목록 조회
+        사용 가능한 모델 목록 조회 (캐시된 목록, 갱신에 실패하면 마지막으로 받은 목록)
         
         Returns:
             사용 가능한 모델 목록
         """
         try:
-            print("사용 가능한 모델 목록 조회 중...")
-            
-            models = self.client.models.list()
-            available_models = []
-            
-            for model in models.data:
-                if 'gpt' in model.id:
-                    available_models.append({
-                        "id": model.id,
-                        "name": model.id,
-                        "created": model.created
-                    })
-
-            print(f"모델 목록 조회 완료: {len(available_models)}개 모델")
-
-            return available_models
+            return await self.model_catalog.get()
 
         except Exception as error:
-            print(f"모델 목록 조회 오류: {error}")
+            logger.error("모델 목록 조회 오류", extra={"error": str(error)})
             raise error
 
     async def generate_image(
@@ -185,18 +570,24 @@ class OpenAIService:
             생성된 이미지 정보
         """
         try:
-            print("이미지 생성 시작...")
+            logger.debug("이미지 생성 시작")
             
-            response = self.client.images.generate(
+            # 이미지 생성은 과금되는 요청이라 처리되지 않은 것이 확실한 429만 재시도
+            response = await self._call_upstream(
+                lambda: self.client.images.generate(
+                    model="dall-e-3",
+                    prompt=prompt,
+                    size=size,
+                    n=n,
+                    quality="standard",
+                    response_format="url"
+                ),
+                idempotent=False,
                 model="dall-e-3",
-                prompt=prompt,
-                size=size,
-                n=n,
-                quality="standard",
-                response_format="url"
+                operation="images"
             )
 
-            print("이미지 생성 완료")
+            logger.info("이미지 생성 완료", extra={"images": len(response.data)})
 
             return {
                 "images": [
@@ -209,7 +600,7 @@ class OpenAIService:
             }
 
         except Exception as error:
-            print(f"이미지 생성 오류: {error}")
+            logger.error("이미지 생성 오류", extra={"error": str(error)})
             raise error
 
     async def create_embedding(
@@ -228,14 +619,19 @@ class OpenAIService:
             임베딩 벡터
         """
         try:
-            print("텍스트 임베딩 생성 시작...")
+            logger.debug("텍스트 임베딩 생성 시작", extra={"model": model})
             
-            response = self.client.embeddings.create(
+            response = await self._call_upstream(
+                lambda: self.client.embeddings.create(
+                    model=model,
+                    input=text
+                ),
                 model=model,
-                input=text
+                operation="embeddings"
             )
 
-            print("텍스트 임베딩 생성 완료")
+            logger.debug("텍스트 임베딩 생성 완료", extra={"model": model, "promptTokens": response.usage.prompt_tokens})
+            self._record_usage(model, response.usage.prompt_tokens, None)
 
             return {
                 "embedding": response.data[0].embedding,
@@ -247,5 +643,67 @@ class OpenAIService:
             }
 
         except Exception as error:
-            print(f"텍스트 임베딩 생성 오류: {error}")
+            logger.error("텍스트 임베딩 생성 오류", extra={"error": str(error)})
             raise error
+
+    async def create_embeddings(
+        self,
+        texts: List[str],
+        model: str,
+        dimensions: Optional[int] = None
+    ) -> Dict[str, Any]:
+        """
+        여러 텍스트 임베딩을 한 번의 호출로 생성 (float32 바이트로 반환)
+
+        JSON 실수 목록 대신 base64로 받아 디코딩만 하므로 응답 크기와 파싱 비용이 작습니다.
+
+        Args:
+            texts: 임베딩할 텍스트 목록 (업스트림 한 요청에 들어갈 크기)
+            model: 사용할 모델
+            dimensions: 줄일 차원 수 (text-embedding-3 모델만, None이면 모델 기본값)
+
+        Returns:
+            {"vectors": [입력 순서대로 float32 little-endian 바이트], "model": ..., "usage": ...}
+        """
+        # 설치된 SDK 버전에는 dimensions 인자가 없어 요청 본문에 직접 넣음
+        options = {"extra_body": {"dimensions": dimensions}} if dimensions else {}
+        # 호출 한도 예약용 예상 토큰 (응답 후 실제 사용량과의 차이는 돌려줌)
+        estimated_tokens = sum(count_tokens(text) for text in texts)
+
+        response = await self._call_upstream(
+            lambda: self.client.embeddings.create(
+                model=model,
+                input=texts,
+                encoding_format="base64",
+                **options
+            ),
+            tokens=estimated_tokens,
+            used_tokens=lambda response: response.usage.total_tokens,
+            model=model,
+            operation="embeddings"
+        )
+
+        self._record_usage(model, response.usage.prompt_tokens, None)
+
+        vectors: List[bytes] = [b""] * len(texts)
+        for item in response.data:
+            if isinstance(item.embedding, str):
+                vectors[item.index] = base64.b64decode(item.embedding)
+            else:
+                # base64를 지원하지 않는 호환 서버는 실수 목록으로 응답
+                packed = array("f", item.embedding)
+                if sys.byteorder == "big":
+                    packed.byteswap()
+                vectors[item.index] = packed.tobytes()
+
+        return {
+            "vectors": vectors,
+            "model": model,
+            "usage": {
+                "prompt_tokens": response.usage.prompt_tokens,
+                "total_tokens": response.usage.total_tokens
+            }
+        }
+
+# 워커 프로세스 전역에서 공유하는 OpenAI 서비스 인스턴스
+openai_service = OpenAIService()
@@ -0,0 +1,169 @@
+import asyncio
+import mmap
+import os
+import struct
+import threading
+import time
+from typing import Any, Dict
+
+try:
+    import fcntl
+except ImportError:  # Windows 개발 환경에서는 워커가 하나라고 가정
+    fcntl = None
+
+# 공유 상태: 분당 요청 한도, 분당 토큰 한도, 남은 요청, 남은 토큰, 마지막 갱신 시각(monotonic)
+_STATE = struct.Struct("=ddddd")
+
+
+class RateLimitTimeoutError(Exception):
+    """요청/토큰 한도 때문에 허용된 시간 안에 호출할 수 없음"""
+
+    def __init__(self, wait: float):
+        super().__init__(f"OpenAI 호출 한도로 {wait:.1f}초 이상 기다려야 해서 요청을 처리하지 않았습니다")
+        self.retry_after = wait
+
+
+class RateLimiter:
+    """
+    OpenAI 분당 요청 수(RPM)와 분당 토큰 수(TPM) 제한기 (같은 호스트의 워커 간 공유)
+
+    상태는 CACHE_DIR의 작은 파일을 mmap으로 공유하고, 갱신할 때만 파일 잠금을 잡습니다.
+    호출마다 요청 1개와 예상 토큰(프롬프트 + max_tokens)을 예약하고, 남은 양이 모자라면
+    채워질 때까지 기다립니다. 예약은 도착 순서대로 쌓이므로(남은 양이 음수가 될 수 있음)
+    워커와 상관없이 먼저 온 호출이 먼저 나가며, 기다릴 시간이 max_wait를 넘으면 예약하지 않고 바로 실패합니다.
+    """
+
+    def __init__(self, path: str, rpm: int, tpm: int, burst_seconds: float):
+        self.path = path
+        self.rpm = rpm
+        self.tpm = tpm
+        # 한 번에 몰아서 쓸 수 있는 양 (burst_seconds 동안 채워지는 양)
+        self.request_capacity = max(1.0, rpm / 60 * burst_seconds)
+        self.token_capacity = max(1.0, tpm / 60 * burst_seconds)
+        self._mmap = None
+        self._file = None
+        self._pid = None
+        self._lock = threading.Lock()
+        self.stats = {"acquired": 0, "waited": 0, "waitSeconds": 0.0, "rejected": 0, "refundedTokens": 0}
+
+    @property
+    def enabled(self) -> bool:
+        """한도가 하나라도 설정되어 있는지"""
+        return self.rpm > 0 or self.tpm > 0
+
+    def _state_map(self) -> mmap.mmap:
+        """프로세스별 공유 상태 매핑 (fork 이후에는 새로 매핑)"""
+        if self._mmap is None or self._pid != os.getpid():
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            self._file = open(self.path, "a+b")
+            if os.path.getsize(self.path) < _STATE.size:
+                self._file.truncate(_STATE.size)
+            self._mmap = mmap.mmap(self._file.fileno(), _STATE.size)
+            self._pid = os.getpid()
+        return self._mmap
+
+    def _update(self, fn):
+        """공유 상태를 잠근 채로 읽고 fn(상태, 현재 시각)이 돌려준 새 상태를 기록"""
+        with self._lock:
+            state_map = self._state_map()
+            if fcntl is not None:
+                fcntl.flock(self._file.fileno(), fcntl.LOCK_EX)
+            try:
+                rpm, tpm, requests, tokens, updated = _STATE.unpack_from(state_map, 0)
+                now = time.monotonic()
+                # 처음 만들었거나, 한도가 바뀌었거나, 재부팅으로 시계가 초기화된 경우 가득 찬 상태로 시작
+                if (rpm, tpm) != (float(self.rpm), float(self.tpm)) or updated <= 0 or updated > now:
+                    requests, tokens, updated = self.request_capacity, self.token_capacity, now
+                elapsed = now - updated
+                requests = min(self.request_capacity, requests + elapsed * self.rpm / 60)
+                tokens = min(self.token_capacity, tokens + elapsed * self.tpm / 60)
+
+                requests, tokens, result = fn(requests, tokens)
+                _STATE.pack_into(state_map, 0, float(self.rpm), float(self.tpm), requests, tokens, now)
+                return result
+            finally:
+                if fcntl is not None:
+                    fcntl.flock(self._file.fileno(), fcntl.LOCK_UN)
+
+    def _reserve(self, tokens: int, max_wait: float) -> float:
+        """요청 1개와 토큰을 예약하고 기다릴 시간(초)을 반환 (max_wait를 넘으면 예약하지 않음)"""
+        def reserve(available_requests, available_tokens):
+            request_wait = 0.0
+            token_wait = 0.0
+            if self.rpm > 0 and available_requests < 1:
+                request_wait = (1 - available_requests) / (self.rpm / 60)
+            if self.tpm > 0 and available_tokens < tokens:
+                token_wait = (tokens - available_tokens) / (self.tpm / 60)
+            wait = max(request_wait, token_wait)
+            if wait > max_wait:
+                return available_requests, available_tokens, wait
+            return available_requests - 1, available_tokens - tokens, -wait
+
+        wait = self._update(reserve)
+        if wait > 0:
+            raise RateLimitTimeoutError(wait)
+        return -wait
+
+    def release(self, requests: int, tokens: int) -> None:
+        """예약했지만 쓰지 않은 요청과 토큰을 돌려줌"""
+        if not self.enabled or (requests <= 0 and tokens <= 0):
+            return
+        self._update(lambda available_requests, available_tokens: (
+            min(self.request_capacity, available_requests + requests),
+            min(self.token_capacity, available_tokens + tokens),
+            None
+        ))
+        self.stats["refundedTokens"] += max(0, tokens)
+
+    async def acquire(self, tokens: int, max_wait: float) -> int:
+        """
+        요청 1개와 예상 토큰을 확보할 때까지 대기
+
+        Args:
+            tokens: 예상 토큰 수 (프롬프트 + max_tokens)
+            max_wait: 최대 대기 시간 (초)
+
+        Returns:
+            실제로 예약한 토큰 수 (용량보다 큰 요청은 용량만큼, 제한이 꺼져 있으면 0).
+            남는 토큰은 이 값을 기준으로 release로 돌려줘야 합니다.
+
+        Raises:
+            RateLimitTimeoutError: max_wait 안에 확보할 수 없는 경우
+        """
+        if not self.enabled:
+            return 0
+        # 한 번에 채울 수 있는 양보다 큰 요청은 가득 찬 양만큼만 예약
+        tokens = min(tokens, int(self.token_capacity)) if self.tpm > 0 else 0
+        try:
+            wait = self._reserve(tokens, max_wait)
+        except RateLimitTimeoutError:
+            self.stats["rejected"] += 1
+            raise
+
+        self.stats["acquired"] += 1
+        if wait > 0:
+            self.stats["waited"] += 1
+            self.stats["waitSeconds"] += wait
+            try:
+                await asyncio.sleep(wait)
+            except asyncio.CancelledError:
+                self.release(1, tokens)
+                raise
+        return tokens
+
+    def snapshot(self) -> Dict[str, Any]:
+        """한도 설정과 현재 남은 양 (모든 워커 공유), 워커별 통계"""
+        if not self.enabled:
+            return {"enabled": False}
+        available = self._update(lambda requests, tokens: (requests, tokens, (requests, tokens)))
+        return {
+            "enabled": True,
+            "rpm": self.rpm,
+            "tpm": self.tpm,
+            "availableRequests": round(available[0], 2),
+            "availableTokens": round(available[1]),
+            **self.stats,
+            "waitSeconds": round(self.stats["waitSeconds"], 3)
+        }
@@ -0,0 +1,192 @@
+import asyncio
+import logging
+import os
+import sqlite3
+import sys
+import threading
+import time
+from typing import Any, Awaitable, Callable, Dict, Optional, Set
+
+# 현재 디렉토리를 Python 경로에 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from config import settings
+from services.metrics import metrics
+from services.sqlite_cache import SQLiteCache
+
+logger = logging.getLogger(__name__)
+
+
+class RecommendationCache(SQLiteCache):
+    """
+    업로드 시간 추천 결과 캐시 (SQLite 키-값 캐시 + stale-while-revalidate)
+
+    - ttl 이내: 캐시된 값을 그대로 반환
+    - ttl 경과 후 stale_ttl 이내: 캐시된 값을 반환하고 백그라운드에서 갱신 (stale-while-revalidate)
+    - 그 이후: 새로 생성하되, 업스트림 호출이 실패하면 남아 있는 값을 반환
+    SQLite 읽기/쓰기는 잠금 대기가 이벤트 루프를 막지 않도록 get_or_compute에서 스레드로 실행합니다.
+    이 워커가 읽거나 쓴 항목의 만료 시각은 메모리에도 기록해, is_fresh_enough가 파일을 읽지 않고 답합니다.
+    """
+
+    # 여러 워커가 같은 항목을 동시에 갱신하지 않도록 잡아두는 시간 (초)
+    REFRESH_LEASE_SECONDS = 60
+
+    def __init__(
+        self,
+        path: str,
+        ttl: float,
+        stale_ttl: float,
+        max_entries: int,
+        name: str = "recommendations"
+    ):
+        super().__init__(path, table="recommendation_cache", max_entries=max_entries)
+        self.name = name
+        self.ttl = ttl
+        self.stale_ttl = stale_ttl
+        self._refreshing: Set[str] = set()
+        self._background_tasks: Set[asyncio.Task] = set()
+        # 키 -> 업스트림 호출 없이 응답할 수 있는 마지막 시각 (created_at + ttl + stale_ttl)
+        self._fresh_until: Dict[str, float] = {}
+        self._memo_lock = threading.Lock()
+        self.stats = {"hits": 0, "staleHits": 0, "misses": 0, "fallbacks": 0, "refreshes": 0}
+
+    def _create_table(self, conn: sqlite3.Connection) -> None:
+        """추천 캐시 테이블 (워커 간 갱신 권한 열 포함)"""
+        conn.execute(
+            """CREATE TABLE IF NOT EXISTS recommendation_cache (
+                key TEXT PRIMARY KEY,
+                value TEXT NOT NULL,
+                created_at REAL NOT NULL,
+                last_access REAL NOT NULL,
+                refresh_lease REAL NOT NULL DEFAULT 0
+            )"""
+        )
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """
+        캐시 항목 조회 (만료 시각을 메모리에도 기록)
+
+        Returns:
+            {"value": ..., "age": 경과 시간(초)} 또는 None
+        """
+        cached = super().get(key)
+        with self._memo_lock:
+            if cached is None:
+                self._fresh_until.pop(key, None)
+            else:
+                self._remember(key, time.time() - cached["age"])
+        return cached
+
+    def set(self, key: str, value: Any) -> None:
+        """캐시 항목 저장 후 LRU 정리 (만료 시각을 메모리에도 기록)"""
+        super().set(key, value)
+        with self._memo_lock:
+            self._remember(key, time.time())
+
+    def _remember(self, key: str, created_at: float) -> None:
+        """항목의 만료 시각을 메모리에 기록 (self._memo_lock을 잡은 상태에서 호출, max_entries개까지)"""
+        self._fresh_until.pop(key, None)
+        self._fresh_until[key] = created_at + self.ttl + self.stale_ttl
+        if len(self._fresh_until) > self.max_entries:
+            now = time.time()
+            for expired in [k for k, until in self._fresh_until.items() if until <= now]:
+                del self._fresh_until[expired]
+            while len(self._fresh_until) > self.max_entries:
+                del self._fresh_until[next(iter(self._fresh_until))]
+
+    def is_fresh_enough(self, key: str) -> bool:
+        """
+        업스트림 호출 없이 바로 응답할 수 있는 항목인지 확인 (ttl + stale_ttl 이내, 파일을 읽지 않음)
+
+        이 워커가 아직 읽거나 쓰지 않은 항목은 다른 워커가 저장했더라도 False입니다.
+        """
+        return self._fresh_until.get(key, 0.0) > time.time()
+
+    def _acquire_refresh_lease(self, key: str) -> bool:
+        """워커 간 중복 갱신을 막기 위한 갱신 권한 획득"""
+        now = time.time()
+        with self._lock:
+            cursor = self._connection().execute(
+                "UPDATE recommendation_cache SET refresh_lease = ? WHERE key = ? AND refresh_lease < ?",
+                (now + self.REFRESH_LEASE_SECONDS, key, now)
+            )
+        return cursor.rowcount == 1
+
+    def _schedule_refresh(self, key: str, compute: Callable[[], Awaitable[Any]]) -> None:
+        """백그라운드에서 캐시 항목 갱신 (다른 워커가 갱신 중이면 건너뜀)"""
+        if key in self._refreshing:
+            return
+
+        async def refresh():
+            try:
+                if not await asyncio.to_thread(self._acquire_refresh_lease, key):
+                    return
+                value = await compute()
+                await asyncio.to_thread(self.set, key, value)
+                self.stats["refreshes"] += 1
+                metrics.inc("recommendation_cache_events_total", cache=self.name, event="refresh")
+            except Exception as error:
+                logger.warning("추천 캐시 백그라운드 갱신 실패", extra={"key": key, "error": str(error)})
+            finally:
+                self._refreshing.discard(key)
+
+        self._refreshing.add(key)
+        task = asyncio.create_task(refresh())
+        self._background_tasks.add(task)
+        task.add_done_callback(self._background_tasks.discard)
+
+    async def get_or_compute(self, key: str, compute: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        캐시를 거쳐 값 조회 (stale-while-revalidate)
+
+        Args:
+            key: 캐시 키
+            compute: 값을 새로 생성하는 코루틴 함수
+
+        Returns:
+            캐시되었거나 새로 생성된 값
+        """
+        try:
+            cached = await asyncio.to_thread(self.get, key)
+        except sqlite3.Error as error:
+            logger.warning("추천 캐시 조회 오류", extra={"error": str(error)})
+            return await compute()
+
+        if cached is not None:
+            if cached["age"] < self.ttl:
+                self.stats["hits"] += 1
+                metrics.inc("recommendation_cache_events_total", cache=self.name, event="hit")
+                return cached["value"]
+            if cached["age"] < self.ttl + self.stale_ttl:
+                self.stats["staleHits"] += 1
+                metrics.inc("recommendation_cache_events_total", cache=self.name, event="stale_hit")
+                self._schedule_refresh(key, compute)
+                return cached["value"]
+
+        self.stats["misses"] += 1
+        metrics.inc("recommendation_cache_events_total", cache=self.name, event="miss")
+        try:
+            value = await compute()
+        except Exception:
+            if cached is None:
+                raise
+            # 업스트림 실패 시 만료된 값이라도 반환하고 다음 요청에서 다시 시도
+            self.stats["fallbacks"] += 1
+            metrics.inc("recommendation_cache_events_total", cache=self.name, event="fallback")
+            logger.warning("업스트림 오류로 만료된 추천 캐시 사용", extra={"key": key})
+            return cached["value"]
+
+        try:
+            await asyncio.to_thread(self.set, key, value)
+        except sqlite3.Error as error:
+            logger.warning("추천 캐시 저장 오류", extra={"error": str(error)})
+        return value
+
+
+# 워커 프로세스 전역에서 공유하는 추천 캐시 인스턴스
+recommendation_cache = RecommendationCache(
+    path=os.path.join(settings.CACHE_DIR, "recommendations.sqlite3"),
+    ttl=settings.RECOMMENDATION_CACHE_TTL,
+    stale_ttl=settings.RECOMMENDATION_CACHE_STALE_TTL,
+    max_entries=settings.RECOMMENDATION_CACHE_MAX_ENTRIES
+)
@@ -0,0 +1,244 @@
+import asyncio
+import logging
+import random
+import time
+from dataclasses import dataclass
+from email.utils import parsedate_to_datetime
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+import openai
+
+from services.rate_limiter import RateLimitTimeoutError
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class ErrorClassification:
+    """
+    업스트림 오류 분류 결과
+
+    - kind: 오류 종류 (quota, auth, rate_limit, throttled, timeout, connection, server, bad_request, not_found,
+      circuit_open, unknown)
+    - status_code: 클라이언트에 돌려줄 HTTP 상태 코드
+    - retryable: 다시 시도하면 성공할 수 있는 일시적 오류인지
+    - unhealthy: 업스트림 장애로 보고 서킷 브레이커 실패로 셀지
+    - retry_after: 서버가 알려준 재시도 대기 시간 (초)
+    """
+    kind: str
+    status_code: int
+    retryable: bool
+    unhealthy: bool
+    retry_after: Optional[float] = None
+
+
+class CircuitOpenError(Exception):
+    """서킷 브레이커가 열려 있어 업스트림 호출 없이 바로 실패"""
+
+    def __init__(self, retry_after: float):
+        super().__init__(f"OpenAI 업스트림 장애로 호출을 잠시 중단했습니다 ({retry_after:.0f}초 후 재시도)")
+        self.retry_after = retry_after
+
+
+def _retry_after(error: Exception) -> Optional[float]:
+    """응답 헤더의 Retry-After (retry-after-ms, 초, HTTP 날짜 형식)"""
+    response = getattr(error, "response", None)
+    if response is None:
+        return None
+    headers = response.headers
+
+    retry_after_ms = headers.get("retry-after-ms")
+    if retry_after_ms:
+        try:
+            return float(retry_after_ms) / 1000
+        except ValueError:
+            pass
+
+    retry_after = headers.get("retry-after")
+    if not retry_after:
+        return None
+    try:
+        return float(retry_after)
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(retry_after).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+def classify_error(error: Exception) -> ErrorClassification:
+    """
+    OpenAI SDK 예외를 종류별로 분류
+
+    Args:
+        error: 발생한 예외
+
+    Returns:
+        오류 분류 결과
+    """
+    if isinstance(error, CircuitOpenError):
+        return ErrorClassification("circuit_open", 503, False, False, error.retry_after)
+    # 업스트림 호출 전에 로컬 호출 한도(RPM/TPM) 대기 시간을 넘긴 경우
+    if isinstance(error, RateLimitTimeoutError):
+        return ErrorClassification("throttled", 429, False, False, error.retry_after)
+
+    # APITimeoutError는 APIConnectionError의 하위 클래스이므로 먼저 확인
+    if isinstance(error, openai.APITimeoutError):
+        return ErrorClassification("timeout", 504, True, True)
+    if isinstance(error, openai.APIConnectionError):
+        return ErrorClassification("connection", 503, True, True)
+
+    if isinstance(error, openai.RateLimitError):
+        # 할당량 부족은 기다려도 해결되지 않음
+        if getattr(error, "code", None) == "insufficient_quota":
+            return ErrorClassification("quota", 402, False, False)
+        return ErrorClassification("rate_limit", 429, True, False, _retry_after(error))
+    if isinstance(error, openai.AuthenticationError):
+        return ErrorClassification("auth", 401, False, False)
+    if isinstance(error, openai.PermissionDeniedError):
+        return ErrorClassification("auth", 403, False, False)
+    if isinstance(error, openai.NotFoundError):
+        return ErrorClassification("not_found", 404, False, False)
+    if isinstance(error, (openai.BadRequestError, openai.UnprocessableEntityError)):
+        return ErrorClassification("bad_request", 400, False, False)
+    if isinstance(error, openai.ConflictError):
+        return ErrorClassification("server", 502, True, False, _retry_after(error))
+    if isinstance(error, openai.InternalServerError):
+        return ErrorClassification("server", 502, True, True, _retry_after(error))
+
+    return ErrorClassification("unknown", 500, False, False)
+
+
+class CircuitBreaker:
+    """
+    서킷 브레이커 (워커 프로세스 단위)
+
+    - closed: 정상 호출, 연속 실패가 failure_threshold에 닿으면 open
+    - open: recovery_timeout 동안 업스트림을 호출하지 않고 바로 CircuitOpenError
+    - half_open: 시험 호출 하나만 보내 성공하면 closed, 실패하면 다시 open
+    """
+
+    def __init__(self, failure_threshold: int, recovery_timeout: float):
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self.state = "closed"
+        self._failures = 0
+        self._opened_at = 0.0
+        self._trial_in_flight = False
+        self.stats = {"opened": 0, "rejected": 0}
+
+    def before_call(self) -> None:
+        """호출 허용 여부 확인 (허용되지 않으면 CircuitOpenError)"""
+        if self.state == "closed":
+            return
+        remaining = self._opened_at + self.recovery_timeout - time.monotonic()
+        if self.state == "open" and remaining <= 0:
+            self.state = "half_open"
+        if self.state == "half_open" and not self._trial_in_flight:
+            self._trial_in_flight = True
+            return
+        self.stats["rejected"] += 1
+        raise CircuitOpenError(max(remaining, 1.0))
+
+    def record_success(self) -> None:
+        """호출 성공 기록 (업스트림이 응답한 요청 오류도 정상 응답으로 봄)"""
+        self._failures = 0
+        self._trial_in_flight = False
+        self.state = "closed"
+
+    def record_failure(self) -> None:
+        """업스트림 장애(5xx, 연결 오류, 시간 초과) 기록"""
+        self._trial_in_flight = False
+        self._failures += 1
+        if self.state == "half_open" or self._failures >= self.failure_threshold:
+            if self.state != "open":
+                self.stats["opened"] += 1
+                logger.warning("OpenAI 서킷 브레이커 열림", extra={"recoveryTimeout": self.recovery_timeout})
+            self.state = "open"
+            self._opened_at = time.monotonic()
+
+    def record_cancelled(self) -> None:
+        """호출이 결과 없이 취소됨 (시험 호출이었다면 다음 호출이 다시 시험)"""
+        self._trial_in_flight = False
+
+    def snapshot(self) -> Dict[str, Any]:
+        """현재 상태와 통계"""
+        return {"state": self.state, "consecutiveFailures": self._failures, **self.stats}
+
+
+class Resilience:
+    """
+    재시도 + 지수 백오프 + 서킷 브레이커
+
+    일시적 오류(429, 5xx, 연결 오류, 시간 초과)는 지터를 준 지수 백오프로 다시 시도하고,
+    서버가 Retry-After를 알려주면 그 시간을 따릅니다.
+    멱등이 아닌 호출(예: 이미지 생성)은 요청이 처리되지 않았음이 확실한 429만 다시 시도합니다.
+    """
+
+    def __init__(
+        self,
+        breaker: CircuitBreaker,
+        max_attempts: int,
+        base_delay: float,
+        max_delay: float
+    ):
+        self.breaker = breaker
+        self.max_attempts = max_attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.stats = {"retries": 0, "failures": 0}
+
+    def backoff(self, attempt: int, retry_after: Optional[float] = None) -> float:
+        """attempt번째 실패 후 대기 시간 (full jitter, Retry-After가 있으면 우선)"""
+        if retry_after is not None:
+            return retry_after
+        return random.uniform(0, min(self.max_delay, self.base_delay * 2 ** attempt))
+
+    async def call(self, fn: Callable[[], Awaitable[Any]], idempotent: bool = True) -> Any:
+        """
+        재시도와 서킷 브레이커를 적용해 호출
+
+        Args:
+            fn: 업스트림을 한 번 호출하는 코루틴 함수
+            idempotent: 같은 요청을 다시 보내도 안전한지 여부
+
+        Returns:
+            호출 결과
+        """
+        attempt = 0
+        while True:
+            self.breaker.before_call()
+            try:
+                result = await fn()
+            except asyncio.CancelledError:
+                self.breaker.record_cancelled()
+                raise
+            except Exception as error:
+                classification = classify_error(error)
+                if classification.unhealthy:
+                    self.breaker.record_failure()
+                elif classification.kind in ("unknown", "throttled"):
+                    self.breaker.record_cancelled()
+                else:
+                    self.breaker.record_success()
+
+                attempt += 1
+                retryable = classification.retryable and (idempotent or classification.kind == "rate_limit")
+                delay = self.backoff(attempt - 1, classification.retry_after)
+                # 이번 실패로 서킷이 열렸으면 기다리지 않고 원래 오류로 실패
+                if (not retryable or attempt >= self.max_attempts or delay > self.max_delay
+                        or self.breaker.state == "open"):
+                    self.stats["failures"] += 1
+                    raise
+
+                self.stats["retries"] += 1
+                logger.warning(
+                    "OpenAI 호출 재시도",
+                    extra={"kind": classification.kind, "delay": round(delay, 2), "attempt": attempt}
+                )
+                await asyncio.sleep(delay)
+                continue
+
+            self.breaker.record_success()
+            return result
@@ -0,0 +1,256 @@
+import json
+import logging
+import os
+import sys
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+try:
+    import numpy as np
+except ImportError:  # 설치되어 있지 않으면 의미 기반 캐시를 쓰지 않음
+    np = None
+
+# 현재 디렉토리를 Python 경로에 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from services.embedding_pipeline import embedding_pipeline
+from services.metrics import metrics
+from config import settings
+
+logger = logging.getLogger(__name__)
+
+# (모델, 온도) 캐시 범위
+ScopeKey = Tuple[str, float]
+
+
+@dataclass
+class SemanticCacheEntry:
+    """캐시된 응답 하나 (벡터는 범위 행렬의 row 행)"""
+    scope: ScopeKey
+    row: int
+    response: Dict[str, Any]
+
+
+class _ScopeIndex:
+    """
+    범위 하나의 벡터 행렬 (정규화된 float32, 앞쪽 size개 행만 사용)
+
+    삭제할 때는 마지막 행을 빈자리로 옮겨 행렬을 빈틈없이 유지합니다.
+    """
+
+    def __init__(self, dimensions: int, capacity: int = 64):
+        self.vectors = np.zeros((capacity, dimensions), dtype=np.float32)
+        self.entry_ids: List[int] = []
+
+    @property
+    def size(self) -> int:
+        return len(self.entry_ids)
+
+    def add(self, entry_id: int, vector: "np.ndarray") -> int:
+        """벡터 추가 (모자라면 행렬을 두 배로 늘림)"""
+        if self.size == len(self.vectors):
+            grown = np.zeros((len(self.vectors) * 2, self.vectors.shape[1]), dtype=np.float32)
+            grown[:self.size] = self.vectors[:self.size]
+            self.vectors = grown
+        row = self.size
+        self.vectors[row] = vector
+        self.entry_ids.append(entry_id)
+        return row
+
+    def remove(self, row: int) -> Optional[int]:
+        """
+        행 삭제
+
+        Returns:
+            빈자리로 옮겨진 항목 ID (마지막 행을 지웠으면 None)
+        """
+        last = self.size - 1
+        moved = None
+        if row != last:
+            self.vectors[row] = self.vectors[last]
+            moved = self.entry_ids[row] = self.entry_ids[last]
+        self.entry_ids.pop()
+        return moved
+
+    def search(self, vector: "np.ndarray") -> Tuple[int, float]:
+        """가장 비슷한 행과 코사인 유사도 (정규화된 벡터의 내적)"""
+        scores = self.vectors[:self.size] @ vector
+        row = int(np.argmax(scores))
+        return row, float(scores[row])
+
+
+class SemanticCache:
+    """
+    의미 기반 응답 캐시 (워커 메모리, 벡터 행렬 내적으로 검색)
+
+    메시지 임베딩과 가장 비슷한 캐시 항목의 코사인 유사도가 threshold 이상이면 저장된 응답을 돌려줍니다.
+    범위는 (모델, 온도)별로 나뉘고, 전체 항목 수가 max_entries를 넘으면
+    가장 오래 사용되지 않은 항목부터 삭제합니다 (LRU).
+    snapshot_path를 주면 시작할 때 불러오고 종료할 때 저장합니다 (워커마다 덮어쓰므로 마지막 워커 기준).
+    """
+
+    def __init__(
+        self,
+        embed: Callable[[str], Awaitable[Any]],
+        threshold: float,
+        max_entries: int,
+        snapshot_path: str = "",
+        enabled: bool = True
+    ):
+        self.embed = embed
+        self.threshold = threshold
+        self.max_entries = max_entries
+        self.snapshot_path = snapshot_path
+        self.enabled = enabled and np is not None
+        self._scopes: Dict[ScopeKey, _ScopeIndex] = {}
+        self._entries: "OrderedDict[int, SemanticCacheEntry]" = OrderedDict()
+        self._next_id = 0
+        self.stats = {"hits": 0, "misses": 0, "stored": 0, "evicted": 0, "errors": 0}
+        if enabled and np is None:
+            logger.warning("numpy가 설치되어 있지 않아 의미 기반 캐시를 사용하지 않습니다.")
+
+    @staticmethod
+    def _scope(model: str, temperature: float) -> ScopeKey:
+        return (model, round(float(temperature), 3))
+
+    @staticmethod
+    def _normalize(vector: Any) -> Optional["np.ndarray"]:
+        """float32 단위 벡터 (영벡터면 None)"""
+        array = np.asarray(vector, dtype=np.float32)
+        norm = float(np.linalg.norm(array))
+        return array / norm if norm > 0 else None
+
+    async def embed_message(self, message: str) -> Optional["np.ndarray"]:
+        """메시지 임베딩 (실패하면 None, 캐시 없이 진행)"""
+        try:
+            return self._normalize(await self.embed(message))
+        except Exception as error:
+            self.stats["errors"] += 1
+            logger.warning("의미 기반 캐시 임베딩 오류", extra={"error": str(error)})
+            return None
+
+    def lookup(self, vector: "np.ndarray", model: str, temperature: float) -> Optional[Tuple[Dict[str, Any], float]]:
+        """
+        가장 비슷한 캐시 응답 조회
+
+        Returns:
+            (저장된 응답, 유사도) 또는 None (유사도가 threshold 미만이거나 범위가 비었으면)
+        """
+        index = self._scopes.get(self._scope(model, temperature))
+        if index is None or index.size == 0 or len(vector) != index.vectors.shape[1]:
+            self._record("miss")
+            return None
+
+        row, similarity = index.search(vector)
+        if similarity < self.threshold:
+            self._record("miss")
+            return None
+
+        entry_id = index.entry_ids[row]
+        self._entries.move_to_end(entry_id)
+        self._record("hit")
+        return self._entries[entry_id].response, similarity
+
+    def store(self, vector: "np.ndarray", model: str, temperature: float, response: Dict[str, Any]) -> None:
+        """응답 저장 후 LRU 정리 (범위의 기존 벡터와 차원이 다르면 저장하지 않음)"""
+        scope = self._scope(model, temperature)
+        index = self._scopes.get(scope)
+        if index is None:
+            index = self._scopes[scope] = _ScopeIndex(len(vector))
+        elif index.vectors.shape[1] != len(vector):
+            return
+
+        entry_id = self._next_id
+        self._next_id += 1
+        self._entries[entry_id] = SemanticCacheEntry(scope, index.add(entry_id, vector), response)
+        self.stats["stored"] += 1
+
+        while len(self._entries) > self.max_entries:
+            self._evict(next(iter(self._entries)))
+
+    def _evict(self, entry_id: int) -> None:
+        """항목 삭제 (범위 행렬에서 옮겨진 항목의 행 번호도 갱신)"""
+        entry = self._entries.pop(entry_id)
+        index = self._scopes[entry.scope]
+        moved = index.remove(entry.row)
+        if moved is not None:
+            self._entries[moved].row = entry.row
+        if index.size == 0:
+            del self._scopes[entry.scope]
+        self.stats["evicted"] += 1
+
+    def _record(self, event: str) -> None:
+        self.stats["hits" if event == "hit" else "misses"] += 1
+        metrics.inc("semantic_cache_events_total", event=event)
+
+    def snapshot(self) -> Dict[str, Any]:
+        """현재 상태 (통계 조회용)"""
+        return {
+            **self.stats,
+            "enabled": self.enabled,
+            "entries": len(self._entries),
+            "scopes": len(self._scopes),
+            "bytes": sum(index.vectors.nbytes for index in self._scopes.values())
+        }
+
+    def save(self) -> None:
+        """스냅숏 파일로 저장 (오래 사용되지 않은 항목부터, 임시 파일에 쓴 뒤 교체)"""
+        if not self.enabled or not self.snapshot_path or not self._entries:
+            return
+        entries = list(self._entries.values())
+        dimensions = {self._scopes[entry.scope].vectors.shape[1] for entry in entries}
+        if len(dimensions) != 1:
+            logger.warning("차원이 다른 벡터가 섞여 의미 기반 캐시 스냅숏을 저장하지 않았습니다.")
+            return
+
+        vectors = np.stack([self._scopes[entry.scope].vectors[entry.row] for entry in entries])
+        meta = json.dumps(
+            [{"model": entry.scope[0], "temperature": entry.scope[1], "response": entry.response} for entry in entries],
+            ensure_ascii=False
+        )
+        directory = os.path.dirname(self.snapshot_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        temp_path = f"{self.snapshot_path}.{os.getpid()}.tmp"
+        try:
+            with open(temp_path, "wb") as file:
+                np.savez(file, vectors=vectors, meta=np.array(meta))
+            os.replace(temp_path, self.snapshot_path)
+            logger.info("의미 기반 캐시 스냅숏 저장", extra={"entries": len(entries)})
+        except OSError as error:
+            logger.warning("의미 기반 캐시 스냅숏 저장 오류", extra={"error": str(error)})
+
+    def load(self) -> None:
+        """스냅숏 파일 불러오기 (없거나 읽을 수 없으면 빈 캐시로 시작)"""
+        if not self.enabled or not self.snapshot_path or not os.path.exists(self.snapshot_path):
+            return
+        try:
+            with np.load(self.snapshot_path, allow_pickle=False) as data:
+                vectors = data["vectors"]
+                meta = json.loads(str(data["meta"]))
+        except (OSError, ValueError, KeyError) as error:
+            logger.warning("의미 기반 캐시 스냅숏 읽기 오류", extra={"error": str(error)})
+            return
+
+        for vector, item in zip(vectors, meta):
+            self.store(vector, item["model"], item["temperature"], item["response"])
+        logger.info("의미 기반 캐시 스냅숏 불러옴", extra={"entries": len(self._entries)})
+
+
+async def _embed_for_cache(message: str) -> Any:
+    """메시지 임베딩 (임베딩 디스크 캐시를 거침)"""
+    result = await embedding_pipeline.embed(
+        [message], settings.SEMANTIC_CACHE_EMBEDDING_MODEL, settings.SEMANTIC_CACHE_DIMENSIONS or None
+    )
+    return np.frombuffer(result["vectors"][0], dtype="<f4")
+
+
+# 워커 프로세스별 의미 기반 응답 캐시 (/api/chat/message)
+semantic_cache = SemanticCache(
+    embed=_embed_for_cache,
+    threshold=settings.SEMANTIC_CACHE_THRESHOLD,
+    max_entries=settings.SEMANTIC_CACHE_MAX_ENTRIES,
+    snapshot_path=settings.SEMANTIC_CACHE_SNAPSHOT_PATH,
+    enabled=settings.SEMANTIC_CACHE_ENABLED
+)
@@ -0,0 +1,70 @@
+import asyncio
+import hashlib
+import json
+from typing import Any, Awaitable, Callable, Dict
+
+from services.metrics import metrics
+
+
+def make_key(*parts: Any) -> str:
+    """
+    요청 내용으로 합치기용 키 생성
+
+    Args:
+        parts: 키를 구성할 값들 (JSON 직렬화 가능해야 함)
+
+    Returns:
+        SHA-256 해시 문자열
+    """
+    payload = json.dumps(parts, ensure_ascii=False, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class SingleFlight:
+    """
+    동일한 요청 합치기 (single-flight)
+
+    같은 키로 동시에 들어온 호출은 하나의 업스트림 호출을 기다리고 결과를 공유합니다.
+    먼저 온 호출자가 취소되더라도 업스트림 호출은 계속 진행되어 나머지 호출자에게 전달됩니다.
+    """
+
+    def __init__(self):
+        self._in_flight: Dict[str, asyncio.Task] = {}
+        self.stats = {"calls": 0, "executions": 0, "coalesced": 0}
+
+    async def do(self, key: str, fn: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        키가 같은 진행 중 호출이 있으면 그 결과를, 없으면 새로 호출한 결과를 반환
+
+        Args:
+            key: 요청을 식별하는 키
+            fn: 업스트림을 호출하는 코루틴 함수
+
+        Returns:
+            업스트림 호출 결과
+        """
+        self.stats["calls"] += 1
+        task = self._in_flight.get(key)
+        if task is None:
+            self.stats["executions"] += 1
+            metrics.inc("single_flight_calls_total", result="executed")
+            task = asyncio.create_task(fn())
+            self._in_flight[key] = task
+            task.add_done_callback(lambda t: self._finish(key, t))
+        else:
+            self.stats["coalesced"] += 1
+            metrics.inc("single_flight_calls_total", result="coalesced")
+
+        return await asyncio.shield(task)
+
+    def _finish(self, key: str, task: asyncio.Task) -> None:
+        """완료된 호출 정리 (호출자가 모두 취소된 경우에도 예외를 회수)"""
+        if self._in_flight.get(key) is task:
+            del self._in_flight[key]
+        if not task.cancelled():
+            task.exception()
+
+    @property
+    def in_flight(self) -> int:
+        """현재 진행 중인 업스트림 호출 수"""
+        return len(self._in_flight)
@@ -0,0 +1,112 @@
+import json
+import os
+import re
+import sqlite3
+import threading
+import time
+from typing import Any, Dict, List, Optional
+
+# 테이블 이름은 SQL에 그대로 들어가므로 식별자 형식만 허용
+_TABLE_NAME = re.compile(r"^[A-Za-z_][A-Za-z0-9_]*$")
+
+
+class SQLiteCache:
+    """
+    키-값 캐시 (SQLite 파일 기반, 값은 JSON)
+
+    같은 호스트의 모든 워커 프로세스가 하나의 파일을 공유하며 재시작 후에도 유지됩니다.
+    항목 수가 max_entries를 넘으면 가장 오래 사용되지 않은 항목부터 삭제합니다 (LRU).
+    만료 판단은 호출하는 쪽에서 조회 결과의 age로 합니다.
+    모든 메서드는 파일 잠금을 기다릴 수 있으므로 이벤트 루프에서는 asyncio.to_thread로 호출하세요.
+    """
+
+    # 조회할 때 마지막 사용 시각을 다시 기록하는 최소 간격 (초, 적중할 때마다 쓰지 않도록)
+    ACCESS_TOUCH_INTERVAL = 60
+    # 한 번의 IN (...) 조회에 넣을 최대 키 수 (SQLite 변수 개수 제한 안쪽)
+    QUERY_CHUNK_SIZE = 500
+
+    def __init__(self, path: str, table: str, max_entries: int):
+        if not _TABLE_NAME.match(table):
+            raise ValueError(f"사용할 수 없는 테이블 이름입니다: {table}")
+        self.path = path
+        self.table = table
+        self.max_entries = max_entries
+        self._conn: Optional[sqlite3.Connection] = None
+        self._conn_pid: Optional[int] = None
+        self._lock = threading.Lock()
+
+    def _create_table(self, conn: sqlite3.Connection) -> None:
+        """캐시 테이블 생성 (하위 클래스에서 열을 더할 수 있음)"""
+        conn.execute(
+            f"""CREATE TABLE IF NOT EXISTS {self.table} (
+                key TEXT PRIMARY KEY,
+                value TEXT NOT NULL,
+                created_at REAL NOT NULL,
+                last_access REAL NOT NULL
+            )"""
+        )
+
+    def _connection(self) -> sqlite3.Connection:
+        """프로세스별 SQLite 연결 (fork 이후에는 새로 연결)"""
+        if self._conn is None or self._conn_pid != os.getpid():
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            conn = sqlite3.connect(self.path, timeout=5.0, isolation_level=None, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._create_table(conn)
+            conn.execute(
+                f"CREATE INDEX IF NOT EXISTS idx_{self.table}_last_access ON {self.table} (last_access)"
+            )
+            self._conn = conn
+            self._conn_pid = os.getpid()
+        return self._conn
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """
+        캐시 항목 조회
+
+        Returns:
+            {"value": ..., "age": 경과 시간(초)} 또는 None
+        """
+        return self.get_many([key]).get(key)
+
+    def get_many(self, keys: List[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        여러 캐시 항목을 한 번에 조회 (QUERY_CHUNK_SIZE개씩 IN (...) 조회)
+
+        Returns:
+            {키: {"value": ..., "age": 경과 시간(초)}} (없는 키는 빠짐)
+        """
+        now = time.time()
+        rows = []
+        with self._lock:
+            conn = self._connection()
+            for start in range(0, len(keys), self.QUERY_CHUNK_SIZE):
+                chunk = keys[start:start + self.QUERY_CHUNK_SIZE]
+                placeholders = ",".join("?" * len(chunk))
+                rows.extend(conn.execute(
+                    f"SELECT key, value, created_at FROM {self.table} WHERE key IN ({placeholders})", chunk
+                ).fetchall())
+                # LRU 순서에는 분 단위 정확도면 충분하므로 마지막 기록 후 ACCESS_TOUCH_INTERVAL이 지났을 때만 씀
+                conn.execute(
+                    f"UPDATE {self.table} SET last_access = ? WHERE key IN ({placeholders}) AND last_access <= ?",
+                    (now, *chunk, now - self.ACCESS_TOUCH_INTERVAL)
+                )
+        return {key: {"value": json.loads(value), "age": now - created_at} for key, value, created_at in rows}
+
+    def set(self, key: str, value: Any) -> None:
+        """캐시 항목 저장 후 LRU 정리"""
+        now = time.time()
+        with self._lock:
+            conn = self._connection()
+            conn.execute(
+                f"INSERT OR REPLACE INTO {self.table} (key, value, created_at, last_access) VALUES (?, ?, ?, ?)",
+                (key, json.dumps(value, ensure_ascii=False), now, now)
+            )
+            conn.execute(
+                f"DELETE FROM {self.table} WHERE key IN ("
+                f"SELECT key FROM {self.table} ORDER BY last_access DESC LIMIT -1 OFFSET ?)",
+                (self.max_entries,)
+            )
@@ -0,0 +1,166 @@
+import atexit
+import json
+import logging
+import queue
+import random
+import sys
+from contextvars import ContextVar
+from datetime import datetime, timezone
+from logging.handlers import QueueHandler, QueueListener
+from typing import Any, Dict, Optional
+
+# 요청별 상관관계 ID (RequestContextMiddleware가 설정, 요청에서 만든 태스크에도 이어짐)
+request_id_var: ContextVar[Optional[str]] = ContextVar("request_id", default=None)
+
+# LogRecord 기본 속성 (이외의 속성은 extra로 넘긴 구조화 필드로 출력)
+_RESERVED_ATTRS = set(logging.LogRecord("", 0, "", 0, "", (), None).__dict__) | {
+    "message", "asctime", "requestId", "sample", "sampleRate", "taskName"
+}
+
+_listener: Optional[QueueListener] = None
+
+
+def truncate(text: Optional[str], limit: int) -> Optional[str]:
+    """
+    로그에 남길 본문 자르기 (limit이 0이면 본문을 남기지 않음)
+
+    Returns:
+        잘린 문자열 (잘렸으면 원래 길이 표시)
+    """
+    if text is None:
+        return None
+    if limit <= 0:
+        return f"({len(text)}자)"
+    if len(text) <= limit:
+        return text
+    return f"{text[:limit]}…(+{len(text) - limit}자)"
+
+
+def _extra_fields(record: logging.LogRecord) -> Dict[str, Any]:
+    """extra로 넘긴 구조화 필드"""
+    return {key: value for key, value in record.__dict__.items() if key not in _RESERVED_ATTRS}
+
+
+class JsonFormatter(logging.Formatter):
+    """한 줄에 JSON 객체 하나 (시각, 레벨, 로거, 메시지, 요청 ID, 구조화 필드, 예외)"""
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "timestamp": datetime.fromtimestamp(record.created, timezone.utc).isoformat(timespec="milliseconds"),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+            "pid": record.process
+        }
+        if getattr(record, "requestId", None):
+            entry["requestId"] = record.requestId
+        if getattr(record, "sampleRate", None):
+            entry["sampleRate"] = record.sampleRate
+        entry.update(_extra_fields(record))
+        if record.exc_info:
+            entry["exception"] = self.formatException(record.exc_info)
+        return json.dumps(entry, ensure_ascii=False, default=str)
+
+
+class TextFormatter(logging.Formatter):
+    """개발용 한 줄 텍스트 (구조화 필드는 key=value로 덧붙임)"""
+
+    def format(self, record: logging.LogRecord) -> str:
+        line = f"{self.formatTime(record)} {record.levelname:<7} {record.name}: {record.getMessage()}"
+        fields = _extra_fields(record)
+        if getattr(record, "requestId", None):
+            fields = {"requestId": record.requestId, **fields}
+        if fields:
+            line += " " + " ".join(f"{key}={value}" for key, value in fields.items())
+        if record.exc_info:
+            line += "\n" + self.formatException(record.exc_info)
+        return line
+
+
+class SamplingFilter(logging.Filter):
+    """
+    extra={"sample": True}로 표시한 대량 로그를 sample_rate 비율만 남김
+
+    WARNING 이상은 항상 남기고, 남긴 로그에는 sampleRate를 붙여 전체 건수를 추정할 수 있게 합니다.
+    """
+
+    def __init__(self, sample_rate: float):
+        super().__init__()
+        self.sample_rate = sample_rate
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if not getattr(record, "sample", False) or record.levelno >= logging.WARNING or self.sample_rate >= 1:
+            return True
+        if random.random() >= self.sample_rate:
+            return False
+        record.sampleRate = self.sample_rate
+        return True
+
+
+class _ContextQueueHandler(QueueHandler):
+    """
+    로그 레코드를 큐에 넣기만 하는 핸들러 (포맷과 출력은 리스너 스레드에서)
+
+    요청 ID만 호출한 쪽 컨텍스트에서 붙이고, 큐가 가득 차면 기다리지 않고 버린 뒤 개수를 셉니다.
+    """
+
+    def __init__(self, log_queue: queue.Queue):
+        super().__init__(log_queue)
+        self.dropped = 0
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record.requestId = request_id_var.get()
+        return record
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+
+def setup_logging(level: str, log_format: str, sample_rate: float, queue_size: int) -> None:
+    """
+    루트 로거를 큐 기반 구조화 로깅으로 설정 (프로세스마다 한 번, 다시 호출하면 무시)
+
+    요청 처리 중에는 레코드를 큐에 넣기만 하고, 백그라운드 스레드가 포맷해 stdout에 씁니다.
+
+    Args:
+        level: 로그 레벨 (DEBUG, INFO, WARNING, ERROR)
+        log_format: json 또는 text
+        sample_rate: 대량 로그(sample 표시)를 남길 비율 (0~1)
+        queue_size: 큐 크기 (가득 차면 새 로그를 버림)
+    """
+    global _listener
+    if _listener is not None:
+        return
+
+    output = logging.StreamHandler(sys.stdout)
+    output.setFormatter(JsonFormatter() if log_format == "json" else TextFormatter())
+
+    handler = _ContextQueueHandler(queue.Queue(maxsize=queue_size))
+    handler.addFilter(SamplingFilter(sample_rate))
+
+    root = logging.getLogger()
+    root.handlers = [handler]
+    root.setLevel(level.upper())
+
+    _listener = QueueListener(handler.queue, output, respect_handler_level=True)
+    _listener.start()
+    atexit.register(shutdown_logging)
+
+
+def shutdown_logging() -> None:
+    """남은 로그를 모두 쓰고 리스너 스레드 종료"""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
+
+
+def dropped_count() -> int:
+    """큐가 가득 차서 버린 로그 수"""
+    for handler in logging.getLogger().handlers:
+        if isinstance(handler, _ContextQueueHandler):
+            return handler.dropped
+    return 0
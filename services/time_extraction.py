@@ -0,0 +1,166 @@
+import re
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional
+
+# 시간대 키워드
+_PERIODS = "저녁|아침|낮|밤|새벽|오전|오후"
+
+# 시간 표현 하나를 찾는 단일 정규식 (범위, 24시간 형식, N시 M분, 대략 표현을 한 번에 처리)
+# 첫 글자가 숫자(\d)이므로 정규식 엔진이 숫자가 아닌 글자를 C 수준에서 건너뛰고,
+# 시(時) 단위가 없는 날짜, 개수와 "3시간" 같은 기간은 정규식 안에서 바로 걸러냅니다.
+# 앞쪽 시간대 키워드(저녁, 오후 등)는 선택된 매치에 대해서만 따로 확인합니다.
+# 예: 저녁 8~10시, 오후 3시~5시, 밤 11시~새벽 1시, 18:00, 20:00-22:00, 6시경, 18시, 7시 30분
+# 시(0~24): 앞뒤가 숫자가 아닌 1~2자리 (두 자리는 0x, 1x, 20~24만)
+_HOUR = r"\d(?<!\d\d)(?:(?<=[01])\d|(?<=2)[0-4])?(?!\d)"
+_MINUTE = r"[0-5]\d(?!\d)"
+# "시" 단위 ("시간"은 기간이므로 제외)
+_UNIT = r"\s*시(?!간)"
+_TIME_PATTERN = re.compile(
+    rf"""
+    (?P<h1>{_HOUR})(?::(?P<m1>{_MINUTE}))?
+    (?(m1)|(?={_UNIT}|\s*[~\-–]\s*(?:(?:{_PERIODS})\s*)?{_HOUR}(?::{_MINUTE}|{_UNIT})))
+    (?:{_UNIT}(?:\s*(?P<n1>[0-5]?\d)\s*분)?)?
+    (?:
+        \s*[~\-–]\s*
+        (?:(?P<period2>{_PERIODS})\s*)?
+        (?P<h2>{_HOUR})(?::(?P<m2>{_MINUTE})|{_UNIT}(?:\s*(?P<n2>[0-5]?\d)\s*분)?)(?(m2)(?:\s*시)?)
+    )?
+    (?P<approx>\s*(?:경|쯤|무렵|전후))?
+    """,
+    re.VERBOSE
+)
+
+# 매치 바로 앞에서 확인할 시간대 키워드 (1~2글자)
+_PERIOD_SET = frozenset(_PERIODS.split("|"))
+
+# 추천 문장의 시작 위치를 찾기 위한 마지막 문장 구분 (탐욕적 매치가 끝에서부터 거꾸로 찾음)
+_LAST_SENTENCE_END = re.compile(r".*[.!?。\n]", re.DOTALL)
+
+
+@dataclass(slots=True)
+class TimeExtraction:
+    """
+    텍스트에서 추출한 시간 정보
+
+    start_minutes, end_minutes는 자정부터의 분 (0~1440)이며,
+    자정을 넘는 범위(예: 밤 11시~새벽 1시)는 end_minutes가 start_minutes보다 작습니다.
+    """
+    display: str
+    start_minutes: int
+    end_minutes: Optional[int]
+    period: Optional[str]
+    approximate: bool
+    start: int
+    end: int
+
+    def to_dict(self) -> Dict[str, Any]:
+        """API 응답용 딕셔너리 (문자열 위치 제외)"""
+        return {
+            "display": self.display,
+            "startMinutes": self.start_minutes,
+            "endMinutes": self.end_minutes,
+            "period": self.period,
+            "approximate": self.approximate
+        }
+
+
+def _to_minutes(hour: int, minute: int, period: Optional[str], is_end: bool) -> int:
+    """시간대 키워드를 반영해 자정부터의 분으로 변환"""
+    if period is None:
+        return hour * 60 + minute
+    if period in ("오후", "저녁"):
+        if hour < 12:
+            hour += 12
+        elif period == "저녁":
+            hour = 24
+    elif period == "밤":
+        if 6 <= hour < 12:
+            hour += 12
+        elif hour == 12:
+            hour = 24
+    elif period == "낮":
+        if hour <= 6:
+            hour += 12
+    elif period in ("오전", "아침", "새벽"):
+        if hour == 12:
+            hour = 12 if is_end and period != "새벽" else 0
+    return hour * 60 + minute
+
+
+def _build(match: "re.Match[str]") -> TimeExtraction:
+    """검증된 정규식 매치를 TimeExtraction으로 변환"""
+    text = match.string
+    start, end = match.span()
+
+    # 바로 앞(공백 제외) 1~2글자가 시간대 키워드인지 확인
+    window_start = max(0, start - 6)
+    before = text[window_start:start].rstrip()
+    period = before[-2:]
+    if period not in _PERIOD_SET:
+        period = period[-1:]
+        if period not in _PERIOD_SET:
+            period = None
+    if period:
+        start = window_start + len(before) - len(period)
+
+    # 그룹 순서는 _TIME_PATTERN의 이름 붙은 그룹 순서와 같음 (이름으로 하나씩 꺼내는 것보다 빠름)
+    h1, m1, n1, period2, h2, m2, n2, approx = match.groups()
+    start_minutes = _to_minutes(int(h1), int(m1 or n1 or 0), period, False)
+    end_minutes = None
+    if h2 is not None:
+        end_minutes = _to_minutes(int(h2), int(m2 or n2 or 0), period2 or period, True)
+
+    # 공백이 한 칸씩이면 그대로 사용 (대부분의 응답)
+    display = text[start:end]
+    if "  " in display or "\n" in display or "\t" in display:
+        display = " ".join(display.split())
+    if period and not display.startswith(f"{period} "):
+        display = f"{period} {display[len(period):]}"
+
+    return TimeExtraction(display, start_minutes, end_minutes, period, approx is not None, start, end)
+
+
+def extract_all(text: str) -> List[TimeExtraction]:
+    """
+    텍스트의 모든 시간 표현을 등장 순서대로 추출 (한 번의 스캔)
+
+    Args:
+        text: 시간이 포함된 텍스트
+
+    Returns:
+        추출된 시간 정보 목록
+    """
+    if not text or ("시" not in text and ":" not in text):
+        return []
+    return [_build(match) for match in _TIME_PATTERN.finditer(text)]
+
+
+def extract_time(text: str) -> Optional[TimeExtraction]:
+    """
+    텍스트에서 추천 시간 하나를 추출
+
+    추천 문장에서 "추천"에 가장 가까운 시간 표현을 우선합니다.
+    (예: "보통 저녁 8~10시가 피크지만 ... 따라서 오후 3~5시 업로드를 추천드립니다." → 오후 3~5시)
+
+    Args:
+        text: 시간이 포함된 텍스트
+
+    Returns:
+        추출된 시간 정보 또는 None
+    """
+    if not text or ("시" not in text and ":" not in text):
+        return None
+
+    # "추천"이 들어간 마지막 문장 안쪽만 찾고, 그런 문장이 없으면 첫 매치에서 멈춤 (전체를 훑지 않음)
+    match = None
+    recommend_at = text.rfind("추천")
+    if recommend_at >= 0:
+        boundary = _LAST_SENTENCE_END.match(text, 0, recommend_at)
+        for match in _TIME_PATTERN.finditer(text, boundary.end() if boundary else 0, recommend_at):
+            pass
+    if match is None:
+        match = _TIME_PATTERN.search(text)
+        if match is None:
+            return None
+    return _build(match)
+
@@ -0,0 +1,47 @@
+from typing import Dict, List
+
+try:
+    import tiktoken
+except ImportError:  # 설치되어 있지 않으면 문자 수 기반 추정을 사용
+    tiktoken = None
+
+# 메시지 하나에 붙는 역할, 구분자 토큰 (OpenAI 채팅 형식 기준)
+MESSAGE_OVERHEAD_TOKENS = 4
+# 응답 시작 토큰
+REPLY_OVERHEAD_TOKENS = 3
+
+
+def _encoding():
+    """tiktoken 인코딩 (없으면 None)"""
+    if tiktoken is None:
+        return None
+    try:
+        return tiktoken.get_encoding("o200k_base")
+    except Exception:
+        return None
+
+
+_ENCODING = _encoding()
+
+
+def count_tokens(text: str) -> int:
+    """
+    텍스트의 토큰 수 계산
+
+    tiktoken이 있으면 정확히 세고, 없으면 영문 4자당 1토큰, 한글 등 그 외 문자 1자당 1토큰으로
+    넉넉하게 추정합니다 (예산을 넘지 않도록 실제보다 크게 잡음).
+    """
+    if _ENCODING is not None:
+        return len(_ENCODING.encode(text))
+    ascii_chars = len(text.encode("ascii", "ignore"))
+    return (ascii_chars + 3) // 4 + (len(text) - ascii_chars)
+
+
+def message_tokens(message: Dict[str, str]) -> int:
+    """메시지 하나의 토큰 수 (역할, 구분자 포함)"""
+    return count_tokens(message["content"]) + MESSAGE_OVERHEAD_TOKENS
+
+
+def messages_tokens(messages: List[Dict[str, str]]) -> int:
+    """요청 전체의 프롬프트 토큰 수"""
+    return sum(message_tokens(message) for message in messages) + REPLY_OVERHEAD_TOKENS
@@ -1,57 +1,53 @@
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Callable, Awaitable, Tuple, AsyncIterator
 from datetime import date, datetime, timedelta
+from pydantic import BaseModel, Field, ValidationError
+import asyncio
+import json
+import logging
+import pytz
 import sys
 import os
-import re
 
 # 현재 디렉토리를 Python 경로에 추가
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from services.openai_service import OpenAIService
+from services.openai_service import openai_service
+from services.recommendation_cache import recommendation_cache
+from services.time_extraction import extract_time
+from services.holiday_calendar import holiday_calendar
 from config import settings
 
+logger = logging.getLogger(__name__)
+
+# 구조화된 주간 추천 응답 검증 모델
+class StructuredTimeWindow(BaseModel):
+    start: str = Field(..., pattern=r'^([01]\d|2[0-4]):[0-5]\d$')
+    end: str = Field(..., pattern=r'^([01]\d|2[0-4]):[0-5]\d$')
+
+class StructuredDailyRecommendation(BaseModel):
+    date: date
+    recommendation: str = Field(..., min_length=1)
+    timeWindow: StructuredTimeWindow
+
+class StructuredWeeklyAnalysis(BaseModel):
+    recommendation: str = Field(..., min_length=1)
+    timeWindow: StructuredTimeWindow
+
 class UploadTimeService:
+    # 프롬프트나 캐시되는 결과 형식을 바꾸면 올려서 이전 캐시 항목을 무효화
+    PROMPT_VERSION = "3"
+    # 주간 추천 생성 방식
+    WEEKLY_MODES = ("per_day", "structured", "fast")
+
     def __init__(self):
         """업로드 시간 서비스 초기화"""
-        self.openai_service = OpenAIService()
+        # 워커 전역 OpenAI 서비스 (연결 풀 공유)
+        self.openai_service = openai_service
+        self.cache = recommendation_cache if settings.RECOMMENDATION_CACHE_ENABLED else None
+        self.timezone = pytz.timezone(settings.TIMEZONE)
         
-        # 한국의 명절 및 특별한 날짜 정보
-        self.korean_holidays = {
-            # 2024년 명절
-            '2024-01-01': {'name': '신정', 'type': 'holiday'},
-            '2024-02-09': {'name': '설날 연휴', 'type': 'holiday'},
-            '2024-02-10': {'name': '설날', 'type': 'holiday'},
-            '2024-02-11': {'name': '설날 연휴', 'type': 'holiday'},
-            '2024-02-12': {'name': '설날 연휴', 'type': 'holiday'},
-            '2024-04-10': {'name': '국회의원선거', 'type': 'election'},
-            '2024-05-05': {'name': '어린이날', 'type': 'holiday'},
-            '2024-05-15': {'name': '부처님오신날', 'type': 'holiday'},
-            '2024-06-06': {'name': '현충일', 'type': 'holiday'},
-            '2024-08-15': {'name': '광복절', 'type': 'holiday'},
-            '2024-09-16': {'name': '추석 연휴', 'type': 'holiday'},
-            '2024-09-17': {'name': '추석', 'type': 'holiday'},
-            '2024-09-18': {'name': '추석 연휴', 'type': 'holiday'},
-            '2024-10-03': {'name': '개천절', 'type': 'holiday'},
-            '2024-10-09': {'name': '한글날', 'type': 'holiday'},
-            '2024-12-25': {'name': '크리스마스', 'type': 'holiday'},
-            
-            # 2025년 명절
-            '2025-01-01': {'name': '신정', 'type': 'holiday'},
-            '2025-01-28': {'name': '설날 연휴', 'type': 'holiday'},
-            '2025-01-29': {'name': '설날', 'type': 'holiday'},
-            '2025-01-30': {'name': '설날 연휴', 'type': 'holiday'},
-            '2025-05-05': {'name': '어린이날', 'type': 'holiday'},
-            '2025-05-15': {'name': '부처님오신날', 'type': 'holiday'},
-            '2025-06-06': {'name': '현충일', 'type': 'holiday'},
-            '2025-08-15': {'name': '광복절', 'type': 'holiday'},
-            '2025-10-05': {'name': '추석 연휴', 'type': 'holiday'},
-            '2025-10-06': {'name': '추석', 'type': 'holiday'},
-            '2025-10-07': {'name': '추석 연휴', 'type': 'holiday'},
-            '2025-10-08': {'name': '추석 연휴', 'type': 'holiday'},
-            '2025-10-03': {'name': '개천절', 'type': 'holiday'},
-            '2025-10-09': {'name': '한글날', 'type': 'holiday'},
-            '2025-12-25': {'name': '크리스마스', 'type': 'holiday'}
-        }
+        # 한국 공휴일 및 특별한 날 달력 (프로세스 전역, 연도별로 처음 조회할 때 계산)
+        self.holiday_calendar = holiday_calendar
         
         # 콘텐츠 타입별 피크 시간 정보
         self.content_type_peak_times = {
@@ -87,47 +83,27 @@ class UploadTimeService:
         Returns:
             추출된 시간 문자열 또는 None
         """
-        try:
-            # 다양한 시간 패턴 매칭 (우선순위 순서)
-            time_patterns = [
-                # 저녁 8~10시, 아침 9시, 낮 12시 (시간대 키워드가 있는 경우)
-                (r'(저녁|아침|낮|밤|새벽)\s*(\d{1,2})시~(\d{1,2})시', lambda m: f"{m[0]} {m[1]}시~{m[2]}시"),
-                (r'(저녁|아침|낮|밤|새벽)\s*(\d{1,2})-(\d{1,2})시', lambda m: f"{m[0]} {m[1]}-{m[2]}시"),
-                (r'(저녁|아침|낮|밤|새벽)\s*(\d{1,2})시', lambda m: f"{m[0]} {m[1]}시"),
-                (r'(저녁|아침|낮|밤|새벽)\s*(\d{1,2})시경', lambda m: f"{m[0]} {m[1]}시경"),
-                
-                # 오후 6시, 오전 9시 (이미 오전/오후가 있는 경우)
-                (r'(오전|오후)\s*(\d{1,2})시', lambda m: f"{m[0]} {m[1]}시"),
-                (r'(오전|오후)\s*(\d{1,2})-(\d{1,2})시', lambda m: f"{m[0]} {m[1]}-{m[2]}시"),
-                (r'(오전|오후)\s*(\d{1,2})시경', lambda m: f"{m[0]} {m[1]}시경"),
-                (r'(오전|오후)\s*(\d{1,2})시~(\d{1,2})시', lambda m: f"{m[0]} {m[1]}시~{m[2]}시"),
-                
-                # 18:00, 20:30 (24시간 형식)
-                (r'(\d{1,2}):(\d{2})', lambda m: f"{m[0]}:{m[1]}"),
-                # 18시, 20시 (24시간 형식)
-                (r'(\d{1,2})시', lambda m: f"{m[0]}시"),
-                # 6-8시, 18-20시 (시간 범위)
-                (r'(\d{1,2})-(\d{1,2})시', lambda m: f"{m[0]}-{m[1]}시"),
-                # 6시경, 18시경
-                (r'(\d{1,2})시경', lambda m: f"{m[0]}시경"),
-                # 6시~8시, 18시~20시
-                (r'(\d{1,2})시~(\d{1,2})시', lambda m: f"{m[0]}시~{m[1]}시")
-            ]
-            
-            for pattern, formatter in time_patterns:
-                matches = re.findall(pattern, text)
-                if matches:
-                    match = matches[0]
-                    if isinstance(match, tuple):
-                        return formatter(match)
-                    else:
-                        return formatter([match])
-            
-            return None
-            
-        except Exception as error:
-            print(f"시간 추출 오류: {error}")
-            return None
+        extraction = extract_time(text)
+        return extraction.display if extraction else None
+
+    def _time_fields(self, text: Optional[str]) -> Dict[str, Any]:
+        """
+        추천 문장에서 추출한 시간 (표시용 문자열과 구조화된 정보)
+        """
+        extraction = extract_time(text) if text else None
+        return {
+            "extractedTime": extraction.display if extraction else None,
+            "extractedTimeDetail": extraction.to_dict() if extraction else None
+        }
+
+    def today(self) -> date:
+        """
+        추천 기준 시간대(기본값: KST)의 오늘 날짜
+
+        Returns:
+            오늘 날짜
+        """
+        return datetime.now(self.timezone).date()
 
     def is_holiday(self, target_date: date) -> Optional[Dict[str, str]]:
         """
@@ -139,8 +115,17 @@ class UploadTimeService:
         Returns:
             명절 정보 또는 None
         """
-        date_str = target_date.isoformat()
-        return self.korean_holidays.get(date_str)
+        return self.holiday_calendar.is_holiday(target_date)
+
+    def _special_day_names(self, week_dates: List[date], holidays_only: bool = False) -> List[str]:
+        """
+        기간 안의 공휴일과 특별한 날 이름 (한 번의 기간 조회, 중복 제거)
+        """
+        special_days = self.holiday_calendar.between(week_dates[0], week_dates[-1])
+        return list(dict.fromkeys(
+            info["name"] for _, info in special_days
+            if not holidays_only or info["type"] == "holiday"
+        ))
 
     def get_day_type(self, target_date: date) -> str:
         """
@@ -159,20 +144,215 @@ class UploadTimeService:
         day_of_week = target_date.weekday()
         return 'weekend' if day_of_week >= 5 else 'weekday'
 
+    def _cache_key(self, kind: str, target_date: date, content_type: str) -> str:
+        """추천 캐시 키 생성 (날짜, 콘텐츠 타입, 모델, 프롬프트 버전)"""
+        model = self.openai_service.model_router.resolve_model("upload_time", settings.DEFAULT_MODEL)
+        return f"{kind}:v{self.PROMPT_VERSION}:{model}:{content_type}:{target_date.isoformat()}"
+
+    async def _cached(self, key: str, compute: Callable[[], Awaitable[Dict[str, Any]]]) -> Dict[str, Any]:
+        """캐시가 켜져 있으면 캐시를 거쳐 값을 조회"""
+        if self.cache is None:
+            return await compute()
+        return await self.cache.get_or_compute(key, compute)
+
+    def can_answer_without_llm(self, kind: str, start_date: date, content_type: str, mode: Optional[str]) -> bool:
+        """
+        업스트림 호출 없이 규칙이나 캐시만으로 바로 응답할 수 있는 요청인지 확인 (부하 차단 예외 판단용)
+
+        Args:
+            kind: daily 또는 weekly
+            start_date: 추천 날짜 (주간은 시작 날짜)
+            content_type: 콘텐츠 타입
+            mode: 요청한 추천 방식 (없으면 기본값)
+        """
+        if mode == "fast":
+            return True
+        if self.cache is None:
+            return False
+        # 요청 수락 전에 이벤트 루프에서 호출되므로 캐시 파일을 읽지 않는 메모리 확인만 사용
+        if kind == "daily":
+            return self.cache.is_fresh_enough(self._cache_key("daily", start_date, content_type))
+        if (mode or settings.WEEKLY_RECOMMEND_MODE) == "structured":
+            return self.cache.is_fresh_enough(self._cache_key("weekly_structured", start_date, content_type))
+        keys = [self._cache_key("daily", start_date + timedelta(days=i), content_type) for i in range(7)]
+        keys.append(self._cache_key("weekly", start_date, content_type))
+        return all(self.cache.is_fresh_enough(key) for key in keys)
+
+    def format_time_window(self, window: str) -> str:
+        """
+        "20:00-22:00" 형식의 시간대를 "저녁 8~10시" 같은 한국어 표현으로 변환
+
+        Args:
+            window: 24시간 형식의 시간대 문자열
+
+        Returns:
+            한국어 시간대 표현
+        """
+        start_hour, end_hour = (int(part.split(":")[0]) for part in window.split("-"))
+
+        def period_of(hour: int) -> str:
+            hour %= 24
+            if hour < 6:
+                return '새벽'
+            if hour < 12:
+                return '오전'
+            if hour < 14:
+                return '낮'
+            if hour < 18:
+                return '오후'
+            if hour < 22:
+                return '저녁'
+            return '밤'
+
+        def hour12(hour: int) -> int:
+            hour %= 12
+            return hour or 12
+
+        # 끝 시각의 시간대는 구간의 마지막 한 시간으로 판단 (22:00 끝 → 저녁)
+        start_period = period_of(start_hour)
+        end_period = period_of(end_hour - 1)
+        if start_period == end_period:
+            return f"{start_period} {hour12(start_hour)}~{hour12(end_hour)}시"
+        return f"{start_period} {hour12(start_hour)}시~{end_period} {hour12(end_hour)}시"
+
+    def _with_particle(self, word: str, batchim_particle: str, plain_particle: str) -> str:
+        """
+        받침 유무에 맞는 조사를 붙임 (예: 설날이라 / 설날 연휴라)
+        """
+        last = word[-1] if word else ''
+        has_batchim = '가' <= last <= '힣' and (ord(last) - ord('가')) % 28 != 0
+        return word + (batchim_particle if has_batchim else plain_particle)
+
+    def _time_window(self, window: str) -> Dict[str, str]:
+        """
+        "20:00-22:00" 형식의 시간대를 {"start": "20:00", "end": "22:00"}로 변환
+        """
+        start, end = window.split("-")
+        return {"start": start, "end": end}
+
+    def build_rule_based_recommendation(self, target_date: date, content_type: str = 'general') -> Dict[str, Any]:
+        """
+        피크 시간 표와 명절 정보만으로 업로드 시간 추천 생성 (네트워크 호출 없음)
+
+        Args:
+            target_date: 분석할 날짜
+            content_type: 콘텐츠 타입
+
+        Returns:
+            업로드 시간 추천 정보 (LLM 추천과 같은 형식)
+        """
+        day_type = self.get_day_type(target_date)
+        holiday = self.is_holiday(target_date)
+        peak_times = self.content_type_peak_times.get(content_type, self.content_type_peak_times['general'])
+        weekday_peak = self.format_time_window(peak_times['weekday']['peak'])
+        peak = self.format_time_window(peak_times[day_type]['peak'])
+        secondary = self.format_time_window(peak_times[day_type]['secondary'])
+        day_label = f"{target_date.month}월 {target_date.day}일"
+
+        if day_type == 'holiday':
+            text = (
+                f"보통 한국은 {weekday_peak}가 피크지만, {day_label}은 {self._with_particle(holiday['name'], '이라', '라')} "
+                f"{peak}에도 조회수가 급증할 것으로 보입니다. 따라서 {peak} 업로드를 추천드립니다."
+            )
+        elif day_type == 'weekend':
+            text = (
+                f"주말인 {day_label}은 {peak}에 시청이 몰리고 {secondary}가 보조 피크입니다. "
+                f"따라서 {peak} 업로드를 추천드립니다."
+            )
+        else:
+            text = (
+                f"평일인 {day_label}은 {peak}가 피크이고 {secondary}에도 조회수가 꾸준합니다. "
+                f"따라서 {peak} 업로드를 추천드립니다."
+            )
+
+        return {
+            "text": text,
+            **self._time_fields(text),
+            "timeWindow": self._time_window(peak_times[day_type]['peak']),
+            "source": "rules"
+        }
+
+    def build_rule_based_weekly_analysis(self, week_dates: List[date], content_type: str = 'general') -> Dict[str, Any]:
+        """
+        피크 시간 표와 명절 정보만으로 주간 분석 생성 (네트워크 호출 없음)
+
+        Args:
+            week_dates: 주간에 포함된 날짜 목록
+            content_type: 콘텐츠 타입
+
+        Returns:
+            주간 분석 정보 (LLM 분석과 같은 형식)
+        """
+        peak_times = self.content_type_peak_times.get(content_type, self.content_type_peak_times['general'])
+        holidays = self._special_day_names(week_dates, holidays_only=True)
+
+        if holidays:
+            window = peak_times['holiday']['peak']
+            peak = self.format_time_window(window)
+            names = ', '.join(holidays)
+            text = (
+                f"이번 주는 {self._with_particle(names, '이', '가')} 포함되어 있어 평소보다 오후 시간대 시청이 증가할 것으로 예상됩니다. "
+                f"따라서 {peak} 업로드를 추천드립니다."
+            )
+        else:
+            window = peak_times['weekday']['peak']
+            peak = self.format_time_window(window)
+            weekend_peak = self.format_time_window(peak_times['weekend']['peak'])
+            text = (
+                f"이번 주는 특별한 휴일이 없어 평일에는 {peak}, 주말에는 {weekend_peak} 시청이 가장 많을 것으로 예상됩니다. "
+                f"따라서 평일 {peak} 업로드를 추천드립니다."
+            )
+
+        return {
+            "text": text,
+            **self._time_fields(text),
+            "timeWindow": self._time_window(window),
+            "source": "rules"
+        }
+
     async def get_upload_time_recommendation(
         self, 
         target_date: date, 
-        content_type: str = 'general'
+        content_type: str = 'general',
+        mode: str = 'llm'
     ) -> Dict[str, Any]:
         """
-        특정 날짜의 업로드 시간 추천
+        특정 날짜의 업로드 시간 추천 (추천 캐시 사용)
+
+        LLM 호출이 실패하고 캐시도 없으면 UPLOAD_TIME_RULE_FALLBACK 설정에 따라
+        규칙 기반 추천으로 대체합니다.
         
         Args:
             target_date: 분석할 날짜
             content_type: 콘텐츠 타입
+            mode: 추천 방식 (llm: ChatGPT 문장, fast: 규칙 기반 즉시 응답)
             
         Returns:
-            업로드 시간 추천 정보 (텍스트와 추출된 시간 포함)
+            업로드 시간 추천 정보 (텍스트와 추출된 시간, 생성 방식(source) 포함)
+        """
+        if mode == 'fast':
+            return self.build_rule_based_recommendation(target_date, content_type)
+
+        try:
+            recommendation = await self._cached(
+                self._cache_key("daily", target_date, content_type),
+                lambda: self._generate_upload_time_recommendation(target_date, content_type)
+            )
+        except Exception as error:
+            if not settings.UPLOAD_TIME_RULE_FALLBACK:
+                raise
+            logger.warning("LLM 추천 실패, 규칙 기반 추천으로 대체", extra={"date": target_date.isoformat(), "error": str(error)})
+            return self.build_rule_based_recommendation(target_date, content_type)
+
+        return {**recommendation, "source": "llm"}
+
+    async def _generate_upload_time_recommendation(
+        self,
+        target_date: date,
+        content_type: str = 'general'
+    ) -> Dict[str, Any]:
+        """
+        ChatGPT로 특정 날짜의 업로드 시간 추천 생성
         """
         try:
             day_type = self.get_day_type(target_date)
@@ -201,105 +381,434 @@ class UploadTimeService:
 
 반드시 한 줄로만 답변해주세요."""
 
-            print("🤖 ChatGPT에 업로드 시간 추천 요청 중...")
+            logger.debug("ChatGPT에 업로드 시간 추천 요청", extra={"date": target_date.isoformat()})
 
             # ChatGPT API 호출
             response = await self.openai_service.chat_with_gpt(
                 message=prompt,
                 model=settings.DEFAULT_MODEL,
+                route="upload_time",
                 max_tokens=settings.MAX_TOKENS,
-                temperature=settings.TEMPERATURE
+                temperature=settings.TEMPERATURE,
+                coalesce=True
             )
 
             # 응답에서 시간 추출
             recommendation_text = response["message"]
-            extracted_time = self.extract_time_from_text(recommendation_text)
             
             return {
                 "text": recommendation_text,
-                "extractedTime": extracted_time
+                **self._time_fields(recommendation_text)
             }
 
         except Exception as error:
-            print(f"업로드 시간 추천 서비스 오류: {error}")
+            logger.error("업로드 시간 추천 서비스 오류", extra={"error": str(error)})
             raise error
 
+    def build_weekly_prompt(self, week_dates: List[date], content_type: str) -> str:
+        """
+        주간 분석 프롬프트 작성 (날짜와 명절 정보만 사용)
+
+        Args:
+            week_dates: 주간에 포함된 날짜 목록
+            content_type: 콘텐츠 타입
+
+        Returns:
+            주간 분석 프롬프트
+        """
+        holidays = self._special_day_names(week_dates)
+
+        return f"""분석 기간: {', '.join(d.isoformat() for d in week_dates)}
+콘텐츠 타입: {content_type}
+{('포함된 명절/특별한 날: ' + ', '.join(holidays)) if holidays else ''}
+
+이 주간의 동영상 업로드 전략을 한 줄로 간결하게 추천해주세요.
+
+예시 형식: "이번 주는 명절 연휴가 포함되어 있어 평소보다 오후 시간대 시청이 증가할 것으로 예상됩니다. 따라서 오후 3~5시 업로드를 추천드립니다."
+
+반드시 한 줄로만 답변해주세요."""
+
+    def _day_skeleton(self, current_date: date) -> Dict[str, Any]:
+        """
+        LLM 호출 없이 정해지는 하루치 항목 (추천은 비어 있음)
+        """
+        return {
+            "date": current_date.isoformat(),
+            "dayName": current_date.strftime('%Y년 %m월 %d일 %A'),
+            "dayType": self.get_day_type(current_date),
+            "holiday": self.is_holiday(current_date),
+            "recommendation": None,
+            "extractedTime": None,
+            "extractedTimeDetail": None
+        }
+
+    def _weekly_summary(self, days: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        주간 요약 개수 계산
+        """
+        return {
+            "totalDays": len(days),
+            "holidayDays": len([r for r in days if r["holiday"]]),
+            "weekendDays": len([r for r in days if r["dayType"] == "weekend"]),
+            "weekdayDays": len([r for r in days if r["dayType"] == "weekday"])
+        }
+
+    async def _get_daily_entry(
+        self,
+        current_date: date,
+        content_type: str,
+        semaphore: asyncio.Semaphore
+    ) -> Dict[str, Any]:
+        """
+        주간 추천의 하루치 항목 생성 (실패 시 오류를 담아 반환)
+        """
+        entry = self._day_skeleton(current_date)
+
+        try:
+            async with semaphore:
+                recommendation_data = await self.get_upload_time_recommendation(current_date, content_type)
+            entry["recommendation"] = recommendation_data["text"]
+            entry["extractedTime"] = recommendation_data["extractedTime"]
+            entry["extractedTimeDetail"] = recommendation_data["extractedTimeDetail"]
+            if "timeWindow" in recommendation_data:
+                entry["timeWindow"] = recommendation_data["timeWindow"]
+            entry["source"] = recommendation_data["source"]
+        except Exception as error:
+            logger.warning("일별 업로드 시간 추천 실패", extra={"date": entry["date"], "error": str(error)})
+            entry["error"] = str(error)
+
+        return entry
+
+    async def _generate_weekly_analysis(self, week_dates: List[date], content_type: str) -> Dict[str, Any]:
+        """
+        ChatGPT로 주간 전체 분석 생성
+        """
+        weekly_analysis = await self.openai_service.chat_with_gpt(
+            message=self.build_weekly_prompt(week_dates, content_type),
+            model=settings.DEFAULT_MODEL,
+            route="upload_time",
+            max_tokens=settings.MAX_TOKENS,
+            temperature=settings.TEMPERATURE,
+            coalesce=True
+        )
+
+        # 주간 분석에서도 시간 추출
+        weekly_analysis_text = weekly_analysis["message"]
+        return {
+            "text": weekly_analysis_text,
+            **self._time_fields(weekly_analysis_text)
+        }
+
+    async def _get_weekly_analysis(self, week_dates: List[date], content_type: str) -> Dict[str, Any]:
+        """
+        주간 전체 분석 조회 (추천 캐시 사용, 실패 시 오류를 담아 반환)
+        """
+        try:
+            analysis = await self._cached(
+                self._cache_key("weekly", week_dates[0], content_type),
+                lambda: self._generate_weekly_analysis(week_dates, content_type)
+            )
+            return {**analysis, "source": "llm"}
+        except Exception as error:
+            if settings.UPLOAD_TIME_RULE_FALLBACK:
+                logger.warning("주간 분석 실패, 규칙 기반 분석으로 대체", extra={"error": str(error)})
+                return self.build_rule_based_weekly_analysis(week_dates, content_type)
+            logger.warning("주간 분석 생성 실패", extra={"error": str(error)})
+            return {"text": None, **self._time_fields(None), "error": str(error)}
+
+    def build_structured_weekly_prompt(self, week_dates: List[date], content_type: str) -> str:
+        """
+        한 번의 호출로 7일 추천과 주간 분석을 JSON으로 받기 위한 프롬프트 작성
+
+        Args:
+            week_dates: 주간에 포함된 날짜 목록
+            content_type: 콘텐츠 타입
+
+        Returns:
+            구조화된 주간 추천 프롬프트
+        """
+        special_days = dict(self.holiday_calendar.between(week_dates[0], week_dates[-1]))
+        day_lines = []
+        for d in week_dates:
+            special_day = special_days.get(d)
+            day_lines.append(
+                f"- {d.isoformat()} ({d.strftime('%A')}, {self.get_day_type(d)})"
+                + (f" 특별한 날: {special_day['name']}" if special_day else "")
+            )
+
+        return f"""콘텐츠 타입: {content_type}
+분석 기간:
+{chr(10).join(day_lines)}
+
+한국의 일반적인 동영상 시청 패턴:
+- 평일: 저녁 8-10시가 피크, 점심 12-2시가 보조 피크
+- 주말: 오후 2-4시가 피크, 저녁 8-10시가 보조 피크
+- 명절/휴일: 오후 3-5시가 피크, 저녁 8-10시가 보조 피크
+
+위 정보를 바탕으로 각 날짜의 업로드 시간 추천과 주간 전체 업로드 전략을 작성해주세요.
+추천 문장은 각각 한 줄로 간결하게 작성하고, 추천 시간대는 24시간 형식(HH:MM)으로 적어주세요.
+
+반드시 다음 형식의 JSON 객체로만 답변해주세요:
+{{
+  "days": [
+    {{"date": "YYYY-MM-DD", "recommendation": "한 줄 추천", "timeWindow": {{"start": "HH:MM", "end": "HH:MM"}}}}
+  ],
+  "weekly": {{"recommendation": "한 줄 주간 전략", "timeWindow": {{"start": "HH:MM", "end": "HH:MM"}}}}
+}}"""
+
+    def parse_structured_week(self, text: str, week_dates: List[date]) -> Dict[str, Any]:
+        """
+        구조화된 주간 추천 응답을 검증
+
+        스키마에 맞지 않거나 분석 기간에 없는 날짜는 제외합니다.
+
+        Args:
+            text: 모델이 반환한 JSON 문자열
+            week_dates: 주간에 포함된 날짜 목록
+
+        Returns:
+            {"days": {날짜: 추천}, "weekly": 주간 분석 또는 None}
+
+        Raises:
+            ValueError: JSON이 아니거나 검증을 통과한 항목이 하나도 없는 경우
+        """
+        payload = json.loads(text)
+        if not isinstance(payload, dict):
+            raise ValueError("구조화된 주간 추천 응답이 JSON 객체가 아닙니다.")
+
+        wanted = {d.isoformat() for d in week_dates}
+        days: Dict[str, Dict[str, Any]] = {}
+        raw_days = payload.get("days")
+        for raw_day in raw_days if isinstance(raw_days, list) else []:
+            try:
+                day = StructuredDailyRecommendation.model_validate(raw_day)
+            except ValidationError:
+                continue
+            date_str = day.date.isoformat()
+            if date_str in wanted and date_str not in days:
+                days[date_str] = {
+                    "text": day.recommendation,
+                    **self._time_fields(day.recommendation),
+                    "timeWindow": day.timeWindow.model_dump()
+                }
+
+        weekly = None
+        try:
+            analysis = StructuredWeeklyAnalysis.model_validate(payload.get("weekly"))
+            weekly = {
+                "text": analysis.recommendation,
+                **self._time_fields(analysis.recommendation),
+                "timeWindow": analysis.timeWindow.model_dump()
+            }
+        except ValidationError:
+            pass
+
+        if not days and weekly is None:
+            raise ValueError("구조화된 주간 추천 응답에 유효한 항목이 없습니다.")
+
+        return {"days": days, "weekly": weekly}
+
+    async def _generate_structured_week(self, week_dates: List[date], content_type: str) -> Dict[str, Any]:
+        """
+        ChatGPT 한 번 호출로 구조화된 주간 추천 생성
+        """
+        logger.debug("ChatGPT에 구조화된 주간 업로드 시간 추천 요청", extra={"weekStart": week_dates[0].isoformat()})
+
+        response = await self.openai_service.chat_with_gpt(
+            message=self.build_structured_weekly_prompt(week_dates, content_type),
+            model=settings.DEFAULT_MODEL,
+            route="upload_time",
+            max_tokens=settings.MAX_TOKENS,
+            temperature=settings.TEMPERATURE,
+            coalesce=True,
+            response_format={"type": "json_object"}
+        )
+        return self.parse_structured_week(response["message"], week_dates)
+
+    async def _get_structured_week(
+        self,
+        week_dates: List[date],
+        content_type: str,
+        semaphore: asyncio.Semaphore
+    ) -> Tuple[List[Dict[str, Any]], Dict[str, Any]]:
+        """
+        구조화된 주간 추천 조회 (추천 캐시 사용)
+
+        검증에 실패한 날짜와 주간 분석만 기존 일별 경로로 다시 요청합니다.
+
+        Returns:
+            (일별 추천 목록, 주간 분석)
+        """
+        try:
+            structured = await self._cached(
+                self._cache_key("weekly_structured", week_dates[0], content_type),
+                lambda: self._generate_structured_week(week_dates, content_type)
+            )
+        except Exception as error:
+            logger.warning("구조화된 주간 추천 실패, 일별 경로로 대체", extra={"error": str(error)})
+            structured = {"days": {}, "weekly": None}
+
+        async def structured_entry(current_date: date) -> Dict[str, Any]:
+            day = structured["days"][current_date.isoformat()]
+            return {
+                "date": current_date.isoformat(),
+                "dayName": current_date.strftime('%Y년 %m월 %d일 %A'),
+                "dayType": self.get_day_type(current_date),
+                "holiday": self.is_holiday(current_date),
+                "recommendation": day["text"],
+                "extractedTime": day["extractedTime"],
+                "extractedTimeDetail": day["extractedTimeDetail"],
+                "timeWindow": day["timeWindow"],
+                "source": "structured"
+            }
+
+        async def fallback_entry(current_date: date) -> Dict[str, Any]:
+            entry = await self._get_daily_entry(current_date, content_type, semaphore)
+            entry.setdefault("timeWindow", None)
+            return entry
+
+        async def weekly_analysis() -> Dict[str, Any]:
+            if structured["weekly"] is not None:
+                return {**structured["weekly"], "source": "structured"}
+            return {"timeWindow": None, **await self._get_weekly_analysis(week_dates, content_type)}
+
+        *daily, weekly = await asyncio.gather(
+            *[
+                structured_entry(d) if d.isoformat() in structured["days"] else fallback_entry(d)
+                for d in week_dates
+            ],
+            weekly_analysis()
+        )
+        return daily, weekly
+
     async def get_weekly_upload_recommendation(
         self, 
         start_date: date, 
-        content_type: str = 'general'
+        content_type: str = 'general',
+        mode: Optional[str] = None
     ) -> Dict[str, Any]:
         """
         주간 업로드 시간 추천
+
+        - per_day: 7일간의 일별 추천과 주간 분석을 동시에 요청합니다.
+        - structured: 한 번의 호출로 JSON 형식의 주간 추천을 받고,
+          검증에 실패한 날짜만 일별 경로로 다시 요청합니다.
+        - fast: 네트워크 호출 없이 규칙 기반으로 즉시 생성합니다.
+        일부 날짜가 실패하면 해당 날짜에 "error"를 담은 부분 결과를 반환합니다.
         
         Args:
             start_date: 주간 시작 날짜
             content_type: 콘텐츠 타입
+            mode: 생성 방식 (per_day, structured, fast / 기본값: WEEKLY_RECOMMEND_MODE)
             
         Returns:
             주간 추천 정보
         """
         try:
-            weekly_recommendations = []
-            
-            # 7일간의 추천 생성
-            for i in range(7):
-                current_date = start_date + timedelta(days=i)
-                recommendation_data = await self.get_upload_time_recommendation(current_date, content_type)
-                weekly_recommendations.append({
-                    "date": current_date.isoformat(),
-                    "dayName": current_date.strftime('%Y년 %m월 %d일 %A'),
-                    "dayType": self.get_day_type(current_date),
-                    "holiday": self.is_holiday(current_date),
-                    "recommendation": recommendation_data["text"],
-                    "extractedTime": recommendation_data["extractedTime"]
-                })
-
-            # 주간 전체 분석을 위한 프롬프트
-            week_dates = [r["date"] for r in weekly_recommendations]
-            holidays = [r["holiday"]["name"] for r in weekly_recommendations if r["holiday"]]
-            
-            weekly_prompt = f"""분석 기간: {', '.join(week_dates)}
-콘텐츠 타입: {content_type}
-{('포함된 명절/특별한 날: ' + ', '.join(holidays)) if holidays else ''}
+            mode = mode or settings.WEEKLY_RECOMMEND_MODE
+            if mode not in self.WEEKLY_MODES:
+                raise ValueError(f"지원하지 않는 주간 추천 방식입니다: {mode}")
 
-이 주간의 동영상 업로드 전략을 한 줄로 간결하게 추천해주세요.
+            week_dates = [start_date + timedelta(days=i) for i in range(7)]
+            semaphore = asyncio.Semaphore(settings.WEEKLY_RECOMMEND_CONCURRENCY)
 
-예시 형식: "이번 주는 명절 연휴가 포함되어 있어 평소보다 오후 시간대 시청이 증가할 것으로 예상됩니다. 따라서 오후 3~5시 업로드를 추천드립니다."
-
-반드시 한 줄로만 답변해주세요."""
-
-            weekly_analysis = await self.openai_service.chat_with_gpt(
-                message=weekly_prompt,
-                model=settings.DEFAULT_MODEL,
-                max_tokens=settings.MAX_TOKENS,
-                temperature=settings.TEMPERATURE
-            )
+            if mode == "fast":
+                weekly_recommendations = []
+                for d in week_dates:
+                    recommendation = self.build_rule_based_recommendation(d, content_type)
+                    weekly_recommendations.append({
+                        **self._day_skeleton(d),
+                        "recommendation": recommendation["text"],
+                        "extractedTime": recommendation["extractedTime"],
+                        "extractedTimeDetail": recommendation["extractedTimeDetail"],
+                        "timeWindow": recommendation["timeWindow"],
+                        "source": recommendation["source"]
+                    })
+                weekly_analysis = self.build_rule_based_weekly_analysis(week_dates, content_type)
+            elif mode == "structured":
+                weekly_recommendations, weekly_analysis = await self._get_structured_week(
+                    week_dates, content_type, semaphore
+                )
+            else:
+                # 7일간의 추천과 주간 분석을 함께 생성
+                *weekly_recommendations, weekly_analysis = await asyncio.gather(
+                    *[self._get_daily_entry(d, content_type, semaphore) for d in week_dates],
+                    self._get_weekly_analysis(week_dates, content_type)
+                )
 
-            # 주간 분석에서도 시간 추출
-            weekly_analysis_text = weekly_analysis["message"]
-            weekly_extracted_time = self.extract_time_from_text(weekly_analysis_text)
+            failed_days = [r["date"] for r in weekly_recommendations if "error" in r]
+            if len(failed_days) == len(week_dates) and "error" in weekly_analysis:
+                raise RuntimeError(f"주간 추천 생성에 모두 실패했습니다: {weekly_analysis['error']}")
 
             return {
                 "weekStart": start_date.isoformat(),
                 "contentType": content_type,
+                "mode": mode,
                 "dailyRecommendations": weekly_recommendations,
-                "weeklyAnalysis": {
-                    "text": weekly_analysis_text,
-                    "extractedTime": weekly_extracted_time
-                },
+                "weeklyAnalysis": weekly_analysis,
                 "summary": {
-                    "totalDays": 7,
-                    "holidayDays": len(holidays),
-                    "weekendDays": len([r for r in weekly_recommendations if r["dayType"] == "weekend"]),
-                    "weekdayDays": len([r for r in weekly_recommendations if r["dayType"] == "weekday"])
+                    **self._weekly_summary(weekly_recommendations),
+                    "failedDays": failed_days
                 }
             }
 
         except Exception as error:
-            print(f"주간 업로드 시간 추천 서비스 오류: {error}")
+            logger.error("주간 업로드 시간 추천 서비스 오류", extra={"error": str(error)})
             raise error
 
+    async def stream_weekly_upload_recommendation(
+        self,
+        start_date: date,
+        content_type: str = 'general'
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        주간 업로드 시간 추천을 완료되는 순서대로 전달
+
+        LLM 호출 없이 정해지는 날짜, 요일 타입, 명절, 요약 개수를 먼저 보내고,
+        일별 추천은 끝나는 대로, 주간 분석은 마지막에 보냅니다 (per_day 방식).
+
+        Args:
+            start_date: 주간 시작 날짜
+            content_type: 콘텐츠 타입
+
+        Yields:
+            skeleton, day, weekly, done 이벤트 딕셔너리
+        """
+        week_dates = [start_date + timedelta(days=i) for i in range(7)]
+        skeleton = [self._day_skeleton(d) for d in week_dates]
+
+        yield {
+            "type": "skeleton",
+            "weekStart": start_date.isoformat(),
+            "contentType": content_type,
+            "days": skeleton,
+            "summary": self._weekly_summary(skeleton)
+        }
+
+        semaphore = asyncio.Semaphore(settings.WEEKLY_RECOMMEND_CONCURRENCY)
+
+        async def indexed_day(index: int, current_date: date):
+            return index, await self._get_daily_entry(current_date, content_type, semaphore)
+
+        day_tasks = [asyncio.create_task(indexed_day(i, d)) for i, d in enumerate(week_dates)]
+        weekly_task = asyncio.create_task(self._get_weekly_analysis(week_dates, content_type))
+
+        try:
+            failed_days = []
+            for next_day in asyncio.as_completed(day_tasks):
+                index, entry = await next_day
+                if "error" in entry:
+                    failed_days.append(entry["date"])
+                yield {"type": "day", "index": index, "day": entry}
+
+            yield {"type": "weekly", "weeklyAnalysis": await weekly_task}
+            yield {"type": "done", "failedDays": sorted(failed_days)}
+
+        finally:
+            # 클라이언트 연결이 끊기면 남은 호출 취소
+            for task in [*day_tasks, weekly_task]:
+                task.cancel()
+
     async def get_upload_time_stats(self, content_type: str = 'general') -> Dict[str, Any]:
         """
         업로드 시간 통계 조회
@@ -332,5 +841,5 @@ class UploadTimeService:
             return stats
 
         except Exception as error:
-            print(f"업로드 시간 통계 조회 오류: {error}")
+            logger.error("업로드 시간 통계 조회 오류", extra={"error": str(error)})
             raise error